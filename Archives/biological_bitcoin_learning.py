@@ -36,6 +36,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _response_voltages(response) -> np.ndarray:
+    """Tensions d'une réponse: tableau structuré (record_electrode), liste de dicts ou signal brut"""
+    if isinstance(response, np.ndarray) and response.dtype.names:
+        return response['voltage']
+    if len(response) > 0 and isinstance(response[0], dict):
+        return np.array([r.get('voltage', 0) for r in response])
+    return np.asarray(response)
+
 class NeuralLearningPhase(Enum):
     """Phases d'apprentissage des neurones biologiques"""
     INITIALIZATION = "initialization"
@@ -152,7 +160,7 @@ class BiologicalBitcoinLearner:
             # Mesurer la réponse
             response = await self.mea.record_electrode(electrode_id, duration=50.0)
             
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 # Analyser l'activité spontanée
                 baseline_rate = self._calculate_firing_rate(response)
                 self.neurons[electrode_id].firing_rate = baseline_rate
@@ -299,10 +307,10 @@ class BiologicalBitcoinLearner:
         # Enregistrer les réponses post-stimulation
         for electrode_id in range(60):
             response = await self.mea.record_electrode(electrode_id, duration=200.0)  # 200ms post-stimulation
-            responses[electrode_id] = response if response else []
+            responses[electrode_id] = response if response is not None else []
             
             # Mettre à jour le buffer circulaire d'activité
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 activity_level = self._calculate_activity_strength(response)
                 self.neural_activity_buffer[electrode_id][self.buffer_index % 10000] = activity_level
         
@@ -332,7 +340,7 @@ class BiologicalBitcoinLearner:
         target_signature = self._hash_to_signature(target_hash)
         
         for electrode_id, response in responses.items():
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 # Calculer la signature de la réponse neuronale
                 neural_signature = self._response_to_signature(response)
                 
@@ -371,7 +379,7 @@ class BiologicalBitcoinLearner:
             return np.zeros(16, dtype=np.float32)
         
         # Extraire les caractéristiques temporelles et spectrales
-        signal = np.array([r['voltage'] if isinstance(r, dict) else r for r in response[:1000]])
+        signal = _response_voltages(response[:1000])
         
         # Calculer les bins de distribution d'amplitude
         hist, _ = np.histogram(signal, bins=16, range=(-100, 100))
@@ -391,7 +399,7 @@ class BiologicalBitcoinLearner:
         neuron_activities = {}
         
         for electrode_id, response in responses.items():
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 activity = self._calculate_activity_strength(response)
                 neuron_activities[electrode_id] = activity
                 
@@ -430,14 +438,11 @@ class BiologicalBitcoinLearner:
 
     def _calculate_activity_strength(self, response: List) -> float:
         """Calcule la force d'activité d'une réponse neuronale"""
-        if not response or len(response) == 0:
+        if response is None or len(response) == 0:
             return 0.0
         
         # Convertir en signal numérique
-        if isinstance(response[0], dict):
-            voltages = [r.get('voltage', 0) for r in response]
-        else:
-            voltages = list(response)
+        voltages = _response_voltages(response)
         
         if len(voltages) == 0:
             return 0.0
@@ -540,7 +545,7 @@ class BiologicalBitcoinLearner:
         neural_features = []
         
         for electrode_id in range(60):
-            if electrode_id in responses and responses[electrode_id]:
+            if electrode_id in responses and len(responses[electrode_id]) > 0:
                 # Calculer les features temporelles
                 response = responses[electrode_id]
                 features = self._extract_prediction_features(response)
@@ -568,14 +573,11 @@ class BiologicalBitcoinLearner:
 
     def _extract_prediction_features(self, response: List) -> np.ndarray:
         """Extrait des features prédictives d'une réponse neuronale"""
-        if not response or len(response) == 0:
+        if response is None or len(response) == 0:
             return np.zeros(8)
         
         # Convertir la réponse en signal
-        if isinstance(response[0], dict):
-            signal = np.array([r.get('voltage', 0) for r in response[:1000]])
-        else:
-            signal = np.array(response[:1000])
+        signal = _response_voltages(response[:1000])
         
         if len(signal) == 0:
             return np.zeros(8)
@@ -633,7 +635,7 @@ class BiologicalBitcoinLearner:
         reward_signal = (accuracy - 0.5) * 2  # Centrer sur [-1, 1]
         
         for electrode_id, response in responses.items():
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 neuron = self.neurons[electrode_id]
                 
                 # Calculer la contribution du neurone à la prédiction
@@ -763,7 +765,7 @@ class BiologicalBitcoinLearner:
         confidence_scores = []
         
         for electrode_id, response in responses.items():
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 # Générer une prédiction de nonce basée sur la réponse
                 predicted_nonce = self._neural_nonce_prediction({electrode_id: response})
                 
@@ -804,7 +806,7 @@ class BiologicalBitcoinLearner:
         responses = await self._apply_learning_stimulation(stimulation_pattern)
         
         for electrode_id, response in responses.items():
-            if response and len(response) > 0:
+            if response is not None and len(response) > 0:
                 neuron = self.neurons[electrode_id]
                 
                 # Calculer la contribution à la réussite
@@ -830,7 +832,7 @@ class BiologicalBitcoinLearner:
                 if i != j:
                     # Renforcement basé sur l'activité conjointe lors de la réussite
                     if (i in responses and j in responses and 
-                        responses[i] and responses[j]):
+                        len(responses[i]) > 0 and len(responses[j]) > 0):
                         
                         activity_i = self._calculate_activity_strength(responses[i])
                         activity_j = self._calculate_activity_strength(responses[j])
@@ -926,13 +928,16 @@ class BiologicalBitcoinLearner:
 
     def _detect_spikes(self, response: List) -> List[Dict]:
         """Détecte les spikes dans une réponse neuronale"""
-        if not response or len(response) < 3:
+        if response is None or len(response) < 3:
             return []
         
         spikes = []
         
         # Convertir en array numpy
-        if isinstance(response[0], dict):
+        if isinstance(response, np.ndarray) and response.dtype.names:
+            voltages = response['voltage']
+            timestamps = response['timestamp']
+        elif isinstance(response[0], dict):
             voltages = np.array([r.get('voltage', 0) for r in response])
             timestamps = np.array([r.get('timestamp', i) for i, r in enumerate(response)])
         else:
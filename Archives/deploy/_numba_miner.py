@@ -0,0 +1,157 @@
+"""
+BioMining Platform - Balayage de nonce double SHA-256 compilé par Numba
+========================================================================
+
+Repli de simple_biomining_demo.py quand le noyau cffi `_sha256d_batch`
+n'est pas compilé. SHA-256 est réimplémenté en arithmétique uint32 et la
+plage de nonces est répartie entre les cœurs (numba.prange).
+
+Comme le noyau C, find_nonce ne compare que le mot de poids fort du hash
+(ordre d'affichage) à target_hi: la comparaison complète à la cible reste
+à la charge de l'appelant.
+"""
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+# Nonces par tranche parallèle: borne le travail perdu après une trouvaille
+CHUNK = 1 << 18
+
+_K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+], dtype=np.uint32)
+
+_IV = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+], dtype=np.uint32)
+
+
+# Numba promeut l'arithmétique entière scalaire en 64 bits: chaque résultat
+# susceptible de déborder est ramené explicitement à uint32.
+
+@njit(inline='always')
+def _rotr(x, n):
+    return np.uint32((x >> n) | (x << (32 - n)))
+
+
+@njit(inline='always')
+def _bswap(x):
+    return np.uint32(((x & 0xff) << 24) | ((x & 0xff00) << 8) | ((x >> 8) & 0xff00) | (x >> 24))
+
+
+@njit(cache=True)
+def _compress(state, w):
+    """Compression SHA-256: state += rondes(state, w[0:16]); w est étendu en place (64 mots)"""
+    for i in range(16, 64):
+        s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> np.uint32(3))
+        s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> np.uint32(10))
+        w[i] = w[i - 16] + s0 + w[i - 7] + s1
+
+    a, b, c, d = state[0], state[1], state[2], state[3]
+    e, f, g, h = state[4], state[5], state[6], state[7]
+    for i in range(64):
+        t1 = np.uint32(h + (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25))
+                       + ((e & f) ^ (~e & g)) + _K[i] + w[i])
+        t2 = np.uint32((_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c)))
+        h = g
+        g = f
+        f = e
+        e = np.uint32(d + t1)
+        d = c
+        c = b
+        b = a
+        a = np.uint32(t1 + t2)
+
+    state[0] += a
+    state[1] += b
+    state[2] += c
+    state[3] += d
+    state[4] += e
+    state[5] += f
+    state[6] += g
+    state[7] += h
+
+
+@njit(cache=True)
+def _hash_hi(midstate, tail, nonce, w, s):
+    """Mot de poids fort (ordre d'affichage) du double SHA-256 du header"""
+    # Premier SHA-256: second bloc (queue du préfixe + nonce + padding 640 bits)
+    s[:] = midstate
+    w[0] = tail[0]
+    w[1] = tail[1]
+    w[2] = tail[2]
+    w[3] = _bswap(nonce)
+    w[4] = np.uint32(0x80000000)
+    w[5:15] = 0
+    w[15] = np.uint32(640)
+    _compress(s, w)
+
+    # Second SHA-256: digest de 32 octets + padding 256 bits
+    w[:8] = s
+    w[8] = np.uint32(0x80000000)
+    w[9:15] = 0
+    w[15] = np.uint32(256)
+    s[:] = _IV
+    _compress(s, w)
+    return _bswap(s[7])
+
+
+@njit(cache=True, parallel=True)
+def _find_nonce(midstate, tail, start, count, target_hi, n_slices):
+    hits = np.full(n_slices, -1, dtype=np.int64)
+    per_slice = (count + n_slices - 1) // n_slices
+    for k in prange(n_slices):
+        w = np.empty(64, dtype=np.uint32)
+        s = np.empty(8, dtype=np.uint32)
+        lo = start + k * per_slice
+        hi = min(lo + per_slice, start + count)
+        for nonce in range(lo, hi):
+            if _hash_hi(midstate, tail, np.uint32(nonce), w, s) <= target_hi:
+                hits[k] = nonce
+                break
+    # Première tranche gagnante = plus petit nonce (les tranches sont ordonnées)
+    for k in range(n_slices):
+        if hits[k] >= 0:
+            return hits[k]
+    return -1
+
+
+@njit(cache=True)
+def _midstate(prefix):
+    w = np.empty(64, dtype=np.uint32)
+    for i in range(16):
+        w[i] = ((np.uint32(prefix[4 * i]) << np.uint32(24)) | (np.uint32(prefix[4 * i + 1]) << np.uint32(16))
+                | (np.uint32(prefix[4 * i + 2]) << np.uint32(8)) | np.uint32(prefix[4 * i + 3]))
+    s = _IV.copy()
+    _compress(s, w)
+    return s
+
+
+def prepare(header_prefix):
+    """(midstate, queue en mots big-endian) du préfixe de 76 octets"""
+    prefix = np.frombuffer(header_prefix, dtype=np.uint8)
+    tail = np.frombuffer(header_prefix[64:76], dtype='>u4').astype(np.uint32)
+    return _midstate(prefix), tail
+
+
+def find_nonce(job, start_nonce, count, target_hi):
+    """Premier nonce de [start_nonce, start_nonce + count) avec hash_hi <= target_hi, sinon None"""
+    midstate, tail = job
+    n_slices = numba.get_num_threads()
+    end = start_nonce + count
+    nonce = start_nonce
+    while nonce < end:
+        n = min(CHUNK * n_slices, end - nonce)
+        found = _find_nonce(midstate, tail, nonce, n, np.uint32(target_hi), n_slices)
+        if found >= 0:
+            return int(found)
+        nonce += n
+    return None
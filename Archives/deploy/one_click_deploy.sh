@@ -34,13 +34,36 @@ fi
 
 echo "✅ Python 3 available"
 
-# Installer Flask si nécessaire
-if ! python3 -c "import flask" >/dev/null 2>&1; then
-    echo "📦 Installing Flask..."
-    pip3 install flask --user
+# Installer Flask + NumPy si nécessaire
+if ! python3 -c "import flask, numpy" >/dev/null 2>&1; then
+    echo "📦 Installing Flask + NumPy..."
+    pip3 install flask numpy --user
 fi
 
-echo "✅ Flask available"
+echo "✅ Flask + NumPy available"
+
+# Encodeur JSON rapide (optionnel, repli json stdlib sinon)
+python3 -c "import orjson" >/dev/null 2>&1 || pip3 install orjson --user >/dev/null 2>&1 || true
+
+# Noyau SHA-256 natif (optionnel, repli hashlib sinon)
+if python3 -c "import cffi" >/dev/null 2>&1; then
+    (cd deploy && python3 sha256d_build.py >/dev/null 2>&1) \
+        && echo "✅ Native SHA-256 kernel built" \
+        || echo "ℹ️  Native SHA-256 kernel unavailable, using hashlib"
+fi
+
+# Nettoyer les processus existants avant de choisir le port
+# (run_server() se remplace par uvicorn/gunicorn via execv: la ligne de
+# commande ne contient plus simple_biomining_demo.py)
+pkill -f "simple_biomining_demo.py|simple_biomining_asgi:app|simple_biomining_demo:create_app" 2>/dev/null || true
+for port in {5000..5010}; do
+    PID=$(lsof -ti tcp:$port -sTCP:LISTEN 2>/dev/null || true)
+    if [ ! -z "$PID" ]; then
+        echo "🔄 Stopping process on port $port (PID: $PID)"
+        kill $PID 2>/dev/null || true
+        sleep 0.5
+    fi
+done
 
 # Trouver un port libre
 PORT=5000
@@ -50,9 +73,6 @@ done
 
 echo "🔍 Using port: $PORT"
 
-# Nettoyer les processus existants
-pkill -f "simple_biomining_demo.py" 2>/dev/null || true
-
 echo ""
 echo "🚀 Starting BioMining Platform..."
 echo "🌐 Interface will be available at:"
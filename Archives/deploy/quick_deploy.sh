@@ -34,12 +34,22 @@ python3 --version || {
     exit 1
 }
 
-# Installer Flask si nécessaire
-python3 -c "import flask; print('✅ Flask disponible')" 2>/dev/null || {
-    echo "📦 Installation Flask..."
-    pip3 install flask
+# Installer Flask + NumPy si nécessaire
+python3 -c "import flask, numpy; print('✅ Flask + NumPy disponibles')" 2>/dev/null || {
+    echo "📦 Installation Flask + NumPy..."
+    pip3 install flask numpy
 }
 
+# Encodeur JSON rapide (optionnel, repli json stdlib sinon)
+python3 -c "import orjson" >/dev/null 2>&1 || pip3 install orjson >/dev/null 2>&1 || true
+
+# Noyau SHA-256 natif (optionnel, repli hashlib sinon)
+if python3 -c "import cffi" >/dev/null 2>&1; then
+    (cd "$DEPLOY_DIR" && python3 sha256d_build.py >/dev/null 2>&1) \
+        && echo "✅ Noyau SHA-256 natif compilé" \
+        || echo "ℹ️  Noyau SHA-256 natif indisponible, repli hashlib"
+fi
+
 echo "✅ Toutes les dépendances disponibles"
 
 # Arrêter les processus existants sur les ports courants
@@ -0,0 +1,504 @@
+/*
+ * BioMining Platform - Noyau double SHA-256 pour headers Bitcoin (80 octets)
+ *
+ * Balayage de nonces par lots: 4 voies SSE4.1 ou 8 voies AVX2 calculent
+ * des compressions SHA-256 indépendantes dans les mêmes registres vectoriels
+ * (même schéma que bitcoin/src/crypto/sha256_avx2.cpp). Le padding des
+ * deux messages (80 puis 32 octets) est constant, et seul le second bloc
+ * du header dépend du nonce: l'état après les octets 0-63 (midstate) et
+ * les 3 premières rondes du second bloc sont calculés une fois par lot.
+ * Pour la recherche contre une cible, seul le mot de poids fort du hash
+ * final est calculé (rejet anticipé de ~99.99% des candidats).
+ * Sur les CPU dotés des
+ * extensions SHA (SHA-NI), SHA256RNDS2 calcule deux rondes par instruction
+ * et prime sur AVX2 (schéma de sha256_x86_shani.cpp, deux messages
+ * entrelacés pour masquer la latence). Sélection à l'exécution, repli
+ * scalaire sinon.
+ */
+
+#include <string.h>
+
+#include "sha256d_batch.h"
+
+#if (defined(__x86_64__) || defined(__i386__)) && defined(__GNUC__)
+#include <cpuid.h>
+#include <immintrin.h>
+#define SHA256D_X86 1
+#endif
+
+static const uint32_t K[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+};
+
+static const uint32_t IV[8] = {
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+};
+
+static inline uint32_t read_be32(const uint8_t *p)
+{
+    return ((uint32_t)p[0] << 24) | ((uint32_t)p[1] << 16) | ((uint32_t)p[2] << 8) | (uint32_t)p[3];
+}
+
+static inline void write_be32(uint8_t *p, uint32_t x)
+{
+    p[0] = (uint8_t)(x >> 24);
+    p[1] = (uint8_t)(x >> 16);
+    p[2] = (uint8_t)(x >> 8);
+    p[3] = (uint8_t)x;
+}
+
+static inline uint32_t bswap32(uint32_t x)
+{
+    return (x >> 24) | ((x >> 8) & 0x0000ff00u) | ((x << 8) & 0x00ff0000u) | (x << 24);
+}
+
+/* Travail commun à un lot de nonces */
+struct sha256d_job {
+    uint32_t midstate[8];  /* état après le premier bloc (octets 0-63) */
+    uint32_t prestate[8];  /* état de travail après les rondes 0-2 du second bloc */
+    uint32_t tail[3];      /* mots W0-W2 du second bloc (octets 64-75) */
+    uint8_t tail_bytes[12];
+};
+
+/* Fonctions SHA-256 exprimées avec les opérations vectorielles V_* courantes */
+#define ROTR(x, n) V_OR(V_SHR(x, n), V_SHL(x, 32 - (n)))
+#define Ch(x, y, z) V_XOR(z, V_AND(x, V_XOR(y, z)))
+#define Maj(x, y, z) V_OR(V_AND(x, y), V_AND(z, V_OR(x, y)))
+#define Sigma0(x) V_XOR(V_XOR(ROTR(x, 2), ROTR(x, 13)), ROTR(x, 22))
+#define Sigma1(x) V_XOR(V_XOR(ROTR(x, 6), ROTR(x, 11)), ROTR(x, 25))
+#define sigma0(x) V_XOR(V_XOR(ROTR(x, 7), ROTR(x, 18)), V_SHR(x, 3))
+#define sigma1(x) V_XOR(V_XOR(ROTR(x, 17), ROTR(x, 19)), V_SHR(x, 10))
+
+/* ------------------------------------------------------------------ */
+/* Scalaire (1 voie)                                                   */
+/* ------------------------------------------------------------------ */
+
+#define SHA_LANES 1
+#define SHA_VEC uint32_t
+#define SHA_FN(name) name##_x1
+#define SHA_TARGET
+#define V_ADD(a, b) ((a) + (b))
+#define V_XOR(a, b) ((a) ^ (b))
+#define V_OR(a, b) ((a) | (b))
+#define V_AND(a, b) ((a) & (b))
+#define V_SHR(a, n) ((a) >> (n))
+#define V_SHL(a, n) ((a) << (n))
+#define V_SET1(x) ((uint32_t)(x))
+#define V_ZERO 0u
+#define V_LOADU(p) (*(p))
+#define V_STOREU(p, v) (*(p) = (v))
+#include "sha256d_lanes.h"
+#undef SHA_LANES
+#undef SHA_VEC
+#undef SHA_FN
+#undef SHA_TARGET
+#undef V_ADD
+#undef V_XOR
+#undef V_OR
+#undef V_AND
+#undef V_SHR
+#undef V_SHL
+#undef V_SET1
+#undef V_ZERO
+#undef V_LOADU
+#undef V_STOREU
+
+#ifdef SHA256D_X86
+
+/* ------------------------------------------------------------------ */
+/* SSE4.1 (4 voies)                                                    */
+/* ------------------------------------------------------------------ */
+
+#define SHA_LANES 4
+#define SHA_VEC __m128i
+#define SHA_FN(name) name##_sse41
+#define SHA_TARGET __attribute__((target("sse4.1")))
+#define V_ADD(a, b) _mm_add_epi32(a, b)
+#define V_XOR(a, b) _mm_xor_si128(a, b)
+#define V_OR(a, b) _mm_or_si128(a, b)
+#define V_AND(a, b) _mm_and_si128(a, b)
+#define V_SHR(a, n) _mm_srli_epi32(a, n)
+#define V_SHL(a, n) _mm_slli_epi32(a, n)
+#define V_SET1(x) _mm_set1_epi32((int)(x))
+#define V_ZERO _mm_setzero_si128()
+#define V_LOADU(p) _mm_loadu_si128((const __m128i *)(p))
+#define V_STOREU(p, v) _mm_storeu_si128((__m128i *)(p), v)
+#include "sha256d_lanes.h"
+#undef SHA_LANES
+#undef SHA_VEC
+#undef SHA_FN
+#undef SHA_TARGET
+#undef V_ADD
+#undef V_XOR
+#undef V_OR
+#undef V_AND
+#undef V_SHR
+#undef V_SHL
+#undef V_SET1
+#undef V_ZERO
+#undef V_LOADU
+#undef V_STOREU
+
+/* ------------------------------------------------------------------ */
+/* AVX2 (8 voies)                                                      */
+/* ------------------------------------------------------------------ */
+
+#define SHA_LANES 8
+#define SHA_VEC __m256i
+#define SHA_FN(name) name##_avx2
+#define SHA_TARGET __attribute__((target("avx2")))
+#define V_ADD(a, b) _mm256_add_epi32(a, b)
+#define V_XOR(a, b) _mm256_xor_si256(a, b)
+#define V_OR(a, b) _mm256_or_si256(a, b)
+#define V_AND(a, b) _mm256_and_si256(a, b)
+#define V_SHR(a, n) _mm256_srli_epi32(a, n)
+#define V_SHL(a, n) _mm256_slli_epi32(a, n)
+#define V_SET1(x) _mm256_set1_epi32((int)(x))
+#define V_ZERO _mm256_setzero_si256()
+#define V_LOADU(p) _mm256_loadu_si256((const __m256i *)(p))
+#define V_STOREU(p, v) _mm256_storeu_si256((__m256i *)(p), v)
+#include "sha256d_lanes.h"
+#undef SHA_LANES
+#undef SHA_VEC
+#undef SHA_FN
+#undef SHA_TARGET
+#undef V_ADD
+#undef V_XOR
+#undef V_OR
+#undef V_AND
+#undef V_SHR
+#undef V_SHL
+#undef V_SET1
+#undef V_ZERO
+#undef V_LOADU
+#undef V_STOREU
+
+/* ------------------------------------------------------------------ */
+/* SHA-NI (2 messages entrelacés)                                      */
+/* ------------------------------------------------------------------ */
+
+#define SHANI_TARGET __attribute__((target("sha,sse4.1")))
+
+/* Chargement big-endian de 4 mots du message */
+static SHANI_TARGET inline __m128i shani_load(const uint8_t *p)
+{
+    const __m128i mask = _mm_set_epi8(12, 13, 14, 15, 8, 9, 10, 11, 4, 5, 6, 7, 0, 1, 2, 3);
+    return _mm_shuffle_epi8(_mm_loadu_si128((const __m128i *)p), mask);
+}
+
+/* État a..h -> registres ABEF / CDGH attendus par SHA256RNDS2 */
+static SHANI_TARGET inline void shani_state_in(const uint32_t s[8], __m128i *abef, __m128i *cdgh)
+{
+    __m128i t1 = _mm_shuffle_epi32(_mm_loadu_si128((const __m128i *)s), 0xB1);
+    __m128i t2 = _mm_shuffle_epi32(_mm_loadu_si128((const __m128i *)(s + 4)), 0x1B);
+    *abef = _mm_alignr_epi8(t1, t2, 8);
+    *cdgh = _mm_blend_epi16(t2, t1, 0xF0);
+}
+
+static SHANI_TARGET inline void shani_state_out(__m128i abef, __m128i cdgh, uint32_t s[8])
+{
+    __m128i t1 = _mm_shuffle_epi32(abef, 0x1B);
+    __m128i t2 = _mm_shuffle_epi32(cdgh, 0xB1);
+    _mm_storeu_si128((__m128i *)s, _mm_blend_epi16(t1, t2, 0xF0));
+    _mm_storeu_si128((__m128i *)(s + 4), _mm_alignr_epi8(t2, t1, 8));
+}
+
+/*
+ * Une compression par message, les deux flux entrelacés ronde par ronde.
+ * m[j & 3] contient le groupe de mots W[4j..4j+3]; SHA256MSG1/MSG2 dérivent
+ * le groupe suivant (sha256_x86_shani.cpp, ShiftMessageA/C).
+ */
+static SHANI_TARGET void transform_shani_2way(uint32_t sa[8], const uint8_t *ba,
+                                              uint32_t sb[8], const uint8_t *bb)
+{
+    __m128i a0, a1, ao0, ao1, b0, b1, bo0, bo1, k, msg;
+    __m128i ma[4], mb[4];
+    int j;
+
+    shani_state_in(sa, &a0, &a1);
+    shani_state_in(sb, &b0, &b1);
+    ao0 = a0;
+    ao1 = a1;
+    bo0 = b0;
+    bo1 = b1;
+
+    for (j = 0; j < 16; j++) {
+        if (j < 4) {
+            ma[j] = shani_load(ba + 16 * j);
+            mb[j] = shani_load(bb + 16 * j);
+        }
+
+        k = _mm_loadu_si128((const __m128i *)(K + 4 * j));
+        msg = _mm_add_epi32(ma[j & 3], k);
+        a1 = _mm_sha256rnds2_epu32(a1, a0, msg);
+        a0 = _mm_sha256rnds2_epu32(a0, a1, _mm_shuffle_epi32(msg, 0x0E));
+        msg = _mm_add_epi32(mb[j & 3], k);
+        b1 = _mm_sha256rnds2_epu32(b1, b0, msg);
+        b0 = _mm_sha256rnds2_epu32(b0, b1, _mm_shuffle_epi32(msg, 0x0E));
+
+        if (j >= 3 && j < 15) {
+            ma[(j + 1) & 3] = _mm_sha256msg2_epu32(
+                _mm_add_epi32(ma[(j + 1) & 3], _mm_alignr_epi8(ma[j & 3], ma[(j - 1) & 3], 4)),
+                ma[j & 3]);
+            mb[(j + 1) & 3] = _mm_sha256msg2_epu32(
+                _mm_add_epi32(mb[(j + 1) & 3], _mm_alignr_epi8(mb[j & 3], mb[(j - 1) & 3], 4)),
+                mb[j & 3]);
+        }
+        if (j >= 1 && j <= 12) {
+            ma[(j - 1) & 3] = _mm_sha256msg1_epu32(ma[(j - 1) & 3], ma[j & 3]);
+            mb[(j - 1) & 3] = _mm_sha256msg1_epu32(mb[(j - 1) & 3], mb[j & 3]);
+        }
+    }
+
+    shani_state_out(_mm_add_epi32(a0, ao0), _mm_add_epi32(a1, ao1), sa);
+    shani_state_out(_mm_add_epi32(b0, bo0), _mm_add_epi32(b1, bo1), sb);
+}
+
+/* Deux headers consécutifs (base_nonce, base_nonce + 1) -> out[64] */
+static SHANI_TARGET void sha256d_80_2way_shani(const struct sha256d_job *job, uint32_t base_nonce,
+                                               uint8_t *out)
+{
+    uint32_t sa[8], sb[8];
+    uint8_t ba[64], bb[64];
+    int i;
+
+    memcpy(sa, job->midstate, sizeof(sa));
+    memcpy(sb, job->midstate, sizeof(sb));
+
+    /* Second bloc: queue + nonce (little-endian) + padding (640 bits) */
+    memset(ba, 0, sizeof(ba));
+    memcpy(ba, job->tail_bytes, 12);
+    ba[16] = 0x80;
+    ba[62] = 0x02;
+    ba[63] = 0x80;
+    memcpy(bb, ba, sizeof(bb));
+    write_be32(ba + 12, bswap32(base_nonce));
+    write_be32(bb + 12, bswap32(base_nonce + 1));
+    transform_shani_2way(sa, ba, sb, bb);
+
+    /* Second SHA-256 sur les digests de 32 octets (256 bits) */
+    memset(ba + 32, 0, 32);
+    ba[32] = 0x80;
+    ba[62] = 0x01;
+    ba[63] = 0x00;
+    memcpy(bb + 32, ba + 32, 32);
+    for (i = 0; i < 8; i++) {
+        write_be32(ba + 4 * i, sa[i]);
+        write_be32(bb + 4 * i, sb[i]);
+    }
+    memcpy(sa, IV, sizeof(sa));
+    memcpy(sb, IV, sizeof(sb));
+    transform_shani_2way(sa, ba, sb, bb);
+
+    for (i = 0; i < 8; i++) {
+        write_be32(out + 4 * i, sa[i]);
+        write_be32(out + 32 + 4 * i, sb[i]);
+    }
+}
+
+static SHANI_TARGET void sha256d_80_hi_shani(const struct sha256d_job *job, uint32_t base_nonce,
+                                             uint32_t *out_hi)
+{
+    uint8_t hashes[64];
+
+    sha256d_80_2way_shani(job, base_nonce, hashes);
+    out_hi[0] = bswap32(read_be32(hashes + 28));
+    out_hi[1] = bswap32(read_be32(hashes + 60));
+}
+
+static int cpu_has_shani(void)
+{
+    unsigned int eax, ebx, ecx, edx;
+
+    if (!__get_cpuid_count(7, 0, &eax, &ebx, &ecx, &edx))
+        return 0;
+    return (ebx & bit_SHA) != 0 && __builtin_cpu_supports("sse4.1");
+}
+
+#endif /* SHA256D_X86 */
+
+/* ------------------------------------------------------------------ */
+/* Dispatch                                                            */
+/* ------------------------------------------------------------------ */
+
+typedef void (*sha256d_80_fn)(const struct sha256d_job *job, uint32_t base_nonce, uint8_t *out);
+typedef void (*sha256d_80_hi_fn)(const struct sha256d_job *job, uint32_t base_nonce, uint32_t *out_hi);
+
+/* Plus grand nombre de voies parmi les backends (taille des tampons locaux) */
+#define SHA256D_MAX_LANES 8
+
+static sha256d_80_fn backend_fn = sha256d_80_x1;
+static sha256d_80_hi_fn backend_hi_fn = sha256d_80_hi_x1;
+static size_t backend_lanes = 1;
+static const char *backend_name = "scalar";
+static int backend_ready = 0;
+
+/* Sélectionne le backend nommé s'il est supporté par le CPU; 0 sinon */
+static int select_backend(const char *name)
+{
+    if (strcmp(name, "scalar") == 0) {
+        backend_fn = sha256d_80_x1;
+        backend_hi_fn = sha256d_80_hi_x1;
+        backend_lanes = 1;
+        backend_name = "scalar";
+#ifdef SHA256D_X86
+    } else if (strcmp(name, "shani") == 0 && cpu_has_shani()) {
+        backend_fn = sha256d_80_2way_shani;
+        backend_hi_fn = sha256d_80_hi_shani;
+        backend_lanes = 2;
+        backend_name = "shani";
+    } else if (strcmp(name, "avx2") == 0 && __builtin_cpu_supports("avx2")) {
+        backend_fn = sha256d_80_avx2;
+        backend_hi_fn = sha256d_80_hi_avx2;
+        backend_lanes = 8;
+        backend_name = "avx2";
+    } else if (strcmp(name, "sse4.1") == 0 && __builtin_cpu_supports("sse4.1")) {
+        backend_fn = sha256d_80_sse41;
+        backend_hi_fn = sha256d_80_hi_sse41;
+        backend_lanes = 4;
+        backend_name = "sse4.1";
+#endif
+    } else {
+        return 0;
+    }
+    return 1;
+}
+
+void sha256d_init(void)
+{
+    if (backend_ready)
+        return;
+#ifdef SHA256D_X86
+    __builtin_cpu_init();
+#endif
+    if (!select_backend("shani") && !select_backend("avx2") && !select_backend("sse4.1"))
+        select_backend("scalar");
+    backend_ready = 1;
+}
+
+int sha256d_set_backend(const char *name)
+{
+    sha256d_init();
+    return select_backend(name);
+}
+
+const char *sha256d_backend(void)
+{
+    sha256d_init();
+    return backend_name;
+}
+
+void sha256_midstate(const uint8_t *prefix, uint32_t *midstate)
+{
+    uint32_t w[16];
+    int i;
+
+    for (i = 0; i < 8; i++)
+        midstate[i] = IV[i];
+    for (i = 0; i < 16; i++)
+        w[i] = read_be32(prefix + 4 * i);
+    transform_x1(midstate, w);
+}
+
+static void job_init(struct sha256d_job *job, const uint32_t *midstate, const uint8_t *tail)
+{
+    uint32_t w[16];
+    int i;
+
+    memcpy(job->midstate, midstate, sizeof(job->midstate));
+    memcpy(job->prestate, midstate, sizeof(job->prestate));
+    memcpy(job->tail_bytes, tail, sizeof(job->tail_bytes));
+    for (i = 0; i < 3; i++)
+        job->tail[i] = w[i] = read_be32(tail + 4 * i);
+    rounds_x1(job->prestate, w, 0, 3);
+}
+
+void sha256d_80_batch(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                      size_t n, uint8_t *out_hashes)
+{
+    struct sha256d_job job;
+    size_t done = 0;
+
+    sha256d_init();
+    job_init(&job, midstate, tail);
+    for (; done + backend_lanes <= n; done += backend_lanes)
+        backend_fn(&job, base_nonce + (uint32_t)done, out_hashes + 32 * done);
+    for (; done < n; done++)
+        sha256d_80_x1(&job, base_nonce + (uint32_t)done, out_hashes + 32 * done);
+}
+
+/* a < b en tant qu'entiers 256 bits little-endian (ordre d'affichage inversé) */
+static int hash_less(const uint8_t *a, const uint8_t *b)
+{
+    int i;
+    for (i = 31; i >= 0; i--) {
+        if (a[i] != b[i])
+            return a[i] < b[i];
+    }
+    return 0;
+}
+
+uint32_t sha256d_80_scan_best(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                              size_t n, uint8_t *best_hash)
+{
+    struct sha256d_job job;
+    uint8_t hashes[32 * SHA256D_MAX_LANES];
+    uint32_t best_nonce = base_nonce;
+    size_t done = 0, step, i;
+
+    memset(best_hash, 0xff, 32);
+    sha256d_init();
+    job_init(&job, midstate, tail);
+    while (done < n) {
+        step = n - done < backend_lanes ? 1 : backend_lanes;
+        if (step == 1)
+            sha256d_80_x1(&job, base_nonce + (uint32_t)done, hashes);
+        else
+            backend_fn(&job, base_nonce + (uint32_t)done, hashes);
+        for (i = 0; i < step; i++) {
+            if (hash_less(hashes + 32 * i, best_hash)) {
+                memcpy(best_hash, hashes + 32 * i, 32);
+                best_nonce = base_nonce + (uint32_t)(done + i);
+            }
+        }
+        done += step;
+    }
+    return best_nonce;
+}
+
+int sha256d_80_find_nonce(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                          size_t n, uint32_t target_hi, uint32_t *nonce_out, uint8_t *hash_out)
+{
+    struct sha256d_job job;
+    uint32_t hi[SHA256D_MAX_LANES];
+    uint32_t nonce;
+    size_t done = 0, step, i;
+
+    sha256d_init();
+    job_init(&job, midstate, tail);
+    while (done < n) {
+        step = n - done < backend_lanes ? 1 : backend_lanes;
+        if (step == 1)
+            sha256d_80_hi_x1(&job, base_nonce + (uint32_t)done, hi);
+        else
+            backend_hi_fn(&job, base_nonce + (uint32_t)done, hi);
+        for (i = 0; i < step; i++) {
+            if (hi[i] <= target_hi) {
+                /* Candidat rare: hash complet uniquement pour celui-ci */
+                nonce = base_nonce + (uint32_t)(done + i);
+                sha256d_80_x1(&job, nonce, hash_out);
+                *nonce_out = nonce;
+                return 1;
+            }
+        }
+        done += step;
+    }
+    return 0;
+}
@@ -0,0 +1,53 @@
+/*
+ * BioMining Platform - Noyau double SHA-256 pour headers Bitcoin (80 octets)
+ *
+ * Les 76 premiers octets du header sont invariants pendant un balayage de
+ * nonce: seul le nonce (octets 76-79, little-endian) change d'un candidat
+ * à l'autre. Les hashes produits sont dans l'ordre du digest SHA-256
+ * (comme hashlib.sha256().digest()); l'affichage Bitcoin les inverse.
+ *
+ * Compilé par sha256d_build.py (cffi).
+ */
+
+#ifndef SHA256D_BATCH_H
+#define SHA256D_BATCH_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+/* Sélectionne le backend (shani / avx2 / sse4.1 / scalar) selon le CPU */
+void sha256d_init(void);
+
+/*
+ * Force un backend ("shani", "avx2", "sse4.1", "scalar"): 1 si sélectionné,
+ * 0 s'il est inconnu ou non supporté par le CPU (backend courant inchangé)
+ */
+int sha256d_set_backend(const char *name);
+
+/* Nom du backend sélectionné */
+const char *sha256d_backend(void);
+
+/* État SHA-256 après les 64 premiers octets du header (midstate) */
+void sha256_midstate(const uint8_t *prefix, uint32_t *midstate);
+
+/*
+ * Les lots partent du midstate et de la queue du préfixe (octets 64-75).
+ * Hashes des nonces [base_nonce, base_nonce + n) -> out_hashes[n * 32]
+ */
+void sha256d_80_batch(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                      size_t n, uint8_t *out_hashes);
+
+/* Nonce du plus petit hash de [base_nonce, base_nonce + n), hash dans best_hash */
+uint32_t sha256d_80_scan_best(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                              size_t n, uint8_t *best_hash);
+
+/*
+ * Premier nonce de [base_nonce, base_nonce + n) dont le mot de poids fort du
+ * hash (ordre d'affichage) est <= target_hi. Retourne 1 et remplit nonce_out
+ * / hash_out si trouvé, 0 sinon. La comparaison complète à la cible reste à
+ * la charge de l'appelant.
+ */
+int sha256d_80_find_nonce(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                          size_t n, uint32_t target_hi, uint32_t *nonce_out, uint8_t *hash_out);
+
+#endif /* SHA256D_BATCH_H */
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+BioMining Platform - Compilation du noyau natif double SHA-256
+==============================================================
+
+Construit l'extension cffi `_sha256d_batch` (sha256d_batch.c) à côté de
+simple_biomining_demo.py. Optionnelle: sans elle, la démo retombe sur hashlib.
+
+Usage:
+    pip3 install cffi
+    python3 sha256d_build.py
+"""
+
+import os
+
+from cffi import FFI
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+ffibuilder = FFI()
+
+ffibuilder.cdef("""
+    void sha256d_init(void);
+    int sha256d_set_backend(const char *name);
+    const char *sha256d_backend(void);
+    void sha256_midstate(const uint8_t *prefix, uint32_t *midstate);
+    void sha256d_80_batch(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                          size_t n, uint8_t *out_hashes);
+    uint32_t sha256d_80_scan_best(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                                  size_t n, uint8_t *best_hash);
+    int sha256d_80_find_nonce(const uint32_t *midstate, const uint8_t *tail, uint32_t base_nonce,
+                              size_t n, uint32_t target_hi, uint32_t *nonce_out, uint8_t *hash_out);
+""")
+
+ffibuilder.set_source(
+    "_sha256d_batch",
+    '#include "sha256d_batch.h"',
+    sources=["sha256d_batch.c"],
+    include_dirs=[HERE],
+    extra_compile_args=["-O3"],
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(tmpdir=HERE, verbose=True)
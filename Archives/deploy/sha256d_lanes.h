@@ -0,0 +1,151 @@
+/*
+ * BioMining Platform - Gabarit double SHA-256 multi-voies
+ *
+ * Inclus plusieurs fois par sha256d_batch.c, une fois par jeu d'instructions.
+ * Chaque voie du vecteur traite un nonce différent; avant inclusion, définir:
+ *
+ *   SHA_LANES, SHA_VEC, SHA_FN(name), SHA_TARGET
+ *   V_ADD, V_XOR, V_OR, V_AND, V_SHR, V_SHL, V_SET1, V_ZERO, V_LOADU, V_STOREU
+ */
+
+/* Rondes [first, last) sur l'état de travail st (a..h), sans ajout final */
+static SHA_TARGET inline void SHA_FN(rounds)(SHA_VEC st[8], SHA_VEC w[16], int first, int last)
+{
+    SHA_VEC a = st[0], b = st[1], c = st[2], d = st[3];
+    SHA_VEC e = st[4], f = st[5], g = st[6], h = st[7];
+    SHA_VEC t1, t2;
+    int i;
+
+    for (i = first; i < last; i++) {
+        if (i >= 16) {
+            w[i & 15] = V_ADD(V_ADD(sigma1(w[(i - 2) & 15]), w[(i - 7) & 15]),
+                              V_ADD(sigma0(w[(i - 15) & 15]), w[i & 15]));
+        }
+        t1 = V_ADD(V_ADD(V_ADD(h, Sigma1(e)), V_ADD(Ch(e, f, g), V_SET1(K[i]))),
+                   w[i & 15]);
+        t2 = V_ADD(Sigma0(a), Maj(a, b, c));
+        h = g;
+        g = f;
+        f = e;
+        e = V_ADD(d, t1);
+        d = c;
+        c = b;
+        b = a;
+        a = V_ADD(t1, t2);
+    }
+
+    st[0] = a;
+    st[1] = b;
+    st[2] = c;
+    st[3] = d;
+    st[4] = e;
+    st[5] = f;
+    st[6] = g;
+    st[7] = h;
+}
+
+/* Compression complète: s += rondes(s, w) */
+static SHA_TARGET void SHA_FN(transform)(SHA_VEC s[8], SHA_VEC w[16])
+{
+    SHA_VEC st[8];
+    int i;
+
+    for (i = 0; i < 8; i++)
+        st[i] = s[i];
+    SHA_FN(rounds)(st, w, 0, 64);
+    for (i = 0; i < 8; i++)
+        s[i] = V_ADD(s[i], st[i]);
+}
+
+/* Premier SHA-256 (80 octets) de SHA_LANES headers consécutifs -> digests dans s */
+static SHA_TARGET inline void SHA_FN(first_hash)(const struct sha256d_job *job, uint32_t base_nonce,
+                                                 SHA_VEC s[8])
+{
+    SHA_VEC st[8], w[16];
+    uint32_t lanes[SHA_LANES];
+    int i, lane;
+
+    /*
+     * Second bloc seulement: le midstate couvre les octets 0-63, et les
+     * rondes 0-2 (mots de queue constants) sont déjà dans job->prestate.
+     */
+    for (i = 0; i < 8; i++) {
+        s[i] = V_SET1(job->midstate[i]);
+        st[i] = V_SET1(job->prestate[i]);
+    }
+    for (i = 0; i < 3; i++)
+        w[i] = V_SET1(job->tail[i]);
+    for (lane = 0; lane < SHA_LANES; lane++)
+        lanes[lane] = bswap32(base_nonce + (uint32_t)lane);
+    w[3] = V_LOADU(lanes);
+    w[4] = V_SET1(0x80000000u);
+    for (i = 5; i < 15; i++)
+        w[i] = V_ZERO;
+    w[15] = V_SET1(640);
+    SHA_FN(rounds)(st, w, 3, 64);
+    for (i = 0; i < 8; i++)
+        s[i] = V_ADD(s[i], st[i]);
+}
+
+/* Message du second SHA-256: digest de 32 octets + padding (longueur 256 bits) */
+static SHA_TARGET inline void SHA_FN(second_block)(const SHA_VEC s[8], SHA_VEC w[16])
+{
+    int i;
+
+    for (i = 0; i < 8; i++)
+        w[i] = s[i];
+    w[8] = V_SET1(0x80000000u);
+    for (i = 9; i < 15; i++)
+        w[i] = V_ZERO;
+    w[15] = V_SET1(256);
+}
+
+/* SHA_LANES headers consécutifs (base_nonce + voie) -> out[SHA_LANES * 32] */
+static SHA_TARGET void SHA_FN(sha256d_80)(const struct sha256d_job *job, uint32_t base_nonce,
+                                          uint8_t *out)
+{
+    SHA_VEC s[8], w[16];
+    uint32_t lanes[SHA_LANES];
+    int i, lane;
+
+    SHA_FN(first_hash)(job, base_nonce, s);
+    SHA_FN(second_block)(s, w);
+    for (i = 0; i < 8; i++)
+        s[i] = V_SET1(IV[i]);
+    SHA_FN(transform)(s, w);
+
+    for (i = 0; i < 8; i++) {
+        V_STOREU(lanes, s[i]);
+        for (lane = 0; lane < SHA_LANES; lane++)
+            write_be32(out + 32 * lane + 4 * i, lanes[lane]);
+    }
+}
+
+/*
+ * Mot de poids fort (ordre d'affichage) du hash final, pour le rejet
+ * anticipé: il ne dépend que de h après 64 rondes, c'est-à-dire de e après
+ * la ronde 60. Les 3 dernières rondes et les 7 autres mots sont omis.
+ */
+static SHA_TARGET void SHA_FN(sha256d_80_hi)(const struct sha256d_job *job, uint32_t base_nonce,
+                                             uint32_t *out_hi)
+{
+    SHA_VEC s[8], w[16], t1;
+    uint32_t lanes[SHA_LANES];
+    int i, lane;
+
+    SHA_FN(first_hash)(job, base_nonce, s);
+    SHA_FN(second_block)(s, w);
+    for (i = 0; i < 8; i++)
+        s[i] = V_SET1(IV[i]);
+    SHA_FN(rounds)(s, w, 0, 60);
+
+    /* Ronde 60 réduite à e = d + t1 */
+    w[60 & 15] = V_ADD(V_ADD(sigma1(w[58 & 15]), w[53 & 15]),
+                       V_ADD(sigma0(w[45 & 15]), w[60 & 15]));
+    t1 = V_ADD(V_ADD(V_ADD(s[7], Sigma1(s[4])), V_ADD(Ch(s[4], s[5], s[6]), V_SET1(K[60]))),
+               w[60 & 15]);
+
+    V_STOREU(lanes, V_ADD(V_SET1(IV[7]), V_ADD(s[3], t1)));
+    for (lane = 0; lane < SHA_LANES; lane++)
+        out_hi[lane] = bswap32(lanes[lane]);
+}
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+BioMining Platform - Version ASGI (FastAPI) de la démo Cloud Shell
+===================================================================
+
+Mêmes routes et mêmes corps de réponse que simple_biomining_demo.py
+(interface HTML, simulateurs, sérialisation), servis par une boucle asyncio
+au lieu d'un thread par requête. Les compteurs de mining sont avancés par
+une tâche asyncio plutôt que par un thread.
+
+Usage:
+    uvicorn simple_biomining_asgi:app --host 0.0.0.0 --port 5000
+    (ou python3 simple_biomining_demo.py; BIOMINING_SERVER=flask pour Flask)
+"""
+
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+
+from simple_biomining_demo import (
+    SimpleBitcoinMiner,
+    SimpleMEAInterface,
+    _HEALTH_PREFIX,
+    _HEALTH_SUFFIX,
+    _INDEX_CACHE_CONTROL,
+    _INDEX_ETAG,
+    _INDEX_HTML,
+    _INDEX_HTML_GZ,
+    _json_bytes,
+    now_iso,
+)
+
+# Instances propres à l'app ASGI: pas de thread de tick côté mineur
+mea_interface = SimpleMEAInterface()
+bitcoin_miner = SimpleBitcoinMiner(threaded_ticks=False)
+
+
+async def _mining_ticks():
+    """Avance les compteurs simulés une fois par seconde pendant le mining"""
+    while True:
+        await asyncio.sleep(1.0)
+        if bitcoin_miner.mining_active:
+            bitcoin_miner.step()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    task = asyncio.create_task(_mining_ticks())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+app = FastAPI(title="BioMining Platform - Cloud Shell", lifespan=lifespan,
+              docs_url=None, redoc_url=None, openapi_url=None)
+
+
+def _etag_matches(request, etag):
+    """If-None-Match contient l'ETag (comparaison faible)"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    return header.strip() == '*' or etag in [t.strip() for t in header.split(',')]
+
+
+def ojson(obj):
+    """Réponse JSON pré-sérialisée (orjson, repli json stdlib)"""
+    return Response(_json_bytes(obj), media_type='application/json')
+
+
+def json_body_cached(request, body, max_age=1):
+    """Réponse JSON de status: TTL court + ETag faible, 304 si inchangée"""
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+    headers = {'Cache-Control': f'max-age={max_age}', 'ETag': etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+def ojson_cached(request, obj, max_age=1):
+    return json_body_cached(request, _json_bytes(obj), max_age)
+
+# ====================================================================
+# ROUTES (identiques à la version Flask)
+# ====================================================================
+
+@app.get('/')
+async def index(request: Request):
+    """Page principale"""
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        body, etag, extra = _INDEX_HTML_GZ, f'"{_INDEX_ETAG}-gz"', {'Content-Encoding': 'gzip'}
+    else:
+        body, etag, extra = _INDEX_HTML, f'"{_INDEX_ETAG}"', {}
+    headers = {'ETag': etag, 'Cache-Control': _INDEX_CACHE_CONTROL, 'Vary': 'Accept-Encoding', **extra}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='text/html; charset=utf-8', headers=headers)
+
+@app.get('/api/state')
+async def state(request: Request):
+    """Status MEA + mining + électrodes en une seule réponse (endpoint sondé par l'interface)"""
+    return ojson_cached(request, {
+        "mea": mea_interface.get_status(),
+        "mining": bitcoin_miner.get_mining_status(),
+        "electrodes": mea_interface.get_electrode_data()
+    })
+
+@app.get('/api/mea/status')
+async def mea_status(request: Request):
+    """Status interface MEA (déprécié: préférer /api/state)"""
+    return ojson_cached(request, mea_interface.get_status())
+
+@app.post('/api/mea/start')
+async def mea_start():
+    """Démarrer acquisition MEA"""
+    return ojson(mea_interface.start_acquisition())
+
+@app.post('/api/mea/stop')
+async def mea_stop():
+    """Arrêter acquisition MEA"""
+    return ojson(mea_interface.stop_acquisition())
+
+@app.get('/api/mea/electrodes')
+async def mea_electrodes(id: int = None):
+    """Données électrodes"""
+    return ojson(mea_interface.get_electrode_data(id))
+
+@app.get('/api/mining/status')
+async def mining_status(request: Request):
+    """Status mining Bitcoin (déprécié: préférer /api/state)"""
+    return ojson_cached(request, bitcoin_miner.get_mining_status())
+
+@app.post('/api/mining/start')
+async def mining_start():
+    """Démarrer mining"""
+    return ojson(bitcoin_miner.start_mining())
+
+@app.post('/api/mining/stop')
+async def mining_stop():
+    """Arrêter mining"""
+    return ojson(bitcoin_miner.stop_mining())
+
+@app.get('/api/mining/test-genesis')
+async def test_genesis():
+    """Test validation bloc Genesis"""
+    return ojson(bitcoin_miner.test_genesis_validation())
+
+@app.get('/health')
+async def health_check(request: Request):
+    """Health check pour monitoring"""
+    return json_body_cached(
+        request,
+        _HEALTH_PREFIX[bool(mea_interface.connected)] + now_iso().encode('ascii') + _HEALTH_SUFFIX
+    )
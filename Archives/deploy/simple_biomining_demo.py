@@ -11,18 +11,98 @@ Date: 2025-10-02
 Version: 1.0.0-cloudshell
 """
 
-from flask import Flask, render_template_string, jsonify, request, send_from_directory
+from flask import Flask, Response, request, send_from_directory
+import gzip
 import json
 import time
-import random
 import hashlib
+import importlib.util
 import struct
 import threading
 from datetime import datetime
 import os
+import sys
+
+import numpy as np
 
 app = Flask(__name__)
 
+# Liaisons pré-résolues pour la boucle de hash (évite lookup d'attribut et re-parse du format)
+_sha256 = hashlib.sha256
+_U32_LE = struct.Struct('<I')
+
+# Noyau natif double SHA-256 par lots (SSE4.1/AVX2), optionnel: python3 sha256d_build.py
+try:
+    from _sha256d_batch import ffi as _sha256d_ffi, lib as _sha256d_lib
+    _sha256d_lib.sha256d_init()
+    SHA256D_BACKEND = _sha256d_ffi.string(_sha256d_lib.sha256d_backend()).decode()
+except ImportError:
+    _sha256d_ffi = _sha256d_lib = None
+    SHA256D_BACKEND = "hashlib"
+
+# Sans noyau natif: balayage compilé par Numba (optionnel, pip3 install numba)
+_numba_miner = None
+if _sha256d_lib is None:
+    try:
+        import _numba_miner
+        SHA256D_BACKEND = "numba"
+    except ImportError:
+        pass
+
+
+def _native_midstate(header_prefix):
+    """État SHA-256 après les 64 premiers octets du header (noyau natif)"""
+    midstate = _sha256d_ffi.new("uint32_t[8]")
+    _sha256d_lib.sha256_midstate(header_prefix, midstate)
+    return midstate
+
+
+# Sérialisation JSON des réponses API: orjson (bytes direct) si disponible
+try:
+    import orjson
+
+    def _json_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_bytes(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def ojson(obj):
+    """Réponse JSON sans passer par jsonify (orjson, repli json stdlib)"""
+    return Response(_json_bytes(obj), mimetype='application/json')
+
+
+def ojson_cached(obj, max_age=1):
+    """Réponse JSON de status: TTL court + ETag faible, 304 si inchangée"""
+    return json_body_cached(_json_bytes(obj), max_age)
+
+
+def json_body_cached(body, max_age=1):
+    """Comme ojson_cached, pour un corps JSON déjà sérialisé"""
+    response = Response(body, mimetype='application/json')
+    response.headers['Cache-Control'] = f'max-age={max_age}'
+    response.set_etag(hashlib.md5(body).hexdigest(), weak=True)
+    return response.make_conditional(request)
+
+
+# Horodatage ISO partagé par les endpoints de status, rafraîchi au plus 1 fois/s
+_ts_lock = threading.Lock()
+_ts_last = time.time()
+_ts_value = datetime.fromtimestamp(_ts_last).isoformat()
+
+
+def now_iso():
+    """Horodatage ISO courant (résolution 1 s, évite datetime.now() par requête)"""
+    global _ts_last, _ts_value
+    t = time.time()
+    if t - _ts_last >= 1.0:
+        with _ts_lock:
+            if t - _ts_last >= 1.0:
+                _ts_value = datetime.fromtimestamp(t).isoformat()
+                _ts_last = t
+    return _ts_value
+
 # ====================================================================
 # 1. SIMULATEUR MEA SIMPLIFIÉ (Sans Qt6)
 # ====================================================================
@@ -36,6 +116,7 @@ class SimpleMEAInterface:
         self.sampling_rate = 25000
         self.is_acquiring = False
         self.data_buffer = []
+        self._rng = np.random.default_rng()
         
     def get_status(self):
         return {
@@ -44,7 +125,7 @@ class SimpleMEAInterface:
             "electrodes": self.electrodes_count,
             "sampling_rate": self.sampling_rate,
             "acquisition_active": self.is_acquiring,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     def start_acquisition(self):
@@ -58,23 +139,21 @@ class SimpleMEAInterface:
     def get_electrode_data(self, electrode_id=None):
         """Génère des données simulées d'électrodes"""
         if electrode_id is None:
-            # Toutes les électrodes
-            data = {}
-            for i in range(self.electrodes_count):
-                data[f"electrode_{i}"] = {
-                    "voltage": round(random.uniform(-100, 100), 2),
-                    "impedance": round(random.uniform(0.5, 3.0), 2),
-                    "noise_level": round(random.uniform(5, 15), 1)
-                }
-            return data
+            # Toutes les électrodes - un tableau par champ, indexé par électrode
+            n = self.electrodes_count
+            return {
+                "voltage": np.round(self._rng.uniform(-100, 100, n), 2).tolist(),
+                "impedance": np.round(self._rng.uniform(0.5, 3.0, n), 2).tolist(),
+                "noise_level": np.round(self._rng.uniform(5, 15, n), 1).tolist()
+            }
         else:
             # Électrode spécifique
             return {
                 "electrode_id": electrode_id,
-                "voltage": round(random.uniform(-100, 100), 2), 
-                "impedance": round(random.uniform(0.5, 3.0), 2),
-                "noise_level": round(random.uniform(5, 15), 1),
-                "spikes_detected": random.randint(0, 5)
+                "voltage": round(float(self._rng.uniform(-100, 100)), 2), 
+                "impedance": round(float(self._rng.uniform(0.5, 3.0)), 2),
+                "noise_level": round(float(self._rng.uniform(5, 15)), 1),
+                "spikes_detected": int(self._rng.integers(0, 6))
             }
 
 # ====================================================================  
@@ -84,12 +163,20 @@ class SimpleMEAInterface:
 class SimpleBitcoinMiner:
     """Mineur Bitcoin simplifié pour démonstration"""
     
-    def __init__(self):
+    def __init__(self, threaded_ticks=True):
         self.mining_active = False
         self.hashrate = 0
         self.blocks_found = 0
         self.total_hashes = 0
         
+        self._rng = np.random.default_rng()
+        
+        # Compteurs simulés avancés par un thread unique à 1 Hz (pas par les GET);
+        # threaded_ticks=False: l'appelant appelle step() lui-même (boucle asyncio)
+        self._threaded_ticks = threaded_ticks
+        self._stop_event = threading.Event()
+        self._tick_thread = None
+        
         # Bloc Bitcoin Genesis pour tests
         self.genesis_block = {
             "version": 1,
@@ -100,61 +187,212 @@ class SimpleBitcoinMiner:
             "target_nonce": 2083236893,
             "target_hash": "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f"
         }
+        
+        # Préfixe header invariant pendant un balayage de nonce (76 octets)
+        self._header_prefix = self.build_header_prefix(self.genesis_block)
+        # Midstate du premier bloc SHA-256 (octets 0-63) + queue (octets 64-75)
+        self._midstate = _native_midstate(self._header_prefix) if _sha256d_lib is not None else None
+        self._header_tail = self._header_prefix[64:76]
+        # Même midstate côté hashlib: objet sha256 à copier pour chaque nonce
+        self._sha_midstate = _sha256(self._header_prefix[:64])
+        self._numba_genesis_job = None
+        # Hash Genesis attendu en octets bruts (comparaison sans hex)
+        self._target_bytes = bytes.fromhex(self.genesis_block['target_hash'])
+    
+    @staticmethod
+    def build_header_prefix(block_data):
+        """Construit les 76 premiers octets du header (tout sauf le nonce)"""
+        return (_U32_LE.pack(block_data['version'])
+                + bytes.fromhex(block_data['previous_hash'])[::-1]
+                + bytes.fromhex(block_data['merkle_root'])[::-1]
+                + _U32_LE.pack(block_data['timestamp'])
+                + _U32_LE.pack(block_data['bits']))
     
-    def calculate_bitcoin_hash(self, block_data, nonce):
-        """Calcul hash Bitcoin (double SHA-256)"""
-        # Construction header du bloc
-        header = struct.pack('<I', block_data['version'])
-        header += bytes.fromhex(block_data['previous_hash'])[::-1]
-        header += bytes.fromhex(block_data['merkle_root'])[::-1] 
-        header += struct.pack('<I', block_data['timestamp'])
-        header += struct.pack('<I', block_data['bits'])
-        header += struct.pack('<I', nonce)
-        
-        # Double SHA-256
-        hash1 = hashlib.sha256(header).digest()
-        hash2 = hashlib.sha256(hash1).digest()
-        return hash2[::-1].hex()
+    def calculate_bitcoin_hash(self, nonce, header_prefix=None):
+        """Calcul hash Bitcoin (double SHA-256)
+        
+        Seul le nonce varie d'un candidat à l'autre: le préfixe de 76 octets
+        est précalculé (par défaut celui du bloc Genesis).
+        """
+        return self.bitcoin_hash_bytes(nonce, header_prefix).hex()
+    
+    def bitcoin_hash_bytes(self, nonce, header_prefix=None):
+        """Hash Bitcoin brut (32 octets, ordre d'affichage big-endian)"""
+        if header_prefix is None:
+            header_prefix = self._header_prefix
+        sha_midstate, block = self._hashlib_job(header_prefix)
+        _U32_LE.pack_into(block, 12, nonce)
+        
+        # Double SHA-256: seul le second bloc (octets 64-79) est haché
+        hash1 = sha_midstate.copy()
+        hash1.update(block)
+        return _sha256(hash1.digest()).digest()[::-1]
+    
+    def _hashlib_job(self, header_prefix):
+        """(sha256 après les octets 0-63, second bloc préalloué octets 64-79) du préfixe"""
+        block = bytearray(16)
+        block[:12] = header_prefix[64:76]
+        if header_prefix is self._header_prefix:
+            return self._sha_midstate, block
+        return _sha256(header_prefix[:64]), block
+    
+    @staticmethod
+    def bits_to_target(bits):
+        """Cible 256 bits à partir du champ compact 'bits' du header"""
+        exponent = bits >> 24
+        mantissa = bits & 0x007fffff
+        return mantissa << (8 * (exponent - 3))
+    
+    def _native_job(self, header_prefix):
+        """(midstate, queue) du préfixe pour le noyau natif"""
+        if header_prefix is self._header_prefix:
+            return self._midstate, self._header_tail
+        return _native_midstate(header_prefix), header_prefix[64:76]
+    
+    def _numba_job(self, header_prefix):
+        """(midstate, queue) du préfixe pour le repli Numba (Genesis préparé une fois)"""
+        if header_prefix is not self._header_prefix:
+            return _numba_miner.prepare(header_prefix)
+        if self._numba_genesis_job is None:
+            self._numba_genesis_job = _numba_miner.prepare(header_prefix)
+        return self._numba_genesis_job
+    
+    def scan_nonces(self, start_nonce, count, header_prefix=None):
+        """Balaye [start_nonce, start_nonce + count) et retourne (nonce, hash) du plus petit hash"""
+        if header_prefix is None:
+            header_prefix = self._header_prefix
+        count = max(0, min(count, 0x100000000 - start_nonce))
+        if count == 0:
+            return None, None
+        
+        if _sha256d_lib is not None:
+            midstate, tail = self._native_job(header_prefix)
+            best_hash = _sha256d_ffi.new("uint8_t[32]")
+            nonce = _sha256d_lib.sha256d_80_scan_best(midstate, tail, start_nonce, count, best_hash)
+            return nonce, _sha256d_ffi.buffer(best_hash)[:][::-1].hex()
+        
+        # Repli pur Python (hashlib): midstate copié, nonce écrit en place dans le second bloc
+        sha_midstate, block = self._hashlib_job(header_prefix)
+        copy_midstate = sha_midstate.copy
+        pack_nonce = _U32_LE.pack_into
+        # Comparaison sur les octets bruts; hex seulement pour le résultat
+        best_nonce, best_hash = None, b'\xff' * 33
+        for nonce in range(start_nonce, start_nonce + count):
+            pack_nonce(block, 12, nonce)
+            hash1 = copy_midstate()
+            hash1.update(block)
+            block_hash = _sha256(hash1.digest()).digest()[::-1]
+            if block_hash < best_hash:
+                best_nonce, best_hash = nonce, block_hash
+        return best_nonce, best_hash.hex()
+    
+    def find_nonce(self, start_nonce, count, target=None, header_prefix=None):
+        """Premier (nonce, hash) de [start_nonce, start_nonce + count) sous la cible, sinon None
+        
+        Le noyau natif rejette les candidats sur le mot de poids fort du hash;
+        les rares survivants sont comparés à la cible complète ici.
+        """
+        if header_prefix is None:
+            header_prefix = self._header_prefix
+        if target is None:
+            target = self.bits_to_target(self.genesis_block['bits'])
+        end = min(start_nonce + count, 0x100000000)
+        # Cible en 32 octets big-endian: même ordre que les hashes bruts
+        target_bytes = target.to_bytes(32, 'big')
+        
+        if _sha256d_lib is not None:
+            midstate, tail = self._native_job(header_prefix)
+            target_hi = min(target >> 224, 0xffffffff)
+            nonce_out = _sha256d_ffi.new("uint32_t *")
+            hash_out = _sha256d_ffi.new("uint8_t[32]")
+            nonce = start_nonce
+            while nonce < end and _sha256d_lib.sha256d_80_find_nonce(
+                    midstate, tail, nonce, end - nonce, target_hi, nonce_out, hash_out):
+                block_hash = _sha256d_ffi.buffer(hash_out)[:][::-1]
+                if block_hash <= target_bytes:
+                    return nonce_out[0], block_hash.hex()
+                nonce = nonce_out[0] + 1
+            return None
+        
+        if _numba_miner is not None:
+            job = self._numba_job(header_prefix)
+            target_hi = min(target >> 224, 0xffffffff)
+            nonce = start_nonce
+            while nonce < end:
+                found = _numba_miner.find_nonce(job, nonce, end - nonce, target_hi)
+                if found is None:
+                    return None
+                block_hash = self.bitcoin_hash_bytes(found, header_prefix)
+                if block_hash <= target_bytes:
+                    return found, block_hash.hex()
+                nonce = found + 1
+            return None
+        
+        # Repli pur Python (hashlib): midstate copié, nonce écrit en place dans le second bloc
+        sha_midstate, block = self._hashlib_job(header_prefix)
+        copy_midstate = sha_midstate.copy
+        pack_nonce = _U32_LE.pack_into
+        for nonce in range(start_nonce, end):
+            pack_nonce(block, 12, nonce)
+            hash1 = copy_midstate()
+            hash1.update(block)
+            block_hash = _sha256(hash1.digest()).digest()[::-1]
+            if block_hash <= target_bytes:
+                return nonce, block_hash.hex()
+        return None
+    
+    def step(self):
+        """Avance les compteurs simulés d'une seconde"""
+        self.total_hashes += int(self._rng.integers(100, 501))
+        
+        # Simulation découverte de bloc (très rare)
+        if self._rng.random() < 0.001:  # 0.1% chance
+            self.blocks_found += 1
+    
+    def _tick(self, stop_event):
+        """Avance les compteurs simulés une fois par seconde jusqu'à l'arrêt"""
+        while not stop_event.wait(1.0):
+            self.step()
     
     def start_mining(self):
         """Démarre le mining simulé"""
         self.mining_active = True
-        self.hashrate = random.randint(1000, 5000)  # H/s simulé
+        self.hashrate = int(self._rng.integers(1000, 5001))  # H/s simulé
+        if self._threaded_ticks and (self._tick_thread is None or not self._tick_thread.is_alive()):
+            self._stop_event = threading.Event()
+            self._tick_thread = threading.Thread(target=self._tick, args=(self._stop_event,), daemon=True)
+            self._tick_thread.start()
         return {"success": True, "message": "Mining démarré", "hashrate": self.hashrate}
     
     def stop_mining(self):
         """Arrête le mining"""
         self.mining_active = False
         self.hashrate = 0
+        self._stop_event.set()
+        self._tick_thread = None
         return {"success": True, "message": "Mining arrêté"}
     
     def get_mining_status(self):
-        """Status du mining"""
-        if self.mining_active:
-            self.total_hashes += random.randint(100, 500)
-            
-            # Simulation découverte de bloc (très rare)
-            if random.random() < 0.001:  # 0.1% chance
-                self.blocks_found += 1
-        
+        """Status du mining (lecture seule)"""
         return {
             "active": self.mining_active,
             "hashrate": self.hashrate,
             "total_hashes": self.total_hashes, 
             "blocks_found": self.blocks_found,
             "current_difficulty": 84381461788.35, 
-            "estimated_time_to_block": "~142 years" if self.mining_active else "N/A"
+            "estimated_time_to_block": "~142 years" if self.mining_active else "N/A",
+            "hash_backend": SHA256D_BACKEND
         }
     
     def test_genesis_validation(self):
         """Test validation bloc Genesis"""
-        correct_hash = self.calculate_bitcoin_hash(self.genesis_block, self.genesis_block['target_nonce'])
-        is_valid = correct_hash == self.genesis_block['target_hash']
+        correct_hash = self.bitcoin_hash_bytes(self.genesis_block['target_nonce'])
+        is_valid = correct_hash == self._target_bytes
         
         return {
             "block": "Genesis Block",
             "nonce": self.genesis_block['target_nonce'],
-            "calculated_hash": correct_hash,
+            "calculated_hash": correct_hash.hex(),
             "expected_hash": self.genesis_block['target_hash'],
             "valid": is_valid,
             "test_time": datetime.now().isoformat()
@@ -481,6 +719,9 @@ HTML_TEMPLATE = """
         let updateInterval;
         let acquisitionActive = false;
         let miningActive = false;
+        const electrodeNodes = [];              // Références DOM des 64 électrodes
+        const electrodeActive = new Uint8Array(64);
+        const electrodeVoltage = new Float32Array(64);  // Derniers voltages servis (μV)
         
         // Initialisation
         document.addEventListener('DOMContentLoaded', function() {
@@ -493,6 +734,7 @@ HTML_TEMPLATE = """
         function generateElectrodeGrid() {
             const grid = document.getElementById('electrode-grid');
             grid.innerHTML = '';
+            electrodeNodes.length = 0;
             
             for (let i = 0; i < 64; i++) {
                 const electrode = document.createElement('div');
@@ -501,6 +743,7 @@ HTML_TEMPLATE = """
                 electrode.id = `electrode-${i}`;
                 electrode.onclick = () => showElectrodeDetails(i);
                 grid.appendChild(electrode);
+                electrodeNodes.push(electrode);
             }
         }
         
@@ -508,9 +751,7 @@ HTML_TEMPLATE = """
         function startRealTimeUpdates() {
             updateInterval = setInterval(async () => {
                 try {
-                    await updateMEAStatus();
-                    await updateMiningStatus();
-                    updateElectrodes();
+                    await updateState();
                     updateTimestamp();
                 } catch (error) {
                     console.error('Erreur mise à jour:', error);
@@ -518,58 +759,67 @@ HTML_TEMPLATE = """
             }, 2000);
         }
         
-        // Mise à jour MEA
-        async function updateMEAStatus() {
+        // Status MEA + Mining en une seule requête
+        async function updateState() {
             try {
-                const response = await fetch('/api/mea/status');
+                const response = await fetch('/api/state');
                 const data = await response.json();
                 
-                document.getElementById('mea-status').textContent = data.status === 'connected' ? 'Connecté' : 'Déconnecté';
-                document.getElementById('mea-electrodes').textContent = data.electrodes;
-                document.getElementById('mea-acquisition').textContent = data.acquisition_active ? 'Active' : 'Arrêtée';
-                
-                const led = document.getElementById('mea-status-led');
-                led.className = `status-indicator ${data.status === 'connected' ? 'status-connected' : 'status-disconnected'}`;
+                renderMEAStatus(data.mea);
+                renderMiningStatus(data.mining);
+                updateElectrodes(data.electrodes);
                 
             } catch (error) {
-                log('❌ Erreur MEA: ' + error.message);
+                log('❌ Erreur status: ' + error.message);
             }
         }
         
-        // Mise à jour Mining
-        async function updateMiningStatus() {
-            try {
-                const response = await fetch('/api/mining/status');
-                const data = await response.json();
-                
-                document.getElementById('mining-status').textContent = data.active ? 'Actif' : 'Arrêté';
-                document.getElementById('hashrate').textContent = data.hashrate.toLocaleString() + ' H/s';
-                document.getElementById('total-hashes').textContent = data.total_hashes.toLocaleString();
-                document.getElementById('blocks-found').textContent = data.blocks_found;
-                document.getElementById('time-estimate').textContent = data.estimated_time_to_block;
-                
-                const led = document.getElementById('mining-status-led');
-                led.className = `status-indicator ${data.active ? 'status-mining' : 'status-disconnected'}`;
-                
-            } catch (error) {
-                log('❌ Erreur Mining: ' + error.message);
-            }
+        // Affichage MEA
+        function renderMEAStatus(data) {
+            document.getElementById('mea-status').textContent = data.status === 'connected' ? 'Connecté' : 'Déconnecté';
+            document.getElementById('mea-electrodes').textContent = data.electrodes;
+            document.getElementById('mea-acquisition').textContent = data.acquisition_active ? 'Active' : 'Arrêtée';
+            
+            const led = document.getElementById('mea-status-led');
+            led.className = `status-indicator ${data.status === 'connected' ? 'status-connected' : 'status-disconnected'}`;
+        }
+        
+        // Affichage Mining
+        function renderMiningStatus(data) {
+            document.getElementById('mining-status').textContent = data.active ? 'Actif' : 'Arrêté';
+            document.getElementById('hashrate').textContent = data.hashrate.toLocaleString() + ' H/s';
+            document.getElementById('total-hashes').textContent = data.total_hashes.toLocaleString();
+            document.getElementById('blocks-found').textContent = data.blocks_found;
+            document.getElementById('time-estimate').textContent = data.estimated_time_to_block;
+            
+            const led = document.getElementById('mining-status-led');
+            led.className = `status-indicator ${data.active ? 'status-mining' : 'status-disconnected'}`;
         }
         
         // Mise à jour électrodes
-        function updateElectrodes() {
-            const activeCount = Math.floor(Math.random() * 15) + 45; // 45-60 actives
-            document.getElementById('active-signals').textContent = activeCount;
-            document.getElementById('spikes-detected').textContent = Math.floor(Math.random() * 25);
+        // Électrodes: tableaux par champ (voltage[i], impedance[i], noise_level[i])
+        function updateElectrodes(data) {
+            const voltage = data.voltage;
+            let activeCount = 0;
+            let spikes = 0;
             
-            // Animation électrodes
+            // Carte d'activité calculée hors DOM (au-delà de voltage.length: inactives)
             for (let i = 0; i < 64; i++) {
-                const electrode = document.getElementById(`electrode-${i}`);
-                if (electrode) {
-                    const isActive = Math.random() > 0.3;
-                    electrode.className = isActive ? 'electrode active' : 'electrode';
-                }
+                electrodeVoltage[i] = i < voltage.length ? voltage[i] : 0;
+                const v = Math.abs(electrodeVoltage[i]);
+                electrodeActive[i] = v > 30 ? 1 : 0;
+                activeCount += electrodeActive[i];
+                if (v > 80) spikes++;
             }
+            
+            // Écritures DOM regroupées dans une seule frame, sur les nœuds en cache
+            requestAnimationFrame(() => {
+                for (let i = 0; i < electrodeNodes.length; i++) {
+                    electrodeNodes[i].classList.toggle('active', electrodeActive[i] === 1);
+                }
+                document.getElementById('active-signals').textContent = activeCount;
+                document.getElementById('spikes-detected').textContent = spikes;
+            });
         }
         
         // Fonctions de contrôle
@@ -636,9 +886,7 @@ HTML_TEMPLATE = """
         // Fonctions utilitaires
         function refreshAll() {
             log('🔄 Actualisation complète...');
-            updateMEAStatus();
-            updateMiningStatus();
-            updateElectrodes();
+            updateState();
         }
         
         function exportData() {
@@ -662,7 +910,7 @@ HTML_TEMPLATE = """
         }
         
         function showElectrodeDetails(id) {
-            log(`🔍 Électrode ${id}: ${Math.random() > 0.5 ? 'Active' : 'Inactive'} | ${(Math.random() * 100).toFixed(1)} μV`);
+            log(`🔍 Électrode ${id}: ${electrodeActive[id] ? 'Active' : 'Inactive'} | ${Math.abs(electrodeVoltage[id]).toFixed(1)} μV`);
         }
         
         function updateTimestamp() {
@@ -688,6 +936,13 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Page principale précalculée: le template n'a aucune variable, il est
+# encodé et compressé une seule fois à l'import
+_INDEX_HTML = HTML_TEMPLATE.encode('utf-8')
+_INDEX_HTML_GZ = gzip.compress(_INDEX_HTML, 6)
+_INDEX_ETAG = hashlib.sha1(_INDEX_HTML).hexdigest()
+_INDEX_CACHE_CONTROL = 'public, max-age=3600'
+
 # ====================================================================
 # 5. ROUTES WEB API
 # ====================================================================
@@ -695,67 +950,132 @@ HTML_TEMPLATE = """
 @app.route('/')
 def index():
     """Page principale"""
-    return render_template_string(HTML_TEMPLATE)
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = Response(_INDEX_HTML_GZ, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(_INDEX_ETAG + '-gz')
+    else:
+        response = Response(_INDEX_HTML, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    response.headers['Cache-Control'] = _INDEX_CACHE_CONTROL
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
+
+@app.route('/api/state')
+def state():
+    """Status MEA + mining + électrodes en une seule réponse (endpoint sondé par l'interface)"""
+    return ojson_cached({
+        "mea": mea_interface.get_status(),
+        "mining": bitcoin_miner.get_mining_status(),
+        "electrodes": mea_interface.get_electrode_data()
+    })
 
 @app.route('/api/mea/status')
 def mea_status():
-    """Status interface MEA"""
-    return jsonify(mea_interface.get_status())
+    """Status interface MEA (déprécié: préférer /api/state)"""
+    return ojson_cached(mea_interface.get_status())
 
 @app.route('/api/mea/start', methods=['POST'])  
 def mea_start():
     """Démarrer acquisition MEA"""
-    return jsonify(mea_interface.start_acquisition())
+    return ojson(mea_interface.start_acquisition())
 
 @app.route('/api/mea/stop', methods=['POST'])
 def mea_stop():
     """Arrêter acquisition MEA"""
-    return jsonify(mea_interface.stop_acquisition())
+    return ojson(mea_interface.stop_acquisition())
 
 @app.route('/api/mea/electrodes')
 def mea_electrodes():
     """Données électrodes"""
     electrode_id = request.args.get('id', type=int)
-    return jsonify(mea_interface.get_electrode_data(electrode_id))
+    return ojson(mea_interface.get_electrode_data(electrode_id))
 
 @app.route('/api/mining/status')
 def mining_status():
-    """Status mining Bitcoin"""
-    return jsonify(bitcoin_miner.get_mining_status())
+    """Status mining Bitcoin (déprécié: préférer /api/state)"""
+    return ojson_cached(bitcoin_miner.get_mining_status())
 
 @app.route('/api/mining/start', methods=['POST'])
 def mining_start():
     """Démarrer mining"""
-    return jsonify(bitcoin_miner.start_mining())
+    return ojson(bitcoin_miner.start_mining())
 
 @app.route('/api/mining/stop', methods=['POST'])  
 def mining_stop():
     """Arrêter mining"""
-    return jsonify(bitcoin_miner.stop_mining())
+    return ojson(bitcoin_miner.stop_mining())
 
 @app.route('/api/mining/test-genesis')
 def test_genesis():
     """Test validation bloc Genesis"""
-    return jsonify(bitcoin_miner.test_genesis_validation())
+    return ojson(bitcoin_miner.test_genesis_validation())
 
-@app.route('/health')
-def health_check():
-    """Health check pour monitoring"""
-    return jsonify({
+# Corps /health pré-sérialisé par état MEA: seul l'horodatage est inséré par requête
+_HEALTH_PREFIX = {
+    connected: _json_bytes({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
         "version": "1.0.0-cloudshell",
         "components": {
-            "mea": mea_interface.connected,
+            "mea": connected,
             "mining": True,
             "web_interface": True
         }
-    })
+    })[:-1] + b',"timestamp":"'
+    for connected in (True, False)
+}
+_HEALTH_SUFFIX = b'"}'
+
+@app.route('/health')
+def health_check():
+    """Health check pour monitoring"""
+    return json_body_cached(
+        _HEALTH_PREFIX[bool(mea_interface.connected)] + now_iso().encode('ascii') + _HEALTH_SUFFIX
+    )
+
+def create_app():
+    """Fabrique WSGI (gunicorn: simple_biomining_demo:create_app())"""
+    return app
 
 # ====================================================================
 # 6. POINT D'ENTRÉE
 # ====================================================================
 
+
+def run_server(host, port):
+    """Lance le serveur: ASGI (uvicorn) par défaut, sinon gunicorn, sinon Flask
+
+    BIOMINING_SERVER=flask force la version Flask (compatibilité). Les
+    simulateurs MEA/mining vivent dans le processus: un seul worker par
+    défaut, WEB_WORKERS pour en ajouter.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    workers = os.environ.get('WEB_WORKERS', '1')
+    if (os.environ.get('BIOMINING_SERVER', 'asgi') == 'asgi'
+            and importlib.util.find_spec('fastapi') is not None
+            and importlib.util.find_spec('uvicorn') is not None):
+        # uvloop / httptools sont choisis automatiquement par uvicorn si installés
+        os.execv(sys.executable, [
+            sys.executable, '-m', 'uvicorn',
+            '--app-dir', here,
+            '--workers', workers,
+            '--host', host,
+            '--port', str(port),
+            'simple_biomining_asgi:app'
+        ])
+    if importlib.util.find_spec('gunicorn') is not None:
+        threads = os.environ.get('WEB_THREADS', str(max(4, os.cpu_count() or 1)))
+        os.execv(sys.executable, [
+            sys.executable, '-m', 'gunicorn',
+            '--chdir', here,
+            '-w', workers,
+            '-k', 'gthread',
+            '--threads', threads,
+            '-b', f'{host}:{port}',
+            'simple_biomining_demo:create_app()'
+        ])
+    app.run(host=host, port=port, debug=False, threaded=True)
+
 if __name__ == '__main__':
     print("🧬 BioMining Platform - Version Cloud Shell")
     print("==========================================")
@@ -771,4 +1091,4 @@ if __name__ == '__main__':
     print(f"🌐 Interface: http://localhost:{port}")
     print("")
     
-    app.run(host=host, port=port, debug=False, threaded=True)
\ No newline at end of file
+    run_server(host, port)
\ No newline at end of file
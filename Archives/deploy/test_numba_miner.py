@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Vérification du repli Numba (_numba_miner.find_nonce) contre hashlib
+
+Les plages testées encadrent la tranche de balayage (CHUNK nonces par appel
+du noyau avec un seul thread): CHUNK - 1, CHUNK et CHUNK + 1 nonces, le nonce
+gagnant étant le dernier de la plage (dernière tranche). La boucle de reprise
+de SimpleBitcoinMiner.find_nonce côté Numba (faux positif du mot de poids
+fort) est vérifiée sur les mêmes plages.
+
+Usage:
+    pip3 install numba   # sinon le test est ignoré
+    python3 test_numba_miner.py
+"""
+
+import hashlib
+import os
+import struct
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+numba = pytest.importorskip("numba")
+
+import _numba_miner
+import simple_biomining_demo as demo
+
+CHUNK = _numba_miner.CHUNK
+
+# Base des plages: loin de 0 et de 0xffffffff
+BASE_NONCE = 0x40000000
+
+
+def _hash_values(prefix, start, count):
+    """Hashes hashlib (entiers 256 bits, ordre d'affichage) de [start, start + count)"""
+    midstate = hashlib.sha256(prefix[:64])
+    block = bytearray(prefix[64:76] + bytes(4))
+    values = []
+    for nonce in range(start, start + count):
+        struct.pack_into('<I', block, 12, nonce)
+        hash1 = midstate.copy()
+        hash1.update(block)
+        values.append(int.from_bytes(hashlib.sha256(hash1.digest()).digest(), 'little'))
+    return values
+
+
+@lru_cache(maxsize=None)
+def _last_nonce_winner(prefix):
+    """(nonce, hash) strictement plus petit que les CHUNK + 1 nonces qui le précèdent
+
+    Une plage qui se termine sur ce nonce n'a qu'un seul candidat pour la cible
+    égale à son hash: lui-même, dans la dernière tranche.
+    """
+    span = CHUNK + 1
+    start = BASE_NONCE
+    previous = _hash_values(prefix, start, span)
+    while True:
+        current = _hash_values(prefix, start + span, span)
+        if min(current) < min(previous):
+            index = current.index(min(current))
+            window = previous[index + 1:] + current[:index]
+            # Strict aussi sur le mot de poids fort, seul comparé par le noyau
+            assert min(value >> 224 for value in window) > current[index] >> 224
+            return start + span + index, current[index]
+        start += span
+        previous = current
+
+
+@contextmanager
+def _single_thread():
+    """Un seul thread Numba: une tranche de balayage = CHUNK nonces exactement"""
+    saved = numba.get_num_threads()
+    numba.set_num_threads(1)
+    try:
+        yield
+    finally:
+        numba.set_num_threads(saved)
+
+
+@contextmanager
+def _numba_fallback():
+    """SimpleBitcoinMiner sans noyau natif: chemin Numba"""
+    saved = demo._sha256d_lib, demo._numba_miner
+    demo._sha256d_lib, demo._numba_miner = None, _numba_miner
+    try:
+        yield
+    finally:
+        demo._sha256d_lib, demo._numba_miner = saved
+
+
+def test_numba_find_nonce():
+    prefix = demo.SimpleBitcoinMiner.build_header_prefix(demo.bitcoin_miner.genesis_block)
+    job = _numba_miner.prepare(prefix)
+    winner, winner_hash = _last_nonce_winner(prefix)
+    winner_hi = winner_hash >> 224
+
+    with _single_thread():
+        for count in (CHUNK - 1, CHUNK, CHUNK + 1):
+            start = winner - count + 1
+            assert _numba_miner.find_nonce(job, start, count, winner_hi) == winner, f"count={count}"
+            assert _numba_miner.find_nonce(job, start, count, winner_hi - 1) is None, f"count={count}"
+            assert _numba_miner.find_nonce(job, start, count, 0xffffffff) == start, f"count={count}"
+            # Plage arrêtée juste avant le gagnant: rien ne passe
+            assert _numba_miner.find_nonce(job, start, count - 1, winner_hi) is None, f"count={count}"
+    print(f"✅ _numba_miner.find_nonce: identique à hashlib autour de CHUNK={CHUNK}")
+
+
+def test_miner_numba_fallback():
+    miner = demo.SimpleBitcoinMiner(threaded_ticks=False)
+    prefix = miner._header_prefix
+    winner, winner_hash = _last_nonce_winner(prefix)
+
+    with _numba_fallback(), _single_thread():
+        for count in (CHUNK - 1, CHUNK, CHUNK + 1):
+            start = winner - count + 1
+            # Cible exacte: le gagnant; juste en dessous: faux positif rejeté, fin de plage
+            assert miner.find_nonce(start, count, winner_hash) == (winner, f"{winner_hash:064x}")
+            assert miner.find_nonce(start, count, winner_hash - 1) is None
+    print("✅ SimpleBitcoinMiner (repli Numba): identique à hashlib")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Vérification croisée du noyau double SHA-256 (_sha256d_batch) contre hashlib
+
+Chaque backend compilé et supporté par le CPU (scalar, sse4.1, avx2, shani) est
+forcé tour à tour via sha256d_set_backend(), puis comparé à
+hashlib.sha256(hashlib.sha256(header).digest()): header Genesis, headers et
+nonces aléatoires, lots qui débordent 0xffffffff. Le repli hashlib de
+SimpleBitcoinMiner (scan_nonces / find_nonce) est vérifié de la même façon.
+
+find_nonce est aussi éprouvé sur des cibles dérivées des plus petits hashes
+de la plage: mot de poids fort égal mais cible complète dépassée (le rejet
+anticipé laisse passer le candidat, la boucle de reprise Python doit le
+rejeter et continuer) et cible exactement égale au hash.
+
+Usage:
+    python3 sha256d_build.py   # optionnel: sans noyau, seuls les tests hashlib tournent
+    python3 test_sha256d_batch.py
+"""
+
+import hashlib
+import os
+import random
+import struct
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import simple_biomining_demo as demo
+
+try:
+    from _sha256d_batch import ffi, lib
+except ImportError:
+    ffi = lib = None
+
+GENESIS_NONCE = 2083236893
+GENESIS_HASH = "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f"
+
+
+def _reference_hash(prefix, nonce):
+    """Double SHA-256 hashlib du header complet (ordre digest)"""
+    header = prefix + struct.pack('<I', nonce & 0xffffffff)
+    return hashlib.sha256(hashlib.sha256(header).digest()).digest()
+
+
+def _random_prefixes(rng, count):
+    return [rng.randbytes(76) for _ in range(count)]
+
+
+@contextmanager
+def _forced_backend(name):
+    """Force le backend natif pendant le bloc; pytest.skip s'il n'est pas supporté"""
+    if lib is None:
+        pytest.skip("noyau _sha256d_batch non compilé (python3 sha256d_build.py)")
+    previous = ffi.string(lib.sha256d_backend())
+    if not lib.sha256d_set_backend(name.encode()):
+        pytest.skip(f"backend {name} non supporté par ce CPU")
+    try:
+        yield
+    finally:
+        lib.sha256d_set_backend(previous)
+
+
+@contextmanager
+def _hashlib_fallback():
+    """SimpleBitcoinMiner sans noyau natif ni Numba: chemin pur Python"""
+    saved = demo._sha256d_lib, demo._numba_miner
+    demo._sha256d_lib = demo._numba_miner = None
+    try:
+        yield
+    finally:
+        demo._sha256d_lib, demo._numba_miner = saved
+
+
+def _native_batch(prefix, base_nonce, n):
+    """Hashes natifs de [base_nonce, base_nonce + n) (nonce sur 32 bits, déborde)"""
+    midstate = demo._native_midstate(prefix)
+    out = ffi.new("uint8_t[]", 32 * n)
+    lib.sha256d_80_batch(midstate, prefix[64:76], base_nonce, n, out)
+    raw = ffi.buffer(out)[:]
+    return [raw[32 * i:32 * i + 32] for i in range(n)]
+
+
+def _native_scan_best(prefix, base_nonce, n):
+    midstate = demo._native_midstate(prefix)
+    best_hash = ffi.new("uint8_t[32]")
+    nonce = lib.sha256d_80_scan_best(midstate, prefix[64:76], base_nonce, n, best_hash)
+    return nonce, ffi.buffer(best_hash)[:]
+
+
+def _native_find(prefix, base_nonce, n, target_hi):
+    """(nonce, hash) du premier candidat du rejet anticipé natif, sinon None"""
+    midstate = demo._native_midstate(prefix)
+    nonce_out = ffi.new("uint32_t *")
+    hash_out = ffi.new("uint8_t[32]")
+    if not lib.sha256d_80_find_nonce(midstate, prefix[64:76], base_nonce, n, target_hi, nonce_out, hash_out):
+        return None
+    return nonce_out[0], ffi.buffer(hash_out)[:]
+
+
+def _hash_values(prefix, start, end):
+    """{nonce: hash en entier 256 bits (ordre d'affichage)} de [start, end)"""
+    return {nonce: int.from_bytes(_reference_hash(prefix, nonce), 'little') for nonce in range(start, end)}
+
+
+def _find_targets(values):
+    """Cibles autour des trois plus petits hashes: juste en dessous (même mot de
+    poids fort, cible complète manquée), égale, et mot de poids fort seul"""
+    targets = []
+    for value in sorted(set(values.values()))[:3]:
+        targets += [value - 1, value, (value >> 224) << 224]
+    return targets
+
+
+def _first_below(values, target):
+    """Boucle de référence: premier nonce dont le hash est <= target"""
+    return next((nonce for nonce, value in values.items() if value <= target), None)
+
+
+def _check_find_nonce(prefix, base_nonce, n):
+    values = _hash_values(prefix, base_nonce, base_nonce + n)
+    for target in _find_targets(values):
+        target_hi = target >> 224
+        expected = next((nonce for nonce, value in values.items() if value >> 224 <= target_hi), None)
+        found = _native_find(prefix, base_nonce, n, target_hi)
+        assert found == (expected, _reference_hash(prefix, expected)), \
+            f"find_nonce [{base_nonce:#x}, +{n}) cible {target:#066x}"
+    # Le rejet anticipé laisse passer un candidat que la cible complète refuse
+    below_min = min(values.values()) - 1
+    assert _native_find(prefix, base_nonce, n, below_min >> 224) is not None
+    assert _first_below(values, below_min) is None
+
+
+def _check_batch(prefix, base_nonce, n):
+    expected = [_reference_hash(prefix, base_nonce + i) for i in range(n)]
+    assert _native_batch(prefix, base_nonce, n) == expected, \
+        f"lot [{base_nonce:#x}, +{n}) différent de hashlib"
+
+    # Plus petit hash en ordre d'affichage (digest inversé), premier nonce en cas d'égalité
+    best = min(range(n), key=lambda i: expected[i][::-1])
+    nonce, best_hash = _native_scan_best(prefix, base_nonce, n)
+    assert (nonce, best_hash) == ((base_nonce + best) & 0xffffffff, expected[best])
+
+
+def _check_backend(name):
+    rng = random.Random(f"sha256d-{name}")
+    genesis = demo.bitcoin_miner.build_header_prefix(demo.bitcoin_miner.genesis_block)
+    with _forced_backend(name):
+        # Genesis: le lot contient le nonce gagnant
+        _check_batch(genesis, GENESIS_NONCE - 13, 29)
+        assert _native_batch(genesis, GENESIS_NONCE, 1)[0][::-1].hex() == GENESIS_HASH
+
+        # Headers et nonces aléatoires, tailles non multiples du nombre de voies
+        for prefix in _random_prefixes(rng, 16):
+            _check_batch(prefix, rng.getrandbits(32), rng.randrange(1, 40))
+
+        # Rejet anticipé sur le mot de poids fort (plages de 1 à 3 lots AVX2 + reste)
+        for prefix in _random_prefixes(rng, 8):
+            _check_find_nonce(prefix, rng.getrandbits(31), rng.randrange(1, 30))
+
+        # Débordement du nonce: 0xfffffff0 ... 0xffffffff puis 0, 1, ...
+        for prefix in _random_prefixes(rng, 2):
+            _check_batch(prefix, 0xfffffff0, 37)
+    print(f"✅ backend {name}: identique à hashlib")
+
+
+def test_scalar_backend():
+    _check_backend("scalar")
+
+
+def test_sse41_backend():
+    _check_backend("sse4.1")
+
+
+def test_avx2_backend():
+    _check_backend("avx2")
+
+
+def _cpu_flags():
+    """Drapeaux CPU de /proc/cpuinfo (ensemble vide hors Linux)"""
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def test_shani_backend():
+    """SHA-NI 2 voies: mêmes vérifications, plus des tailles impaires (dernière voie seule)"""
+    if "sha_ni" not in _cpu_flags():
+        pytest.skip("CPU sans extensions SHA (sha_ni)")
+    _check_backend("shani")
+
+    rng = random.Random("sha256d-shani-odd")
+    with _forced_backend("shani"):
+        for n in (1, 3, 5, 7, 9, 31):
+            prefix = rng.randbytes(76)
+            _check_batch(prefix, rng.getrandbits(32), n)
+            _check_batch(prefix, 0xffffffff - n // 2, n)
+            _check_find_nonce(prefix, rng.getrandbits(31), n)
+    print("✅ backend shani (tailles impaires): identique à hashlib")
+
+
+def _check_miner_scan(miner, rng):
+    """scan_nonces / find_nonce de SimpleBitcoinMiner contre une boucle hashlib"""
+    genesis = miner._header_prefix
+    found = miner.find_nonce(GENESIS_NONCE - 1000, 2000)
+    assert found == (GENESIS_NONCE, GENESIS_HASH)
+
+    for prefix in [genesis] + _random_prefixes(rng, 4):
+        start, count = rng.getrandbits(32), rng.randrange(1, 300)
+        # scan_nonces s'arrête à 0xffffffff (pas de débordement côté API)
+        for start in (start, 0xffffffff - count // 2):
+            end = min(start + count, 0x100000000)
+            hashes = {nonce: _reference_hash(prefix, nonce)[::-1] for nonce in range(start, end)}
+            best = min(hashes, key=lambda nonce: (hashes[nonce], nonce))
+            header_prefix = None if prefix is genesis else prefix
+            assert miner.scan_nonces(start, count, header_prefix) == (best, hashes[best].hex())
+            assert miner.calculate_bitcoin_hash(best, header_prefix) == hashes[best].hex()
+
+    # Reprise après faux positif du rejet anticipé, comparée à une boucle hashlib
+    for prefix in _random_prefixes(rng, 4):
+        start, count = rng.getrandbits(31), rng.randrange(50, 400)
+        values = _hash_values(prefix, start, start + count)
+        for target in _find_targets(values):
+            nonce = _first_below(values, target)
+            expected = None if nonce is None else (nonce, f"{values[nonce]:064x}")
+            assert miner.find_nonce(start, count, target, prefix) == expected, \
+                f"find_nonce [{start:#x}, +{count}) cible {target:#066x}"
+
+
+def test_miner_native():
+    if demo._sha256d_lib is None:
+        pytest.skip("noyau _sha256d_batch non compilé (python3 sha256d_build.py)")
+    _check_miner_scan(demo.SimpleBitcoinMiner(threaded_ticks=False), random.Random("miner-native"))
+    print(f"✅ SimpleBitcoinMiner (noyau {demo.SHA256D_BACKEND}): identique à hashlib")
+
+
+def test_miner_hashlib_fallback():
+    with _hashlib_fallback():
+        _check_miner_scan(demo.SimpleBitcoinMiner(threaded_ticks=False), random.Random("miner-hashlib"))
+    print("✅ SimpleBitcoinMiner (repli hashlib): identique à hashlib")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
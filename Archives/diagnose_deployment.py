@@ -3,37 +3,113 @@
 Script de diagnostic pour vérifier l'état des bindings C++ déployés
 """
 
-import requests
-import json
+import asyncio
+import importlib.util
 import sys
 
-def check_deployment(url):
-    """Vérifier l'état d'un déploiement BioMining"""
+import httpx
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Erreurs transitoires (cold start Cloud Run, 429/5xx de passerelle)
+RETRY_STATUS = (429, 502, 503, 504)
+RETRY_TOTAL = 4
+RETRY_BACKOFF = 0.5
+
+def make_client():
+    """Client HTTP partagé par toutes les sondes
+
+    Une seule connexion keep-alive (multiplexée en HTTP/2 si le paquet h2
+    est installé), les erreurs de connexion sont rejouées par le transport.
+    """
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=10,
+        transport=httpx.AsyncHTTPTransport(retries=RETRY_TOTAL)
+    )
+
+async def fetch(client, method, url, **kwargs):
+    """Requête avec backoff exponentiel (0.5, 1, 2, 4 s) sur RETRY_STATUS
+
+    Le dernier statut est ensuite rapporté normalement par chaque test.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUS or attempt == RETRY_TOTAL:
+            return response
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+async def read_json_key(client, url, key, default=None):
+    """GET url et lit une seule clé de premier niveau du corps JSON
+
+    Avec ijson le corps est parsé en flux et la lecture s'arrête dès la clé
+    trouvée (pas de dict complet pour un gros /api/status). Retourne
+    (status_code, valeur).
+    """
+    if ijson is None:
+        response = await fetch(client, "GET", url)
+        if response.status_code != 200:
+            return response.status_code, default
+        return response.status_code, response.json().get(key, default)
+    
+    for attempt in range(RETRY_TOTAL + 1):
+        async with client.stream("GET", url) as response:
+            if response.status_code in RETRY_STATUS and attempt < RETRY_TOTAL:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                continue
+            if response.status_code != 200:
+                return response.status_code, default
+            events = ijson.sendable_list()
+            parser = ijson.kvitems_coro(events, '')
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for k, value in events:
+                    if k == key:
+                        return response.status_code, value
+                del events[:]
+            return response.status_code, default
+
+async def check_deployment(url, client):
+    """Vérifier l'état d'un déploiement BioMining
+
+    /api/status et /api/bindings sont indépendants: envoyés en parallèle,
+    résultats affichés dans l'ordre des tests.
+    """
     
     print(f"🔍 Diagnostic de déploiement : {url}")
     print("=" * 60)
     
+    status, bindings = await asyncio.gather(
+        read_json_key(client, f"{url}/api/status", 'environment', 'unknown'),
+        fetch(client, "GET", f"{url}/api/bindings"),
+        return_exceptions=True
+    )
+    
     # Test 1: API Status
-    try:
-        print("\n📊 Test 1: API Status")
-        response = requests.get(f"{url}/api/status", timeout=10)
-        if response.status_code == 200:
-            print("✅ API accessible")
-            data = response.json()
-            env = data.get('environment', 'unknown')
-            print(f"   Environment: {env}")
-        else:
-            print(f"❌ API erreur: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Erreur connexion API: {e}")
+    print("\n📊 Test 1: API Status")
+    if isinstance(status, Exception):
+        print(f"❌ Erreur connexion API: {status}")
+        return False
+    status_code, env = status
+    if status_code == 200:
+        print("✅ API accessible")
+        print(f"   Environment: {env}")
+    else:
+        print(f"❌ API erreur: {status_code}")
         return False
     
     # Test 2: Bindings Check  
+    print("\n🔧 Test 2: C++ Bindings")
+    if isinstance(bindings, Exception):
+        print(f"❌ Erreur bindings check: {bindings}")
+        return False
+    response = bindings
     try:
-        print("\n🔧 Test 2: C++ Bindings")
-        response = requests.get(f"{url}/api/bindings", timeout=10)
         if response.status_code == 200:
+            # Réponse courte et plusieurs champs affichés: un seul parse complet
             bindings = response.json()
             cpp_available = bindings.get('cpp_available', False)
             
@@ -61,46 +137,59 @@ def check_deployment(url):
         print(f"❌ Erreur bindings check: {e}")
         return False
 
-def test_biological_network(url):
+async def test_biological_network(url, client):
     """Tester le BiologicalNetwork"""
     
     print(f"\n🧠 Test 3: BiologicalNetwork")
     
+    training_config = {
+        "learning_rate": 0.01,
+        "epochs": 100, 
+        "difficulty": 4
+    }
+    
     try:
-        # Start biological system
-        response = requests.post(f"{url}/api/systems/biological/start", timeout=10)
-        if response.status_code == 200:
+        # Start biological system + start training (indépendants, en parallèle)
+        start, training = await asyncio.gather(
+            fetch(client, "POST", f"{url}/api/systems/biological/start"),
+            fetch(client, "POST", f"{url}/api/training/start", json=training_config)
+        )
+        
+        if start.status_code == 200:
             print("✅ Biological system démarré")
         else:
-            print(f"⚠️ Biological start: {response.status_code}")
-            
-        # Start training
-        training_config = {
-            "learning_rate": 0.01,
-            "epochs": 100, 
-            "difficulty": 4
-        }
-        
-        response = requests.post(
-            f"{url}/api/training/start",
-            json=training_config,
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
+            print(f"⚠️ Biological start: {start.status_code}")
         
-        if response.status_code == 200:
+        if training.status_code == 200:
             print("✅ Training démarré")
-            data = response.json()
+            data = training.json()
             print(f"   Config: {data.get('training_config', {})}")
             return True
         else:
-            print(f"⚠️ Training start: {response.status_code}")
+            print(f"⚠️ Training start: {training.status_code}")
             return False
             
     except Exception as e:
         print(f"❌ Erreur test BiologicalNetwork: {e}")
         return False
 
+async def probe(url):
+    """Diagnostic complet sur un client partagé"""
+    async with make_client() as client:
+        bindings_ok = await check_deployment(url, client)
+        
+        if bindings_ok:
+            print("\n🎊 DIAGNOSTIC: C++ BINDINGS OK")
+            print("   Votre déploiement utilise les VRAIES classes C++")
+            await test_biological_network(url, client)
+        else:
+            print("\n⚠️ DIAGNOSTIC: FALLBACK PYTHON")
+            print("   Votre déploiement utilise les fallbacks Python")
+            print("\n🔧 SOLUTION:")
+            print("   1. Redéployer avec Dockerfile.cpp-enabled")
+            print("   2. Ou utiliser ./deploy_new_cpp_service.sh")
+            print("   3. Vérifier la configuration Cloud Run")
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python diagnose_deployment.py <URL>")
@@ -110,20 +199,8 @@ def main():
     url = sys.argv[1].rstrip('/')
     
     # Diagnostic complet
-    bindings_ok = check_deployment(url)
-    
-    if bindings_ok:
-        print("\n🎊 DIAGNOSTIC: C++ BINDINGS OK")
-        print("   Votre déploiement utilise les VRAIES classes C++")
-        test_biological_network(url)
-    else:
-        print("\n⚠️ DIAGNOSTIC: FALLBACK PYTHON")
-        print("   Votre déploiement utilise les fallbacks Python")
-        print("\n🔧 SOLUTION:")
-        print("   1. Redéployer avec Dockerfile.cpp-enabled")
-        print("   2. Ou utiliser ./deploy_new_cpp_service.sh")
-        print("   3. Vérifier la configuration Cloud Run")
-        
+    asyncio.run(probe(url))
+
     print("\n" + "=" * 60)
 
 if __name__ == "__main__":
@@ -343,7 +343,7 @@ public:
     double getBiologicalAccuracy() const;
     
     // Métriques et monitoring
-    HybridMiningMetrics getMetrics() const;
+    const HybridMiningMetrics& getMetrics() const; // compteurs atomiques: lisibles sans copie
     BioMining::HCrypto::HybridLearningState getLearningState() const;
     double getNetworkAdaptationScore() const;
     QString getStatusReport() const;
@@ -0,0 +1,27 @@
+/*
+ * BioMining Platform - Parsing des paquets de données MEA2100
+ *
+ * Les échantillons de 4 octets ne sont pas forcément alignés (header de
+ * 6 octets): memcpy est ramené à un simple chargement par le compilateur.
+ */
+
+#include <math.h>
+#include <string.h>
+
+#include "mea_parse.h"
+
+void mea_features(const uint8_t *buf, size_t n, double t0, double dt,
+                  float *v_out, double *ts_out, uint8_t *spike_out, float *noise_out)
+{
+    for (size_t i = 0; i < n; i++) {
+        int16_t raw;
+        memcpy(&raw, buf + 4 * i + 2, sizeof raw);
+
+        float v = (float)raw * 0.1f;
+        float av = fabsf(v);
+        v_out[i] = v;
+        ts_out[i] = t0 + (double)i * dt;
+        spike_out[i] = av > 50.0f;
+        noise_out[i] = av < 30.0f ? av : 5.0f;
+    }
+}
@@ -0,0 +1,29 @@
+/*
+ * BioMining Platform - Parsing des paquets de données MEA2100
+ *
+ * Un échantillon sur le fil fait 4 octets little-endian: ID électrode
+ * (uint16) puis tension ADC (int16, pas de 0.1 μV). La colonne ID reste
+ * une vue NumPy sur le paquet; ce noyau convertit la tension en μV et
+ * calcule les descripteurs par échantillon en une boucle directement sur
+ * les octets reçus.
+ *
+ * Compilé par mea_parse_build.py (cffi).
+ */
+
+#ifndef MEA_PARSE_H
+#define MEA_PARSE_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+/*
+ * Tensions (μV) et descripteurs des n échantillons de buf (premier
+ * échantillon, après le header du paquet). v = brut * 0.1f; l'horodatage
+ * de l'échantillon i vaut t0 + i * dt; spike si |v| > 50 μV, bruit = |v|
+ * si |v| < 30 μV sinon 5.0 (mêmes règles que _sample_features dans
+ * real_mea_interface.py).
+ */
+void mea_features(const uint8_t *buf, size_t n, double t0, double dt,
+                  float *v_out, double *ts_out, uint8_t *spike_out, float *noise_out);
+
+#endif /* MEA_PARSE_H */
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+BioMining Platform - Compilation du noyau natif de parsing MEA2100
+==================================================================
+
+Construit l'extension cffi `_mea_parse` (mea_parse.c) à côté de
+real_mea_interface.py. Optionnelle: sans elle, les descripteurs par
+échantillon sont calculés par Numba, ou à défaut par NumPy.
+
+Usage:
+    pip3 install cffi
+    python3 mea_parse_build.py
+"""
+
+import os
+
+from cffi import FFI
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+ffibuilder = FFI()
+
+ffibuilder.cdef("""
+    void mea_features(const uint8_t *buf, size_t n, double t0, double dt,
+                      float *v_out, double *ts_out, uint8_t *spike_out, float *noise_out);
+""")
+
+ffibuilder.set_source(
+    "_mea_parse",
+    '#include "mea_parse.h"',
+    sources=["mea_parse.c"],
+    include_dirs=[HERE],
+    extra_compile_args=["-O3"],
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(tmpdir=HERE, verbose=True)
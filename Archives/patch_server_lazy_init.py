@@ -4,24 +4,16 @@ Patch server.py to use lazy initialization of BioMiningPlatform
 This prevents pybind11 errors from crashing at module import time
 """
 
+import mmap
+import re
 import sys
 import os
 
 # Path to server.py
 SERVER_FILE = "/app/web/api/server.py"
 
-def patch_server():
-    """Patch server.py to use lazy initialization"""
-    
-    print("🔧 Patching server.py for lazy initialization...")
-    
-    try:
-        with open(SERVER_FILE, 'r') as f:
-            content = f.read()
-        
-        # Find and replace the platform initialization
-        old_init = "platform = BioMiningPlatform()"
-        new_init = """# Lazy initialization to prevent pybind11 errors at import time
+OLD_INIT = "platform = BioMiningPlatform()"
+NEW_INIT = """# Lazy initialization to prevent pybind11 errors at import time
 platform = None
 
 def get_platform():
@@ -44,48 +36,163 @@ def get_platform():
                     pass
             platform = DummyPlatform()
     return platform"""
+
+# platform.method() / platform.attribute → get_platform().…
+# (pas précédé d'un identifiant ni d'un point: self.platform.x reste intact)
+_PLATFORM_ATTR = re.compile(r'(?<![\w.])platform\.(\w+)')
+
+try:
+    import libcst as cst
+    import libcst.matchers as m
+except ImportError:
+    cst = None
+
+
+if cst is not None:
+    class LazyPlatformTransformer(cst.CSTTransformer):
+        """Single pass over server.py: platform.x -> get_platform().x
+
+        Only the bare module-level name is rewritten (self.platform.x and
+        my_platform.x are left alone). The lazy stub is spliced in place of
+        the module-level initialization after the traversal, so its own
+        `return platform` is never rewritten.
+        """
+
+        def __init__(self):
+            super().__init__()
+            self.replacements = 0
+            self.found_init = False
+
+        def leave_Attribute(self, original_node, updated_node):
+            if m.matches(original_node.value, m.Name("platform")):
+                self.replacements += 1
+                return updated_node.with_changes(value=cst.Call(func=cst.Name("get_platform")))
+            return updated_node
+
+        def leave_Return(self, original_node, updated_node):
+            if m.matches(original_node.value, m.Name("platform")):
+                self.replacements += 1
+                return updated_node.with_changes(value=cst.Call(func=cst.Name("get_platform")))
+            return updated_node
+
+        def leave_Module(self, original_node, updated_node):
+            init = m.SimpleStatementLine(body=[m.Assign(
+                targets=[m.AssignTarget(target=m.Name("platform"))],
+                value=m.Call(func=m.Name("BioMiningPlatform"), args=[])
+            )])
+            stub_module = cst.parse_module(NEW_INIT + "\n")
+            stub = list(stub_module.body)
+            body = []
+            for stmt in updated_node.body:
+                if not self.found_init and m.matches(stmt, init):
+                    self.found_init = True
+                    # Keep the blank lines/comments above the original line + the stub's header comment
+                    stub[0] = stub[0].with_changes(
+                        leading_lines=[*stmt.leading_lines, *stub_module.header])
+                    body.extend(stub)
+                else:
+                    body.append(stmt)
+            return updated_node.with_changes(body=body)
+
+
+def patch_with_libcst(content):
+    """Rewrite via libcst; returns (content, replacements) or None if OLD_INIT is missing"""
+    transformer = LazyPlatformTransformer()
+    module = cst.parse_module(content).visit(transformer)
+    if not transformer.found_init:
+        return None
+    return module.code, transformer.replacements
+
+
+def patch_with_regex(fin, fout):
+    """Fallback without libcst: streams fin -> fout line by line
+
+    Returns the number of replacements, or None if OLD_INIT is missing.
+    Memory stays O(longest line) instead of several copies of the file.
+    """
+    found = False
+    replacements = 0
+    for line in fin:
+        # Stub written as-is so its own `return platform` is not rewritten
+        if not found and line.rstrip('\n') == OLD_INIT:
+            fout.write(NEW_INIT + '\n')
+            found = True
+            continue
         
-        if old_init in content:
-            content = content.replace(old_init, new_init)
-            print(f"✅ Found and replaced: {old_init}")
-            
-            # Replace ALL platform usage with get_platform() calls
-            # This is crucial to ensure lazy initialization works everywhere
-            
-            # Count replacements for logging
-            replacements = 0
-            
-            # Pattern 1: platform.method() → get_platform().method()
-            import re
-            pattern1 = r'\bplatform\.([\w_]+)\('
-            matches = re.findall(pattern1, content)
-            replacements += len(matches)
-            content = re.sub(pattern1, r'get_platform().\1(', content)
-            
-            # Pattern 2: platform.attribute → get_platform().attribute
-            pattern2 = r'\bplatform\.([\w_]+)(?!\()'
-            matches2 = re.findall(pattern2, content)
-            replacements += len(matches2)
-            content = re.sub(pattern2, r'get_platform().\1', content)
-            
-            # Pattern 3: return platform → return get_platform()
-            content = content.replace('return platform\n', 'return get_platform()\n')
-            
-            print(f"✅ Replaced {replacements} platform references with get_platform()")
-            
-            # Write back
-            with open(SERVER_FILE, 'w') as f:
-                f.write(content)
-            
-            print("✅ server.py patched successfully")
-            return True
+        # Replace ALL platform usage with get_platform() calls
+        # This is crucial to ensure lazy initialization works everywhere
+        
+        # Pattern 1+2 fused: one precompiled pass, subn gives the count for logging
+        line, n = _PLATFORM_ATTR.subn(r'get_platform().\1', line)
+        replacements += n
+        
+        # Pattern 3: return platform → return get_platform()
+        if line.endswith('return platform\n'):
+            line = line.replace('return platform\n', 'return get_platform()\n')
+        
+        fout.write(line)
+    
+    return replacements if found else None
+
+def contains_init(f):
+    """Recherche OLD_INIT dans le fichier ouvert via mmap (sans le charger en str)"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return False
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(OLD_INIT.encode()) != -1
+
+def patch_server():
+    """Patch server.py to use lazy initialization
+
+    Fichier absent ou sans OLD_INIT: message et False. Toute autre erreur
+    (réécriture, I/O) remonte avec sa traceback.
+    """
+    
+    print("🔧 Patching server.py for lazy initialization...")
+    
+    try:
+        with open(SERVER_FILE, 'rb') as f:
+            found = contains_init(f)
+    except FileNotFoundError:
+        print(f"❌ server.py introuvable: {SERVER_FILE}")
+        return False
+    
+    if not found:
+        print(f"⚠️ Could not find initialization line: {OLD_INIT}")
+        return False
+    
+    # Written next to server.py then swapped in atomically (no half-patched file)
+    tmp_file = SERVER_FILE + ".tmp"
+    
+    try:
+        if cst is not None:
+            with open(SERVER_FILE, 'r') as f:
+                result = patch_with_libcst(f.read())
+            if result is not None:
+                content, replacements = result
+                with open(tmp_file, 'w') as f:
+                    f.write(content)
         else:
-            print(f"⚠️ Could not find initialization line: {old_init}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error patching server.py: {e}")
+            with open(SERVER_FILE, 'r') as fin, open(tmp_file, 'w') as fout:
+                replacements = patch_with_regex(fin, fout)
+            result = replacements
+        
+        if result is not None:
+            # Write back
+            os.replace(tmp_file, SERVER_FILE)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    
+    if result is None:
+        # OLD_INIT présent mais pas comme instruction de module
+        print(f"⚠️ Could not find initialization line: {OLD_INIT}")
         return False
+    
+    print(f"✅ Found and replaced: {OLD_INIT}")
+    print(f"✅ Replaced {replacements} platform references with get_platform()")
+    print("✅ server.py patched successfully")
+    return True
 
 if __name__ == "__main__":
     success = patch_server()
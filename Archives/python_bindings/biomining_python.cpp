@@ -1,9 +1,11 @@
-#define PYBIND11_DETAILED_ERROR_MESSAGES
-#include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
-#include <pybind11/chrono.h>
-#include <pybind11/operators.h>
-#include <pybind11/functional.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/shared_ptr.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+#include <cstring>
+#include <functional>
+#include <memory>
+#include <type_traits>
 #include <QDebug>
 #include <QMessageLogContext>
 
@@ -23,78 +25,193 @@ void cloudrunQtLogger(QtMsgType type, const QMessageLogContext &context, const Q
 #include "../include/bio/biological_network_adapter.h"
 #include "../include/crypto/bio_entropy_generator.h"
 
-namespace py = pybind11;
+namespace nb = nanobind;
 
-PYBIND11_MODULE(biomining_cpp, m) {
-    m.doc() = "BioMining C++ Python bindings";
+// Constructeurs par mots-clés: Config(neuronCount=60, ...) remplit tout le struct
+// en un seul appel C++ au lieu d'un setter Python->C++ par champ
+template <typename M>
+static M castKwarg(const nb::kwargs& kw, const char* name) {
+    M value{};
+    if (!nb::try_cast(kw[name], value)) {
+        throw nb::type_error((std::string("incompatible type for keyword argument '") + name + "'").c_str());
+    }
+    return value;
+}
 
-    // Register QObject for inheritance - use shared_ptr for Qt-managed objects
-    py::class_<QObject, std::shared_ptr<QObject>>(m, "QObject");
+template <typename T, typename M>
+static size_t setFromKwargs(T& self, const nb::kwargs& kw, const char* name, M T::*field) {
+    if (!kw.contains(name)) return 0;
+    self.*field = castKwarg<M>(kw, name);
+    return 1;
+}
 
-    
-    m.def("install_qt_logger", []() {
-    qInstallMessageHandler(cloudrunQtLogger);
-    }, "Installe un handler Qt qui redirige tous les logs Qt vers stderr");
-    
+template <typename T>
+static size_t setFromKwargs(T& self, const nb::kwargs& kw, const char* name, QString T::*field) {
+    if (!kw.contains(name)) return 0;
+    self.*field = QString::fromStdString(castKwarg<std::string>(kw, name));
+    return 1;
+}
+
+// Un mot-clé inconnu (faute de frappe) doit échouer comme un attribut inconnu
+static void checkKwargs(const nb::kwargs& kw, size_t used, const char* type) {
+    if (used != kw.size()) {
+        throw nb::type_error((std::string(type) + "(): unexpected keyword argument").c_str());
+    }
+}
+
+// Enregistrement NumPy compact (packed) des champs numériques d'un struct de config:
+// Config.dtype s'utilise tel quel dans np.zeros(1, dtype=Config.dtype), les champs
+// se remplissent côté NumPy (sans FFI), puis Config(record) copie chaque champ depuis
+// le buffer en C++. Pas de memcpy du struct entier: les configs contiennent des
+// QString/QVector, qui restent à leur valeur par défaut.
+// L'__init__ (record) est enregistré avant l'__init__ (**kwargs): nanobind essaie
+// les surcharges dans l'ordre, et checkKwargs lèverait TypeError sur Config(record=...)
+// avant que la surcharge record ne soit tentée.
+template <typename M>
+static std::string recordFormat() {
+    if constexpr (std::is_same_v<M, bool>) return "?";
+    else if constexpr (std::is_enum_v<M>) return recordFormat<std::underlying_type_t<M>>();
+    else if constexpr (std::is_floating_point_v<M>) return "f" + std::to_string(sizeof(M));
+    else if constexpr (std::is_signed_v<M>) return "i" + std::to_string(sizeof(M));
+    else return "u" + std::to_string(sizeof(M));
+}
+
+template <typename T>
+class RecordLayout {
+public:
+    template <typename M>
+    RecordLayout& field(const char* name, M T::*member) {
+        static_assert(std::is_trivially_copyable_v<M>, "record fields must be plain values");
+        size_t offset = m_itemsize;
+        m_fields.emplace_back(name, recordFormat<M>());
+        m_readers.push_back([member, offset](T& c, const char* data) {
+            std::memcpy(&(c.*member), data + offset, sizeof(M));
+        });
+        m_itemsize += sizeof(M);
+        return *this;
+    }
+
+    // Liste [(nom, format), ...] acceptée directement comme dtype par NumPy
+    nb::list descr() const {
+        nb::list out;
+        for (const auto& f : m_fields) out.append(nb::make_tuple(f.first, f.second));
+        return out;
+    }
+
+    T read(nb::handle record) const {
+        Py_buffer view;
+        if (PyObject_GetBuffer(record.ptr(), &view, PyBUF_C_CONTIGUOUS) != 0) throw nb::python_error();
+        std::unique_ptr<Py_buffer, decltype(&PyBuffer_Release)> release(&view, PyBuffer_Release);
+        if (static_cast<size_t>(view.len) != m_itemsize) {
+            throw nb::type_error(("expected a single record of " + std::to_string(m_itemsize) +
+                                  " bytes (dtype=<Config>.dtype), got " + std::to_string(view.len)).c_str());
+        }
+        T c{};
+        for (const auto& r : m_readers) r(c, static_cast<const char*>(view.buf));
+        return c;
+    }
+
+private:
+    std::vector<std::pair<std::string, std::string>> m_fields;
+    std::vector<std::function<void(T&, const char*)>> m_readers;
+    size_t m_itemsize = 0;
+};
+
+// Sous-module crypto: enregistré au premier accès à biomining_cpp.crypto
+static void registerCrypto(nb::module_& m_crypto) {
     // ==========================================================================
     // HYBRID BITCOIN MINER MODULE
     // ==========================================================================
     
-    py::module m_crypto = m.def_submodule("crypto", "Cryptographic mining module");
-    
     // Mining Configuration
-    py::class_<BioMining::HCrypto::MiningConfig>(m_crypto, "MiningConfig")
-        .def(py::init<>())
-        .def_readwrite("difficulty", &BioMining::HCrypto::MiningConfig::difficulty)
-        .def_readwrite("threads", &BioMining::HCrypto::MiningConfig::threads)
-        .def_readwrite("useGPU", &BioMining::HCrypto::MiningConfig::useGPU)
-        .def_readwrite("targetEfficiency", &BioMining::HCrypto::MiningConfig::targetEfficiency)
-        .def_readwrite("targetDifficulty", &BioMining::HCrypto::MiningConfig::targetDifficulty);
+    // Champs exposés via .dtype / Config(record)
+    auto miningRecord = std::make_shared<RecordLayout<BioMining::HCrypto::MiningConfig>>();
+    miningRecord->field("difficulty", &BioMining::HCrypto::MiningConfig::difficulty)
+        .field("threads", &BioMining::HCrypto::MiningConfig::threads)
+        .field("useGPU", &BioMining::HCrypto::MiningConfig::useGPU)
+        .field("targetEfficiency", &BioMining::HCrypto::MiningConfig::targetEfficiency)
+        .field("targetDifficulty", &BioMining::HCrypto::MiningConfig::targetDifficulty);
+    nb::class_<BioMining::HCrypto::MiningConfig>(m_crypto, "MiningConfig")
+        .def("__init__", [miningRecord](BioMining::HCrypto::MiningConfig* self, nb::handle record) {
+            new (self) BioMining::HCrypto::MiningConfig(miningRecord->read(record));
+        }, nb::arg("record"), "Constructor from one NumPy record of dtype MiningConfig.dtype")
+        .def("__init__", [](BioMining::HCrypto::MiningConfig* self, nb::kwargs kw) {
+            using C = BioMining::HCrypto::MiningConfig;
+            C c{};
+            size_t used = setFromKwargs(c, kw, "difficulty", &C::difficulty)
+                        + setFromKwargs(c, kw, "threads", &C::threads)
+                        + setFromKwargs(c, kw, "useGPU", &C::useGPU)
+                        + setFromKwargs(c, kw, "targetEfficiency", &C::targetEfficiency)
+                        + setFromKwargs(c, kw, "targetDifficulty", &C::targetDifficulty);
+            checkKwargs(kw, used, "MiningConfig");
+            new (self) C(std::move(c));
+        }, "Constructor; every field can be passed as a keyword argument")
+        .def_prop_ro_static("dtype", [miningRecord](nb::handle) { return miningRecord->descr(); },
+            "Packed NumPy dtype of the numeric fields (string fields are not included)")
+        .def_rw("difficulty", &BioMining::HCrypto::MiningConfig::difficulty)
+        .def_rw("threads", &BioMining::HCrypto::MiningConfig::threads)
+        .def_rw("useGPU", &BioMining::HCrypto::MiningConfig::useGPU)
+        .def_rw("targetEfficiency", &BioMining::HCrypto::MiningConfig::targetEfficiency)
+        .def_rw("targetDifficulty", &BioMining::HCrypto::MiningConfig::targetDifficulty);
     
     // Biological Learning Parameters
-    py::class_<BioMining::HCrypto::BiologicalLearningParams>(m_crypto, "BiologicalLearningParams")
-        .def(py::init<>())
-        .def_readwrite("initialLearningRate", &BioMining::HCrypto::BiologicalLearningParams::initialLearningRate)
-        .def_readwrite("retroLearningRate", &BioMining::HCrypto::BiologicalLearningParams::retroLearningRate)
-        .def_readwrite("decayRate", &BioMining::HCrypto::BiologicalLearningParams::decayRate)
-        .def_readwrite("momentumFactor", &BioMining::HCrypto::BiologicalLearningParams::momentumFactor)
-        .def_readwrite("adaptationThreshold", &BioMining::HCrypto::BiologicalLearningParams::adaptationThreshold)
-        .def_readwrite("maxIterations", &BioMining::HCrypto::BiologicalLearningParams::maxIterations)
-        .def_readwrite("retroIterations", &BioMining::HCrypto::BiologicalLearningParams::retroIterations)
-        .def_readwrite("enablePlasticity", &BioMining::HCrypto::BiologicalLearningParams::enablePlasticity)
-        .def_readwrite("enableAdaptation", &BioMining::HCrypto::BiologicalLearningParams::enableAdaptation);
+    nb::class_<BioMining::HCrypto::BiologicalLearningParams>(m_crypto, "BiologicalLearningParams")
+        .def("__init__", [](BioMining::HCrypto::BiologicalLearningParams* self, nb::kwargs kw) {
+            using C = BioMining::HCrypto::BiologicalLearningParams;
+            C c{};
+            size_t used = setFromKwargs(c, kw, "initialLearningRate", &C::initialLearningRate)
+                        + setFromKwargs(c, kw, "retroLearningRate", &C::retroLearningRate)
+                        + setFromKwargs(c, kw, "decayRate", &C::decayRate)
+                        + setFromKwargs(c, kw, "momentumFactor", &C::momentumFactor)
+                        + setFromKwargs(c, kw, "adaptationThreshold", &C::adaptationThreshold)
+                        + setFromKwargs(c, kw, "maxIterations", &C::maxIterations)
+                        + setFromKwargs(c, kw, "retroIterations", &C::retroIterations)
+                        + setFromKwargs(c, kw, "enablePlasticity", &C::enablePlasticity)
+                        + setFromKwargs(c, kw, "enableAdaptation", &C::enableAdaptation);
+            checkKwargs(kw, used, "BiologicalLearningParams");
+            new (self) C(std::move(c));
+        }, "Constructor; every field can be passed as a keyword argument")
+        .def_rw("initialLearningRate", &BioMining::HCrypto::BiologicalLearningParams::initialLearningRate)
+        .def_rw("retroLearningRate", &BioMining::HCrypto::BiologicalLearningParams::retroLearningRate)
+        .def_rw("decayRate", &BioMining::HCrypto::BiologicalLearningParams::decayRate)
+        .def_rw("momentumFactor", &BioMining::HCrypto::BiologicalLearningParams::momentumFactor)
+        .def_rw("adaptationThreshold", &BioMining::HCrypto::BiologicalLearningParams::adaptationThreshold)
+        .def_rw("maxIterations", &BioMining::HCrypto::BiologicalLearningParams::maxIterations)
+        .def_rw("retroIterations", &BioMining::HCrypto::BiologicalLearningParams::retroIterations)
+        .def_rw("enablePlasticity", &BioMining::HCrypto::BiologicalLearningParams::enablePlasticity)
+        .def_rw("enableAdaptation", &BioMining::HCrypto::BiologicalLearningParams::enableAdaptation);
     
     // Hybrid Mining Metrics
-    py::class_<BioMining::HCrypto::HybridMiningMetrics>(m_crypto, "HybridMiningMetrics")
-        .def(py::init<>())
+    nb::class_<BioMining::HCrypto::HybridMiningMetrics>(m_crypto, "HybridMiningMetrics")
+        .def(nb::init<>())
         .def("reset", &BioMining::HCrypto::HybridMiningMetrics::reset)
-        .def_property_readonly("totalHashes", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("totalHashes", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.totalHashes.load(); 
         })
-        .def_property_readonly("biologicalPredictions", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("biologicalPredictions", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.biologicalPredictions.load(); 
         })
-        .def_property_readonly("successfulPredictions", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("successfulPredictions", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.successfulPredictions.load(); 
         })
-        .def_property_readonly("traditionalHashes", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("traditionalHashes", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.traditionalHashes.load(); 
         })
-        .def_property_readonly("biologicalAccuracy", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("biologicalAccuracy", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.biologicalAccuracy.load(); 
         })
-        .def_property_readonly("hybridHashRate", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("hybridHashRate", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.hybridHashRate.load(); 
         })
-        .def_property_readonly("energyEfficiency", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("energyEfficiency", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.energyEfficiency.load(); 
         })
-        .def_property_readonly("adaptationScore", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
+        .def_prop_ro("adaptationScore", [](const BioMining::HCrypto::HybridMiningMetrics& m) { 
             return m.adaptationScore.load(); 
         });
     
     // Learning States
-    py::enum_<BioMining::HCrypto::HybridLearningState>(m_crypto, "HybridLearningState")
+    nb::enum_<BioMining::HCrypto::HybridLearningState>(m_crypto, "HybridLearningState")
         .value("Uninitialized", BioMining::HCrypto::HybridLearningState::Uninitialized)
         .value("InitialLearning", BioMining::HCrypto::HybridLearningState::InitialLearning)
         .value("ActiveMining", BioMining::HCrypto::HybridLearningState::ActiveMining)
@@ -104,41 +221,44 @@ PYBIND11_MODULE(biomining_cpp, m) {
         .value("Error", BioMining::HCrypto::HybridLearningState::Error);
     
     // Mining Methods
-    py::enum_<BioMining::HCrypto::MiningMethod>(m_crypto, "MiningMethod")
+    nb::enum_<BioMining::HCrypto::MiningMethod>(m_crypto, "MiningMethod")
         .value("TraditionalSHA256", BioMining::HCrypto::MiningMethod::TraditionalSHA256)
         .value("BiologicalNetwork", BioMining::HCrypto::MiningMethod::BiologicalNetwork)
         .value("RealMEANeurons", BioMining::HCrypto::MiningMethod::RealMEANeurons)
         .value("HybridFusion", BioMining::HCrypto::MiningMethod::HybridFusion);
     
     // Biological Nonce Prediction
-    py::class_<BioMining::HCrypto::BiologicalNoncePrediction>(m_crypto, "BiologicalNoncePrediction")
-        .def(py::init<>())
-        .def_readwrite("predictedNonce", &BioMining::HCrypto::BiologicalNoncePrediction::predictedNonce)
-        .def_readwrite("confidence", &BioMining::HCrypto::BiologicalNoncePrediction::confidence)
-        .def_readwrite("biologicalEntropy", &BioMining::HCrypto::BiologicalNoncePrediction::biologicalEntropy)
-        .def_readwrite("isValidated", &BioMining::HCrypto::BiologicalNoncePrediction::isValidated);
+    nb::class_<BioMining::HCrypto::BiologicalNoncePrediction>(m_crypto, "BiologicalNoncePrediction")
+        .def(nb::init<>())
+        .def_rw("predictedNonce", &BioMining::HCrypto::BiologicalNoncePrediction::predictedNonce)
+        .def_rw("confidence", &BioMining::HCrypto::BiologicalNoncePrediction::confidence)
+        .def_rw("biologicalEntropy", &BioMining::HCrypto::BiologicalNoncePrediction::biologicalEntropy)
+        .def_rw("isValidated", &BioMining::HCrypto::BiologicalNoncePrediction::isValidated);
     
     // Triple System Prediction
-    py::class_<BioMining::HCrypto::TripleSystemPrediction>(m_crypto, "TripleSystemPrediction")
-        .def(py::init<>())
-        .def_readwrite("sha256Nonce", &BioMining::HCrypto::TripleSystemPrediction::sha256Nonce)
-        .def_readwrite("networkNonce", &BioMining::HCrypto::TripleSystemPrediction::networkNonce)
-        .def_readwrite("meaNonce", &BioMining::HCrypto::TripleSystemPrediction::meaNonce)
-        .def_readwrite("sha256Confidence", &BioMining::HCrypto::TripleSystemPrediction::sha256Confidence)
-        .def_readwrite("networkConfidence", &BioMining::HCrypto::TripleSystemPrediction::networkConfidence)
-        .def_readwrite("meaConfidence", &BioMining::HCrypto::TripleSystemPrediction::meaConfidence)
-        .def_readwrite("fusedNonce", &BioMining::HCrypto::TripleSystemPrediction::fusedNonce)
-        .def_readwrite("fusedConfidence", &BioMining::HCrypto::TripleSystemPrediction::fusedConfidence)
-        .def_readwrite("selectedMethod", &BioMining::HCrypto::TripleSystemPrediction::selectedMethod)
-        .def_readwrite("isValidated", &BioMining::HCrypto::TripleSystemPrediction::isValidated)
-        .def_readwrite("wasSuccessful", &BioMining::HCrypto::TripleSystemPrediction::wasSuccessful);
-    
-    // Main HybridBitcoinMiner class (inherits from QObject, needs nodelete holder)
-    py::class_<BioMining::HCrypto::HybridBitcoinMiner, QObject, std::shared_ptr<BioMining::HCrypto::HybridBitcoinMiner>>(m_crypto, "HybridBitcoinMiner")
-        .def(py::init<>())
+    nb::class_<BioMining::HCrypto::TripleSystemPrediction>(m_crypto, "TripleSystemPrediction")
+        .def(nb::init<>())
+        .def_rw("sha256Nonce", &BioMining::HCrypto::TripleSystemPrediction::sha256Nonce)
+        .def_rw("networkNonce", &BioMining::HCrypto::TripleSystemPrediction::networkNonce)
+        .def_rw("meaNonce", &BioMining::HCrypto::TripleSystemPrediction::meaNonce)
+        .def_rw("sha256Confidence", &BioMining::HCrypto::TripleSystemPrediction::sha256Confidence)
+        .def_rw("networkConfidence", &BioMining::HCrypto::TripleSystemPrediction::networkConfidence)
+        .def_rw("meaConfidence", &BioMining::HCrypto::TripleSystemPrediction::meaConfidence)
+        .def_rw("fusedNonce", &BioMining::HCrypto::TripleSystemPrediction::fusedNonce)
+        .def_rw("fusedConfidence", &BioMining::HCrypto::TripleSystemPrediction::fusedConfidence)
+        .def_rw("selectedMethod", &BioMining::HCrypto::TripleSystemPrediction::selectedMethod)
+        .def_rw("isValidated", &BioMining::HCrypto::TripleSystemPrediction::isValidated)
+        .def_rw("wasSuccessful", &BioMining::HCrypto::TripleSystemPrediction::wasSuccessful);
+    
+    // Main HybridBitcoinMiner class (inherits from QObject)
+    nb::class_<BioMining::HCrypto::HybridBitcoinMiner, QObject>(m_crypto, "HybridBitcoinMiner")
+        .def(nb::init<>())
+        // Méthodes longues sans état Python: le GIL est relâché pendant l'appel C++
         .def("initialize", &BioMining::HCrypto::HybridBitcoinMiner::initialize,
+             nb::call_guard<nb::gil_scoped_release>(),
              "Initialize the hybrid mining system")
         .def("configureBiologicalNetwork", &BioMining::HCrypto::HybridBitcoinMiner::configureBiologicalNetwork,
+             nb::call_guard<nb::gil_scoped_release>(),
              "Configure biological network parameters")
         .def("setMiningParameters", &BioMining::HCrypto::HybridBitcoinMiner::setMiningParameters,
              "Set mining configuration parameters")
@@ -164,8 +284,12 @@ PYBIND11_MODULE(biomining_cpp, m) {
              "Validate a biological prediction")
         .def("getBiologicalAccuracy", &BioMining::HCrypto::HybridBitcoinMiner::getBiologicalAccuracy,
              "Get biological prediction accuracy")
+        // Vue sur les métriques du mineur (pas de copie à chaque sondage): l'objet
+        // renvoyé garde le mineur en vie; les getters de NetworkConfig/LearningStats
+        // restent des copies car ils sont protégés par un mutex
         .def("getMetrics", &BioMining::HCrypto::HybridBitcoinMiner::getMetrics,
-             "Get mining metrics")
+             nb::rv_policy::reference_internal,
+             "Live view of the mining metrics (keeps the miner alive; reset() resets the miner's counters)")
         .def("getLearningState", &BioMining::HCrypto::HybridBitcoinMiner::getLearningState,
              "Get current learning state")
         .def("getNetworkAdaptationScore", &BioMining::HCrypto::HybridBitcoinMiner::getNetworkAdaptationScore,
@@ -200,19 +324,19 @@ PYBIND11_MODULE(biomining_cpp, m) {
              "Initialize bio-entropy mining system")
         .def("mineWithBioEntropy", &BioMining::HCrypto::HybridBitcoinMiner::mineWithBioEntropy,
              "Mine using bio-entropy approach",
-             py::arg("blockHeader"), py::arg("difficulty"))
+             nb::arg("blockHeader"), nb::arg("difficulty"))
         .def("getBioEntropyStats", &BioMining::HCrypto::HybridBitcoinMiner::getBioEntropyStats,
              "Get bio-entropy mining statistics");
+}
 
-    
+// Sous-module bio: enregistré au premier accès à biomining_cpp.bio
+static void registerBio(nb::module_& m_bio) {
     // ==========================================================================
     // REAL MEA INTERFACE MODULE
     // ==========================================================================
     
-    py::module m_bio = m.def_submodule("bio", "Biological interface module");
-    
     // MEA Device Types
-    py::enum_<BioMining::Bio::MEADeviceType>(m_bio, "MEADeviceType")
+    nb::enum_<BioMining::Bio::MEADeviceType>(m_bio, "MEADeviceType")
         .value("MultiChannelSystems_MCS", BioMining::Bio::MEADeviceType::MultiChannelSystems_MCS)
         .value("AlphaOmega_AlphaMap", BioMining::Bio::MEADeviceType::AlphaOmega_AlphaMap)
         .value("Blackrock_CerePlex", BioMining::Bio::MEADeviceType::Blackrock_CerePlex)
@@ -225,7 +349,7 @@ PYBIND11_MODULE(biomining_cpp, m) {
         .value("Custom_SharedMemory", BioMining::Bio::MEADeviceType::Custom_SharedMemory);
     
     // Communication Protocols
-    py::enum_<BioMining::Bio::CommunicationProtocol>(m_bio, "CommunicationProtocol")
+    nb::enum_<BioMining::Bio::CommunicationProtocol>(m_bio, "CommunicationProtocol")
         .value("SerialPort", BioMining::Bio::CommunicationProtocol::SerialPort)
         .value("TCP", BioMining::Bio::CommunicationProtocol::TCP)
         .value("UDP", BioMining::Bio::CommunicationProtocol::UDP)
@@ -235,7 +359,7 @@ PYBIND11_MODULE(biomining_cpp, m) {
         .value("Custom_API", BioMining::Bio::CommunicationProtocol::Custom_API);
     
     // Connection Status
-    py::enum_<BioMining::Bio::RealMEAInterface::ConnectionStatus>(m_bio, "ConnectionStatus")
+    nb::enum_<BioMining::Bio::RealMEAInterface::ConnectionStatus>(m_bio, "ConnectionStatus")
         .value("Disconnected", BioMining::Bio::RealMEAInterface::ConnectionStatus::Disconnected)
         .value("Connecting", BioMining::Bio::RealMEAInterface::ConnectionStatus::Connecting)
         .value("Connected", BioMining::Bio::RealMEAInterface::ConnectionStatus::Connected)
@@ -244,99 +368,171 @@ PYBIND11_MODULE(biomining_cpp, m) {
         .value("Streaming", BioMining::Bio::RealMEAInterface::ConnectionStatus::Streaming);
     
     // MEA Configuration
-    py::class_<BioMining::Bio::RealMEAConfig>(m_bio, "RealMEAConfig")
-        .def(py::init<>())
-        .def_readwrite("deviceType", &BioMining::Bio::RealMEAConfig::deviceType)
-        .def_readwrite("protocol", &BioMining::Bio::RealMEAConfig::protocol)
-        //.def_readwrite("devicePath", &BioMining::Bio::RealMEAConfig::devicePath)
-        .def_property("devicePath",
+    // Champs exposés via .dtype / Config(record)
+    auto meaRecord = std::make_shared<RecordLayout<BioMining::Bio::RealMEAConfig>>();
+    meaRecord->field("deviceType", &BioMining::Bio::RealMEAConfig::deviceType)
+        .field("protocol", &BioMining::Bio::RealMEAConfig::protocol)
+        .field("networkPort", &BioMining::Bio::RealMEAConfig::networkPort)
+        .field("baudRate", &BioMining::Bio::RealMEAConfig::baudRate)
+        .field("electrodeCount", &BioMining::Bio::RealMEAConfig::electrodeCount)
+        .field("samplingRate", &BioMining::Bio::RealMEAConfig::samplingRate)
+        .field("amplification", &BioMining::Bio::RealMEAConfig::amplification)
+        .field("filterLowCut", &BioMining::Bio::RealMEAConfig::filterLowCut)
+        .field("filterHighCut", &BioMining::Bio::RealMEAConfig::filterHighCut)
+        .field("bufferSize", &BioMining::Bio::RealMEAConfig::bufferSize)
+        .field("stimMaxVoltage", &BioMining::Bio::RealMEAConfig::stimMaxVoltage)
+        .field("stimMaxCurrent", &BioMining::Bio::RealMEAConfig::stimMaxCurrent)
+        .field("bidirectionalStim", &BioMining::Bio::RealMEAConfig::bidirectionalStim)
+        .field("spikeDetection", &BioMining::Bio::RealMEAConfig::spikeDetection)
+        .field("spikeThreshold", &BioMining::Bio::RealMEAConfig::spikeThreshold)
+        .field("spikeWindowMs", &BioMining::Bio::RealMEAConfig::spikeWindowMs)
+        .field("connectionTimeoutMs", &BioMining::Bio::RealMEAConfig::connectionTimeoutMs)
+        .field("readTimeoutMs", &BioMining::Bio::RealMEAConfig::readTimeoutMs)
+        .field("maxRetries", &BioMining::Bio::RealMEAConfig::maxRetries)
+        .field("autoCalibration", &BioMining::Bio::RealMEAConfig::autoCalibration);
+    nb::class_<BioMining::Bio::RealMEAConfig>(m_bio, "RealMEAConfig")
+        .def("__init__", [meaRecord](BioMining::Bio::RealMEAConfig* self, nb::handle record) {
+            new (self) BioMining::Bio::RealMEAConfig(meaRecord->read(record));
+        }, nb::arg("record"), "Constructor from one NumPy record of dtype RealMEAConfig.dtype")
+        .def("__init__", [](BioMining::Bio::RealMEAConfig* self, nb::kwargs kw) {
+            using C = BioMining::Bio::RealMEAConfig;
+            C c{};
+            size_t used = setFromKwargs(c, kw, "deviceType", &C::deviceType)
+                        + setFromKwargs(c, kw, "protocol", &C::protocol)
+                        + setFromKwargs(c, kw, "devicePath", &C::devicePath)
+                        + setFromKwargs(c, kw, "networkHost", &C::networkHost)
+                        + setFromKwargs(c, kw, "networkPort", &C::networkPort)
+                        + setFromKwargs(c, kw, "baudRate", &C::baudRate)
+                        + setFromKwargs(c, kw, "electrodeCount", &C::electrodeCount)
+                        + setFromKwargs(c, kw, "samplingRate", &C::samplingRate)
+                        + setFromKwargs(c, kw, "amplification", &C::amplification)
+                        + setFromKwargs(c, kw, "filterLowCut", &C::filterLowCut)
+                        + setFromKwargs(c, kw, "filterHighCut", &C::filterHighCut)
+                        + setFromKwargs(c, kw, "bufferSize", &C::bufferSize)
+                        + setFromKwargs(c, kw, "stimMaxVoltage", &C::stimMaxVoltage)
+                        + setFromKwargs(c, kw, "stimMaxCurrent", &C::stimMaxCurrent)
+                        + setFromKwargs(c, kw, "bidirectionalStim", &C::bidirectionalStim)
+                        + setFromKwargs(c, kw, "spikeDetection", &C::spikeDetection)
+                        + setFromKwargs(c, kw, "spikeThreshold", &C::spikeThreshold)
+                        + setFromKwargs(c, kw, "spikeWindowMs", &C::spikeWindowMs)
+                        + setFromKwargs(c, kw, "connectionTimeoutMs", &C::connectionTimeoutMs)
+                        + setFromKwargs(c, kw, "readTimeoutMs", &C::readTimeoutMs)
+                        + setFromKwargs(c, kw, "maxRetries", &C::maxRetries)
+                        + setFromKwargs(c, kw, "calibrationFile", &C::calibrationFile)
+                        + setFromKwargs(c, kw, "autoCalibration", &C::autoCalibration);
+            checkKwargs(kw, used, "RealMEAConfig");
+            new (self) C(std::move(c));
+        }, "Constructor; every field can be passed as a keyword argument")
+        .def_prop_ro_static("dtype", [meaRecord](nb::handle) { return meaRecord->descr(); },
+            "Packed NumPy dtype of the numeric fields (string fields are not included)")
+        .def_rw("deviceType", &BioMining::Bio::RealMEAConfig::deviceType)
+        .def_rw("protocol", &BioMining::Bio::RealMEAConfig::protocol)
+        //.def_rw("devicePath", &BioMining::Bio::RealMEAConfig::devicePath)
+        .def_prop_rw("devicePath",
                 [](const BioMining::Bio::RealMEAConfig& self) { return self.devicePath.toStdString();},
                 [](BioMining::Bio::RealMEAConfig& self, const std::string& s) { self.devicePath = QString::fromStdString(s);}
         )
-        .def_readwrite("networkHost", &BioMining::Bio::RealMEAConfig::networkHost)
-        .def_readwrite("networkPort", &BioMining::Bio::RealMEAConfig::networkPort)
-        .def_readwrite("baudRate", &BioMining::Bio::RealMEAConfig::baudRate)
-        .def_readwrite("electrodeCount", &BioMining::Bio::RealMEAConfig::electrodeCount)
-        .def_readwrite("samplingRate", &BioMining::Bio::RealMEAConfig::samplingRate)
-        .def_readwrite("amplification", &BioMining::Bio::RealMEAConfig::amplification)
-        .def_readwrite("filterLowCut", &BioMining::Bio::RealMEAConfig::filterLowCut)
-        .def_readwrite("filterHighCut", &BioMining::Bio::RealMEAConfig::filterHighCut)
-        .def_readwrite("bufferSize", &BioMining::Bio::RealMEAConfig::bufferSize)
-        .def_readwrite("stimMaxVoltage", &BioMining::Bio::RealMEAConfig::stimMaxVoltage)
-        .def_readwrite("stimMaxCurrent", &BioMining::Bio::RealMEAConfig::stimMaxCurrent)
-        .def_readwrite("bidirectionalStim", &BioMining::Bio::RealMEAConfig::bidirectionalStim)
-        .def_readwrite("spikeDetection", &BioMining::Bio::RealMEAConfig::spikeDetection)
-        .def_readwrite("spikeThreshold", &BioMining::Bio::RealMEAConfig::spikeThreshold)
-        .def_readwrite("spikeWindowMs", &BioMining::Bio::RealMEAConfig::spikeWindowMs)
-        .def_readwrite("connectionTimeoutMs", &BioMining::Bio::RealMEAConfig::connectionTimeoutMs)
-        .def_readwrite("readTimeoutMs", &BioMining::Bio::RealMEAConfig::readTimeoutMs)
-        .def_readwrite("maxRetries", &BioMining::Bio::RealMEAConfig::maxRetries)
-        .def_readwrite("calibrationFile", &BioMining::Bio::RealMEAConfig::calibrationFile)
-        .def_readwrite("autoCalibration", &BioMining::Bio::RealMEAConfig::autoCalibration);
+        .def_rw("networkHost", &BioMining::Bio::RealMEAConfig::networkHost)
+        .def_rw("networkPort", &BioMining::Bio::RealMEAConfig::networkPort)
+        .def_rw("baudRate", &BioMining::Bio::RealMEAConfig::baudRate)
+        .def_rw("electrodeCount", &BioMining::Bio::RealMEAConfig::electrodeCount)
+        .def_rw("samplingRate", &BioMining::Bio::RealMEAConfig::samplingRate)
+        .def_rw("amplification", &BioMining::Bio::RealMEAConfig::amplification)
+        .def_rw("filterLowCut", &BioMining::Bio::RealMEAConfig::filterLowCut)
+        .def_rw("filterHighCut", &BioMining::Bio::RealMEAConfig::filterHighCut)
+        .def_rw("bufferSize", &BioMining::Bio::RealMEAConfig::bufferSize)
+        .def_rw("stimMaxVoltage", &BioMining::Bio::RealMEAConfig::stimMaxVoltage)
+        .def_rw("stimMaxCurrent", &BioMining::Bio::RealMEAConfig::stimMaxCurrent)
+        .def_rw("bidirectionalStim", &BioMining::Bio::RealMEAConfig::bidirectionalStim)
+        .def_rw("spikeDetection", &BioMining::Bio::RealMEAConfig::spikeDetection)
+        .def_rw("spikeThreshold", &BioMining::Bio::RealMEAConfig::spikeThreshold)
+        .def_rw("spikeWindowMs", &BioMining::Bio::RealMEAConfig::spikeWindowMs)
+        .def_rw("connectionTimeoutMs", &BioMining::Bio::RealMEAConfig::connectionTimeoutMs)
+        .def_rw("readTimeoutMs", &BioMining::Bio::RealMEAConfig::readTimeoutMs)
+        .def_rw("maxRetries", &BioMining::Bio::RealMEAConfig::maxRetries)
+        .def_rw("calibrationFile", &BioMining::Bio::RealMEAConfig::calibrationFile)
+        .def_rw("autoCalibration", &BioMining::Bio::RealMEAConfig::autoCalibration);
     
     // Electrode Data
-    py::class_<BioMining::Bio::ElectrodeData>(m_bio, "ElectrodeData")
-        .def(py::init<>())
-        .def_readwrite("electrodeId", &BioMining::Bio::ElectrodeData::electrodeId)
-        .def_readwrite("voltage", &BioMining::Bio::ElectrodeData::voltage)
-        .def_readwrite("current", &BioMining::Bio::ElectrodeData::current)
-        .def_readwrite("impedance", &BioMining::Bio::ElectrodeData::impedance)
-        .def_readwrite("isActive", &BioMining::Bio::ElectrodeData::isActive)
-        .def_readwrite("signalQuality", &BioMining::Bio::ElectrodeData::signalQuality)
-        .def_readwrite("timestamp", &BioMining::Bio::ElectrodeData::timestamp);
+    nb::class_<BioMining::Bio::ElectrodeData>(m_bio, "ElectrodeData")
+        .def(nb::init<>())
+        .def_rw("electrodeId", &BioMining::Bio::ElectrodeData::electrodeId)
+        .def_rw("voltage", &BioMining::Bio::ElectrodeData::voltage)
+        .def_rw("current", &BioMining::Bio::ElectrodeData::current)
+        .def_rw("impedance", &BioMining::Bio::ElectrodeData::impedance)
+        .def_rw("isActive", &BioMining::Bio::ElectrodeData::isActive)
+        .def_rw("signalQuality", &BioMining::Bio::ElectrodeData::signalQuality)
+        .def_rw("timestamp", &BioMining::Bio::ElectrodeData::timestamp);
     
     // Spike Event
-    py::class_<BioMining::Bio::SpikeEvent>(m_bio, "SpikeEvent")
-        .def(py::init<>())
-        .def_readwrite("electrodeId", &BioMining::Bio::SpikeEvent::electrodeId)
-        .def_readwrite("amplitude", &BioMining::Bio::SpikeEvent::amplitude)
-        .def_readwrite("timestamp", &BioMining::Bio::SpikeEvent::timestamp);
+    nb::class_<BioMining::Bio::SpikeEvent>(m_bio, "SpikeEvent")
+        .def(nb::init<>())
+        .def_rw("electrodeId", &BioMining::Bio::SpikeEvent::electrodeId)
+        .def_rw("amplitude", &BioMining::Bio::SpikeEvent::amplitude)
+        .def_rw("timestamp", &BioMining::Bio::SpikeEvent::timestamp);
     
     // Bitcoin Learning Pattern
-    py::class_<BioMining::Bio::BitcoinLearningPattern>(m_bio, "BitcoinLearningPattern")
-        .def(py::init<>())
-        .def_readwrite("targetNonce", &BioMining::Bio::BitcoinLearningPattern::targetNonce)
-        .def_readwrite("difficulty", &BioMining::Bio::BitcoinLearningPattern::difficulty)
-        .def_readwrite("timestamp", &BioMining::Bio::BitcoinLearningPattern::timestamp)
-        .def_readwrite("successRate", &BioMining::Bio::BitcoinLearningPattern::successRate);
+    nb::class_<BioMining::Bio::BitcoinLearningPattern>(m_bio, "BitcoinLearningPattern")
+        .def(nb::init<>())
+        .def_rw("targetNonce", &BioMining::Bio::BitcoinLearningPattern::targetNonce)
+        .def_rw("difficulty", &BioMining::Bio::BitcoinLearningPattern::difficulty)
+        .def_rw("timestamp", &BioMining::Bio::BitcoinLearningPattern::timestamp)
+        .def_rw("successRate", &BioMining::Bio::BitcoinLearningPattern::successRate);
     
     // Neural Bitcoin Response
-    py::class_<BioMining::Bio::NeuralBitcoinResponse>(m_bio, "NeuralBitcoinResponse")
-        .def(py::init<>())
-        .def_readwrite("inputPattern", &BioMining::Bio::NeuralBitcoinResponse::inputPattern)
-        .def_readwrite("predictedNonce", &BioMining::Bio::NeuralBitcoinResponse::predictedNonce)
-        .def_readwrite("confidence", &BioMining::Bio::NeuralBitcoinResponse::confidence)
-        .def_readwrite("rewardSignal", &BioMining::Bio::NeuralBitcoinResponse::rewardSignal)
-        .def_readwrite("responseTime", &BioMining::Bio::NeuralBitcoinResponse::responseTime);
+    nb::class_<BioMining::Bio::NeuralBitcoinResponse>(m_bio, "NeuralBitcoinResponse")
+        .def(nb::init<>())
+        .def_rw("inputPattern", &BioMining::Bio::NeuralBitcoinResponse::inputPattern)
+        .def_rw("predictedNonce", &BioMining::Bio::NeuralBitcoinResponse::predictedNonce)
+        .def_rw("confidence", &BioMining::Bio::NeuralBitcoinResponse::confidence)
+        .def_rw("rewardSignal", &BioMining::Bio::NeuralBitcoinResponse::rewardSignal)
+        .def_rw("responseTime", &BioMining::Bio::NeuralBitcoinResponse::responseTime);
     
     // Bitcoin Learning Configuration
-    py::class_<BioMining::Bio::BitcoinLearningConfig>(m_bio, "BitcoinLearningConfig")
-        .def(py::init<>())
-        .def_readwrite("learningRate", &BioMining::Bio::BitcoinLearningConfig::learningRate)
-        .def_readwrite("decayRate", &BioMining::Bio::BitcoinLearningConfig::decayRate)
-        .def_readwrite("maxTrainingEpochs", &BioMining::Bio::BitcoinLearningConfig::maxTrainingEpochs)
-        .def_readwrite("targetAccuracy", &BioMining::Bio::BitcoinLearningConfig::targetAccuracy)
-        .def_readwrite("stimulationAmplitude", &BioMining::Bio::BitcoinLearningConfig::stimulationAmplitude)
-        .def_readwrite("stimulationDuration", &BioMining::Bio::BitcoinLearningConfig::stimulationDuration)
-        .def_readwrite("reinforcementDelay", &BioMining::Bio::BitcoinLearningConfig::reinforcementDelay)
-        .def_readwrite("punishmentAmplitude", &BioMining::Bio::BitcoinLearningConfig::punishmentAmplitude)
-        .def_readwrite("enableRealtimeLearning", &BioMining::Bio::BitcoinLearningConfig::enableRealtimeLearning)
-        .def_readwrite("enableBackpropagation", &BioMining::Bio::BitcoinLearningConfig::enableBackpropagation);
+    nb::class_<BioMining::Bio::BitcoinLearningConfig>(m_bio, "BitcoinLearningConfig")
+        .def("__init__", [](BioMining::Bio::BitcoinLearningConfig* self, nb::kwargs kw) {
+            using C = BioMining::Bio::BitcoinLearningConfig;
+            C c{};
+            size_t used = setFromKwargs(c, kw, "learningRate", &C::learningRate)
+                        + setFromKwargs(c, kw, "decayRate", &C::decayRate)
+                        + setFromKwargs(c, kw, "maxTrainingEpochs", &C::maxTrainingEpochs)
+                        + setFromKwargs(c, kw, "targetAccuracy", &C::targetAccuracy)
+                        + setFromKwargs(c, kw, "stimulationAmplitude", &C::stimulationAmplitude)
+                        + setFromKwargs(c, kw, "stimulationDuration", &C::stimulationDuration)
+                        + setFromKwargs(c, kw, "reinforcementDelay", &C::reinforcementDelay)
+                        + setFromKwargs(c, kw, "punishmentAmplitude", &C::punishmentAmplitude)
+                        + setFromKwargs(c, kw, "enableRealtimeLearning", &C::enableRealtimeLearning)
+                        + setFromKwargs(c, kw, "enableBackpropagation", &C::enableBackpropagation);
+            checkKwargs(kw, used, "BitcoinLearningConfig");
+            new (self) C(std::move(c));
+        }, "Constructor; every field can be passed as a keyword argument")
+        .def_rw("learningRate", &BioMining::Bio::BitcoinLearningConfig::learningRate)
+        .def_rw("decayRate", &BioMining::Bio::BitcoinLearningConfig::decayRate)
+        .def_rw("maxTrainingEpochs", &BioMining::Bio::BitcoinLearningConfig::maxTrainingEpochs)
+        .def_rw("targetAccuracy", &BioMining::Bio::BitcoinLearningConfig::targetAccuracy)
+        .def_rw("stimulationAmplitude", &BioMining::Bio::BitcoinLearningConfig::stimulationAmplitude)
+        .def_rw("stimulationDuration", &BioMining::Bio::BitcoinLearningConfig::stimulationDuration)
+        .def_rw("reinforcementDelay", &BioMining::Bio::BitcoinLearningConfig::reinforcementDelay)
+        .def_rw("punishmentAmplitude", &BioMining::Bio::BitcoinLearningConfig::punishmentAmplitude)
+        .def_rw("enableRealtimeLearning", &BioMining::Bio::BitcoinLearningConfig::enableRealtimeLearning)
+        .def_rw("enableBackpropagation", &BioMining::Bio::BitcoinLearningConfig::enableBackpropagation);
     
     // Bitcoin Learning Statistics
-    py::class_<BioMining::Bio::BitcoinLearningStats>(m_bio, "BitcoinLearningStats")
-        .def(py::init<>())
-        .def_readwrite("totalPatternsLearned", &BioMining::Bio::BitcoinLearningStats::totalPatternsLearned)
-        .def_readwrite("successfulPredictions", &BioMining::Bio::BitcoinLearningStats::successfulPredictions)
-        .def_readwrite("totalPredictions", &BioMining::Bio::BitcoinLearningStats::totalPredictions)
-        .def_readwrite("currentAccuracy", &BioMining::Bio::BitcoinLearningStats::currentAccuracy)
-        .def_readwrite("bestAccuracy", &BioMining::Bio::BitcoinLearningStats::bestAccuracy)
-        .def_readwrite("totalTrainingTime", &BioMining::Bio::BitcoinLearningStats::totalTrainingTime);
+    nb::class_<BioMining::Bio::BitcoinLearningStats>(m_bio, "BitcoinLearningStats")
+        .def(nb::init<>())
+        .def_rw("totalPatternsLearned", &BioMining::Bio::BitcoinLearningStats::totalPatternsLearned)
+        .def_rw("successfulPredictions", &BioMining::Bio::BitcoinLearningStats::successfulPredictions)
+        .def_rw("totalPredictions", &BioMining::Bio::BitcoinLearningStats::totalPredictions)
+        .def_rw("currentAccuracy", &BioMining::Bio::BitcoinLearningStats::currentAccuracy)
+        .def_rw("bestAccuracy", &BioMining::Bio::BitcoinLearningStats::bestAccuracy)
+        .def_rw("totalTrainingTime", &BioMining::Bio::BitcoinLearningStats::totalTrainingTime);
     
     // Main RealMEAInterface class
-    py::class_<BioMining::Bio::RealMEAInterface, QObject, std::shared_ptr<BioMining::Bio::RealMEAInterface>>(m_bio, "RealMEAInterface")
-        .def(py::init<>())
+    nb::class_<BioMining::Bio::RealMEAInterface, QObject>(m_bio, "RealMEAInterface")
+        .def(nb::init<>())
+        // Connexion série/réseau potentiellement bloquante: GIL relâché pendant l'appel
         .def("initialize", &BioMining::Bio::RealMEAInterface::initialize,
+             nb::call_guard<nb::gil_scoped_release>(),
              "Initialize MEA interface with configuration")
         .def("disconnect", &BioMining::Bio::RealMEAInterface::disconnect,
              "Disconnect from MEA device")
@@ -413,43 +609,94 @@ PYBIND11_MODULE(biomining_cpp, m) {
              "Stimulate with reinforcement signal");
 
     // BiologicalNetwork enums and structures - NETWORK MODULE
-    py::enum_<BioMining::Network::BiologicalNetwork::LearningState>(m_bio, "LearningState")
+    nb::enum_<BioMining::Network::BiologicalNetwork::LearningState>(m_bio, "LearningState")
         .value("Untrained", BioMining::Network::BiologicalNetwork::LearningState::Untrained)
         .value("InitialLearning", BioMining::Network::BiologicalNetwork::LearningState::InitialLearning)
         .value("Trained", BioMining::Network::BiologicalNetwork::LearningState::Trained)
         .value("Retraining", BioMining::Network::BiologicalNetwork::LearningState::Retraining)
         .value("Optimizing", BioMining::Network::BiologicalNetwork::LearningState::Optimizing);
 
-    py::class_<BioMining::Network::BiologicalNetwork::NetworkConfig>(m_bio, "NetworkConfig")
-        .def(py::init<>())
-        .def_readwrite("neuronCount", &BioMining::Network::BiologicalNetwork::NetworkConfig::neuronCount)
-        .def_readwrite("learningRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::learningRate)
-        .def_readwrite("stimulationThreshold", &BioMining::Network::BiologicalNetwork::NetworkConfig::stimulationThreshold)
-        .def_readwrite("adaptationRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::adaptationRate)
-        .def_readwrite("memoryDepth", &BioMining::Network::BiologicalNetwork::NetworkConfig::memoryDepth)
-        .def_readwrite("useReinforcementLearning", &BioMining::Network::BiologicalNetwork::NetworkConfig::useReinforcementLearning)
-        .def_readwrite("inputSize", &BioMining::Network::BiologicalNetwork::NetworkConfig::inputSize)
-        .def_readwrite("outputSize", &BioMining::Network::BiologicalNetwork::NetworkConfig::outputSize)
-        .def_readwrite("enablePlasticity", &BioMining::Network::BiologicalNetwork::NetworkConfig::enablePlasticity)
-        .def_readwrite("enableAdaptation", &BioMining::Network::BiologicalNetwork::NetworkConfig::enableAdaptation)
-        .def_readwrite("momentum", &BioMining::Network::BiologicalNetwork::NetworkConfig::momentum)
-        .def_readwrite("decayRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::decayRate)
-        .def_readwrite("adaptiveThreshold", &BioMining::Network::BiologicalNetwork::NetworkConfig::adaptiveThreshold)
-        .def_readwrite("maxEpochs", &BioMining::Network::BiologicalNetwork::NetworkConfig::maxEpochs);
+    // Champs exposés via .dtype / Config(record)
+    auto networkRecord = std::make_shared<RecordLayout<BioMining::Network::BiologicalNetwork::NetworkConfig>>();
+    networkRecord->field("neuronCount", &BioMining::Network::BiologicalNetwork::NetworkConfig::neuronCount)
+        .field("learningRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::learningRate)
+        .field("stimulationThreshold", &BioMining::Network::BiologicalNetwork::NetworkConfig::stimulationThreshold)
+        .field("adaptationRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::adaptationRate)
+        .field("memoryDepth", &BioMining::Network::BiologicalNetwork::NetworkConfig::memoryDepth)
+        .field("useReinforcementLearning", &BioMining::Network::BiologicalNetwork::NetworkConfig::useReinforcementLearning)
+        .field("inputSize", &BioMining::Network::BiologicalNetwork::NetworkConfig::inputSize)
+        .field("outputSize", &BioMining::Network::BiologicalNetwork::NetworkConfig::outputSize)
+        .field("enablePlasticity", &BioMining::Network::BiologicalNetwork::NetworkConfig::enablePlasticity)
+        .field("enableAdaptation", &BioMining::Network::BiologicalNetwork::NetworkConfig::enableAdaptation)
+        .field("momentum", &BioMining::Network::BiologicalNetwork::NetworkConfig::momentum)
+        .field("decayRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::decayRate)
+        .field("adaptiveThreshold", &BioMining::Network::BiologicalNetwork::NetworkConfig::adaptiveThreshold)
+        .field("maxEpochs", &BioMining::Network::BiologicalNetwork::NetworkConfig::maxEpochs);
+    nb::class_<BioMining::Network::BiologicalNetwork::NetworkConfig>(m_bio, "NetworkConfig")
+        .def("__init__", [networkRecord](BioMining::Network::BiologicalNetwork::NetworkConfig* self, nb::handle record) {
+            new (self) BioMining::Network::BiologicalNetwork::NetworkConfig(networkRecord->read(record));
+        }, nb::arg("record"), "Constructor from one NumPy record of dtype NetworkConfig.dtype")
+        .def("__init__", [](BioMining::Network::BiologicalNetwork::NetworkConfig* self, nb::kwargs kw) {
+            using C = BioMining::Network::BiologicalNetwork::NetworkConfig;
+            C c{};
+            size_t used = setFromKwargs(c, kw, "neuronCount", &C::neuronCount)
+                        + setFromKwargs(c, kw, "learningRate", &C::learningRate)
+                        + setFromKwargs(c, kw, "stimulationThreshold", &C::stimulationThreshold)
+                        + setFromKwargs(c, kw, "adaptationRate", &C::adaptationRate)
+                        + setFromKwargs(c, kw, "memoryDepth", &C::memoryDepth)
+                        + setFromKwargs(c, kw, "useReinforcementLearning", &C::useReinforcementLearning)
+                        + setFromKwargs(c, kw, "inputSize", &C::inputSize)
+                        + setFromKwargs(c, kw, "outputSize", &C::outputSize)
+                        + setFromKwargs(c, kw, "enablePlasticity", &C::enablePlasticity)
+                        + setFromKwargs(c, kw, "enableAdaptation", &C::enableAdaptation)
+                        + setFromKwargs(c, kw, "momentum", &C::momentum)
+                        + setFromKwargs(c, kw, "decayRate", &C::decayRate)
+                        + setFromKwargs(c, kw, "adaptiveThreshold", &C::adaptiveThreshold)
+                        + setFromKwargs(c, kw, "maxEpochs", &C::maxEpochs);
+            checkKwargs(kw, used, "NetworkConfig");
+            new (self) C(std::move(c));
+        }, "Constructor; every field can be passed as a keyword argument")
+        .def_prop_ro_static("dtype", [networkRecord](nb::handle) { return networkRecord->descr(); },
+            "Packed NumPy dtype of the numeric fields (string fields are not included)")
+        .def_rw("neuronCount", &BioMining::Network::BiologicalNetwork::NetworkConfig::neuronCount)
+        .def_rw("learningRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::learningRate)
+        .def_rw("stimulationThreshold", &BioMining::Network::BiologicalNetwork::NetworkConfig::stimulationThreshold)
+        .def_rw("adaptationRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::adaptationRate)
+        .def_rw("memoryDepth", &BioMining::Network::BiologicalNetwork::NetworkConfig::memoryDepth)
+        .def_rw("useReinforcementLearning", &BioMining::Network::BiologicalNetwork::NetworkConfig::useReinforcementLearning)
+        .def_rw("inputSize", &BioMining::Network::BiologicalNetwork::NetworkConfig::inputSize)
+        .def_rw("outputSize", &BioMining::Network::BiologicalNetwork::NetworkConfig::outputSize)
+        .def_rw("enablePlasticity", &BioMining::Network::BiologicalNetwork::NetworkConfig::enablePlasticity)
+        .def_rw("enableAdaptation", &BioMining::Network::BiologicalNetwork::NetworkConfig::enableAdaptation)
+        .def_rw("momentum", &BioMining::Network::BiologicalNetwork::NetworkConfig::momentum)
+        .def_rw("decayRate", &BioMining::Network::BiologicalNetwork::NetworkConfig::decayRate)
+        .def_rw("adaptiveThreshold", &BioMining::Network::BiologicalNetwork::NetworkConfig::adaptiveThreshold)
+        .def_rw("maxEpochs", &BioMining::Network::BiologicalNetwork::NetworkConfig::maxEpochs);
 
-    py::class_<BioMining::Network::BiologicalNetwork::NoncePredicition>(m_bio, "NoncePredicition")
-        .def(py::init<>())
-        .def_readwrite("suggestedNonce", &BioMining::Network::BiologicalNetwork::NoncePredicition::suggestedNonce)
-        .def_readwrite("confidence", &BioMining::Network::BiologicalNetwork::NoncePredicition::confidence)
-        .def_readwrite("expectedEfficiency", &BioMining::Network::BiologicalNetwork::NoncePredicition::expectedEfficiency)
-        .def_readwrite("reasoning", &BioMining::Network::BiologicalNetwork::NoncePredicition::reasoning);
+    nb::class_<BioMining::Network::BiologicalNetwork::NoncePredicition>(m_bio, "NoncePredicition")
+        .def(nb::init<>())
+        .def_rw("suggestedNonce", &BioMining::Network::BiologicalNetwork::NoncePredicition::suggestedNonce)
+        .def_rw("confidence", &BioMining::Network::BiologicalNetwork::NoncePredicition::confidence)
+        .def_rw("expectedEfficiency", &BioMining::Network::BiologicalNetwork::NoncePredicition::expectedEfficiency)
+        .def_rw("reasoning", &BioMining::Network::BiologicalNetwork::NoncePredicition::reasoning);
 
-    py::class_<BioMining::Network::BiologicalNetwork::LearningData>(m_bio, "LearningData")
-        .def(py::init<>())
-        .def_readwrite("targetNonce", &BioMining::Network::BiologicalNetwork::LearningData::targetNonce)
-        //.def_readwrite("blockHeader", &BioMining::Network::BiologicalNetwork::LearningData::blockHeader)
+    nb::class_<BioMining::Network::BiologicalNetwork::LearningData>(m_bio, "LearningData")
+        .def("__init__", [](BioMining::Network::BiologicalNetwork::LearningData* self, nb::kwargs kw) {
+            using C = BioMining::Network::BiologicalNetwork::LearningData;
+            C c{};
+            size_t used = setFromKwargs(c, kw, "targetNonce", &C::targetNonce)
+                        + setFromKwargs(c, kw, "blockHeader", &C::blockHeader)
+                        + setFromKwargs(c, kw, "difficulty", &C::difficulty)
+                        + setFromKwargs(c, kw, "wasSuccessful", &C::wasSuccessful)
+                        + setFromKwargs(c, kw, "attempts", &C::attempts)
+                        + setFromKwargs(c, kw, "computeTime", &C::computeTime);
+            checkKwargs(kw, used, "LearningData");
+            new (self) C(std::move(c));
+        }, "Constructor; every field can be passed as a keyword argument")
+        .def_rw("targetNonce", &BioMining::Network::BiologicalNetwork::LearningData::targetNonce)
+        //.def_rw("blockHeader", &BioMining::Network::BiologicalNetwork::LearningData::blockHeader)
         // Custom setter/getter for blockHeader as str <-> QString
-        .def_property("blockHeader",
+        .def_prop_rw("blockHeader",
             [](const BioMining::Network::BiologicalNetwork::LearningData& self) {
                 return self.blockHeader.toStdString();
             },
@@ -457,21 +704,24 @@ PYBIND11_MODULE(biomining_cpp, m) {
                 self.blockHeader = QString::fromStdString(s);
             }
         )
-        .def_readwrite("difficulty", &BioMining::Network::BiologicalNetwork::LearningData::difficulty)
-        .def_readwrite("wasSuccessful", &BioMining::Network::BiologicalNetwork::LearningData::wasSuccessful)
-        .def_readwrite("attempts", &BioMining::Network::BiologicalNetwork::LearningData::attempts)
-        .def_readwrite("computeTime", &BioMining::Network::BiologicalNetwork::LearningData::computeTime);
+        .def_rw("difficulty", &BioMining::Network::BiologicalNetwork::LearningData::difficulty)
+        .def_rw("wasSuccessful", &BioMining::Network::BiologicalNetwork::LearningData::wasSuccessful)
+        .def_rw("attempts", &BioMining::Network::BiologicalNetwork::LearningData::attempts)
+        .def_rw("computeTime", &BioMining::Network::BiologicalNetwork::LearningData::computeTime);
 
     // BiologicalNetwork class bindings - NETWORK MODULE
-    py::class_<BioMining::Network::BiologicalNetwork, QObject, std::shared_ptr<BioMining::Network::BiologicalNetwork>>(m_bio, "BiologicalNetwork")
-        .def(py::init<>(), "Default constructor")
-        //.def(py::init<int, int>(), "Constructor with neuron and synapse counts")
-        .def(py::init<QObject*>(), py::arg("parent") = nullptr, "Default constructor with optional QObject parent")
+    nb::class_<BioMining::Network::BiologicalNetwork, QObject>(m_bio, "BiologicalNetwork")
+        .def(nb::init<>(), "Default constructor")
+        //.def(nb::init<int, int>(), "Constructor with neuron and synapse counts")
+        .def(nb::init<QObject*>(), nb::arg("parent").none() = nb::none(), "Default constructor with optional QObject parent")
+        // (Ré)allocation du réseau: GIL relâché pendant l'appel C++
         .def("initialize", &BioMining::Network::BiologicalNetwork::initialize,
+             nb::call_guard<nb::gil_scoped_release>(),
              "Initialize the biological network")
         
         // Configuration methods
         .def("setNetworkConfig", &BioMining::Network::BiologicalNetwork::setNetworkConfig,
+             nb::call_guard<nb::gil_scoped_release>(),
              "Set network configuration")
         .def("getNetworkConfig", &BioMining::Network::BiologicalNetwork::getNetworkConfig,
              "Get network configuration")
@@ -488,7 +738,7 @@ PYBIND11_MODULE(biomining_cpp, m) {
              
         // Learning methods
         .def("startInitialLearning", &BioMining::Network::BiologicalNetwork::startInitialLearning,
-             "Start initial learning phase", py::arg("trainingCycles") = 100)
+             "Start initial learning phase", nb::arg("trainingCycles") = 100)
         .def("stopLearning", &BioMining::Network::BiologicalNetwork::stopLearning,
              "Stop the learning process")
         .def("isLearningComplete", &BioMining::Network::BiologicalNetwork::isLearningComplete,
@@ -510,9 +760,9 @@ PYBIND11_MODULE(biomining_cpp, m) {
         
         // Persistence methods
         .def("saveNetwork", &BioMining::Network::BiologicalNetwork::saveNetwork,
-             "Save network to file", py::arg("filepath") = "")
+             "Save network to file", nb::arg("filepath") = "")
         .def("loadNetwork", &BioMining::Network::BiologicalNetwork::loadNetwork,
-             "Load network from file", py::arg("filepath") = "")
+             "Load network from file", nb::arg("filepath") = "")
         .def("exportNetworkState", &BioMining::Network::BiologicalNetwork::exportNetworkState,
              "Export current network state as JSON")
         .def("importNetworkState", &BioMining::Network::BiologicalNetwork::importNetworkState,
@@ -547,28 +797,28 @@ PYBIND11_MODULE(biomining_cpp, m) {
     // ==========================================================================
     
     // ComputeMode enum for IBioComputeInterface
-    py::enum_<BioMining::Bio::IBioComputeInterface::ComputeMode>(m_bio, "ComputeMode")
+    nb::enum_<BioMining::Bio::IBioComputeInterface::ComputeMode>(m_bio, "ComputeMode")
         .value("RealMEA", BioMining::Bio::IBioComputeInterface::ComputeMode::RealMEA)
         .value("SimulatedNetwork", BioMining::Bio::IBioComputeInterface::ComputeMode::SimulatedNetwork);
     
     // StimulusPattern structure
-    py::class_<BioMining::Bio::IBioComputeInterface::StimulusPattern>(m_bio, "StimulusPattern")
-        .def(py::init<>())
-        .def_readwrite("amplitudes", &BioMining::Bio::IBioComputeInterface::StimulusPattern::amplitudes)
-        .def_readwrite("frequencies", &BioMining::Bio::IBioComputeInterface::StimulusPattern::frequencies)
-        .def_readwrite("durationMs", &BioMining::Bio::IBioComputeInterface::StimulusPattern::durationMs);
+    nb::class_<BioMining::Bio::IBioComputeInterface::StimulusPattern>(m_bio, "StimulusPattern")
+        .def(nb::init<>())
+        .def_rw("amplitudes", &BioMining::Bio::IBioComputeInterface::StimulusPattern::amplitudes)
+        .def_rw("frequencies", &BioMining::Bio::IBioComputeInterface::StimulusPattern::frequencies)
+        .def_rw("durationMs", &BioMining::Bio::IBioComputeInterface::StimulusPattern::durationMs);
     
     // BioResponse structure
-    py::class_<BioMining::Bio::IBioComputeInterface::BioResponse>(m_bio, "BioResponse")
-        .def(py::init<>())
-        .def_readwrite("rsignals", &BioMining::Bio::IBioComputeInterface::BioResponse::rsignals)
-        .def_readwrite("responseStrength", &BioMining::Bio::IBioComputeInterface::BioResponse::responseStrength)
-        .def_readwrite("signalQuality", &BioMining::Bio::IBioComputeInterface::BioResponse::signalQuality)
-        .def_readwrite("responseTime", &BioMining::Bio::IBioComputeInterface::BioResponse::responseTime)
-        .def_readwrite("isValid", &BioMining::Bio::IBioComputeInterface::BioResponse::isValid);
+    nb::class_<BioMining::Bio::IBioComputeInterface::BioResponse>(m_bio, "BioResponse")
+        .def(nb::init<>())
+        .def_rw("rsignals", &BioMining::Bio::IBioComputeInterface::BioResponse::rsignals)
+        .def_rw("responseStrength", &BioMining::Bio::IBioComputeInterface::BioResponse::responseStrength)
+        .def_rw("signalQuality", &BioMining::Bio::IBioComputeInterface::BioResponse::signalQuality)
+        .def_rw("responseTime", &BioMining::Bio::IBioComputeInterface::BioResponse::responseTime)
+        .def_rw("isValid", &BioMining::Bio::IBioComputeInterface::BioResponse::isValid);
     
     // IBioComputeInterface abstract base class
-    py::class_<BioMining::Bio::IBioComputeInterface, QObject, std::shared_ptr<BioMining::Bio::IBioComputeInterface>>(m_bio, "IBioComputeInterface")
+    nb::class_<BioMining::Bio::IBioComputeInterface, QObject>(m_bio, "IBioComputeInterface")
         .def("getComputeMode", &BioMining::Bio::IBioComputeInterface::getComputeMode,
              "Get current compute mode (RealMEA or SimulatedNetwork)")
         .def("initialize", &BioMining::Bio::IBioComputeInterface::initialize,
@@ -576,15 +826,15 @@ PYBIND11_MODULE(biomining_cpp, m) {
         .def("applyStimulus", &BioMining::Bio::IBioComputeInterface::applyStimulus,
              "Apply stimulus pattern to biological system")
         .def("captureResponse", &BioMining::Bio::IBioComputeInterface::captureResponse,
-             "Capture biological response", py::arg("waitTimeMs") = 100)
+             "Capture biological response", nb::arg("waitTimeMs") = 100)
         .def("stimulateAndCapture", &BioMining::Bio::IBioComputeInterface::stimulateAndCapture,
              "Stimulate and immediately capture response")
         .def("reinforcePattern", &BioMining::Bio::IBioComputeInterface::reinforcePattern,
              "Reinforce successful pattern with reward");
     
     // RealMEAAdapter class
-    py::class_<BioMining::Bio::RealMEAAdapter, BioMining::Bio::IBioComputeInterface, std::shared_ptr<BioMining::Bio::RealMEAAdapter>>(m_bio, "RealMEAAdapter")
-        .def(py::init<>())
+    nb::class_<BioMining::Bio::RealMEAAdapter, BioMining::Bio::IBioComputeInterface>(m_bio, "RealMEAAdapter")
+        .def(nb::init<>())
         .def("getComputeMode", &BioMining::Bio::RealMEAAdapter::getComputeMode,
              "Returns ComputeMode::RealMEA")
         .def("initialize", &BioMining::Bio::RealMEAAdapter::initialize,
@@ -599,8 +849,8 @@ PYBIND11_MODULE(biomining_cpp, m) {
              "Reinforce successful MEA pattern");
     
     // BiologicalNetworkAdapter class
-    py::class_<BioMining::Bio::BiologicalNetworkAdapter, BioMining::Bio::IBioComputeInterface, std::shared_ptr<BioMining::Bio::BiologicalNetworkAdapter>>(m_bio, "BiologicalNetworkAdapter")
-        .def(py::init<>())
+    nb::class_<BioMining::Bio::BiologicalNetworkAdapter, BioMining::Bio::IBioComputeInterface>(m_bio, "BiologicalNetworkAdapter")
+        .def(nb::init<>())
         .def("getComputeMode", &BioMining::Bio::BiologicalNetworkAdapter::getComputeMode,
              "Returns ComputeMode::SimulatedNetwork")
         .def("initialize", &BioMining::Bio::BiologicalNetworkAdapter::initialize,
@@ -615,30 +865,30 @@ PYBIND11_MODULE(biomining_cpp, m) {
              "Reinforce successful network pattern");
     
     // BioEntropyGenerator structures
-    py::class_<BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures>(m_bio, "BlockHeaderFeatures")
-        .def(py::init<>())
-        .def_readwrite("timestampNorm", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::timestampNorm)
-        .def_readwrite("difficultyLevel", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::difficultyLevel)
-        .def_readwrite("prevHashEntropy", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::prevHashEntropy)
-        .def_readwrite("prevHashLeadingZeros", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::prevHashLeadingZeros)
-        .def_readwrite("merkleEntropy", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::merkleEntropy)
-        .def_readwrite("prevHashBytes", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::prevHashBytes)
-        .def_readwrite("merkleBytes", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::merkleBytes);
-    
-    py::class_<BioMining::Crypto::BioEntropyGenerator::BioEntropySeed>(m_bio, "BioEntropySeed")
-        .def(py::init<>())
-        .def_readwrite("primarySeed", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::primarySeed)
-        .def_readwrite("diverseSeeds", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::diverseSeeds)
-        .def_readwrite("confidence", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::confidence)
-        .def_readwrite("responseStrength", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::responseStrength)
-        .def_readwrite("rawResponse", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::rawResponse);
-    
-    py::class_<BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints>(m_bio, "SmartStartingPoints")
-        .def(py::init<>())
-        .def_readwrite("nonceStarts", &BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints::nonceStarts)
-        .def_readwrite("windowSize", &BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints::windowSize)
-        .def_readwrite("expectedCoverage", &BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints::expectedCoverage)
-        .def_property("strategy",
+    nb::class_<BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures>(m_bio, "BlockHeaderFeatures")
+        .def(nb::init<>())
+        .def_rw("timestampNorm", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::timestampNorm)
+        .def_rw("difficultyLevel", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::difficultyLevel)
+        .def_rw("prevHashEntropy", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::prevHashEntropy)
+        .def_rw("prevHashLeadingZeros", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::prevHashLeadingZeros)
+        .def_rw("merkleEntropy", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::merkleEntropy)
+        .def_rw("prevHashBytes", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::prevHashBytes)
+        .def_rw("merkleBytes", &BioMining::Crypto::BioEntropyGenerator::BlockHeaderFeatures::merkleBytes);
+    
+    nb::class_<BioMining::Crypto::BioEntropyGenerator::BioEntropySeed>(m_bio, "BioEntropySeed")
+        .def(nb::init<>())
+        .def_rw("primarySeed", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::primarySeed)
+        .def_rw("diverseSeeds", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::diverseSeeds)
+        .def_rw("confidence", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::confidence)
+        .def_rw("responseStrength", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::responseStrength)
+        .def_rw("rawResponse", &BioMining::Crypto::BioEntropyGenerator::BioEntropySeed::rawResponse);
+    
+    nb::class_<BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints>(m_bio, "SmartStartingPoints")
+        .def(nb::init<>())
+        .def_rw("nonceStarts", &BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints::nonceStarts)
+        .def_rw("windowSize", &BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints::windowSize)
+        .def_rw("expectedCoverage", &BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints::expectedCoverage)
+        .def_prop_rw("strategy",
             [](const BioMining::Crypto::BioEntropyGenerator::SmartStartingPoints& self) {
                 return self.strategy.toStdString();
             },
@@ -647,25 +897,63 @@ PYBIND11_MODULE(biomining_cpp, m) {
             }
         );
     
-    // BioEntropyGenerator class (inherits from QObject, needs nodelete holder)
-    py::class_<BioMining::Crypto::BioEntropyGenerator, QObject, std::shared_ptr<BioMining::Crypto::BioEntropyGenerator>>(m_bio, "BioEntropyGenerator")
-        .def(py::init<>())
+    // BioEntropyGenerator class (inherits from QObject)
+    nb::class_<BioMining::Crypto::BioEntropyGenerator, QObject>(m_bio, "BioEntropyGenerator")
+        .def(nb::init<>())
         .def("extractHeaderFeatures", &BioMining::Crypto::BioEntropyGenerator::extractHeaderFeatures,
              "Extract 60-dimensional features from block header",
-             py::arg("blockHeader"), py::arg("difficulty"))
+             nb::arg("blockHeader"), nb::arg("difficulty"))
         .def("featuresToStimulus", &BioMining::Crypto::BioEntropyGenerator::featuresToStimulus,
              "Convert features to biological stimulus pattern",
-             py::arg("features"), py::arg("maxVoltage") = 3.0)
+             nb::arg("features"), nb::arg("maxVoltage") = 3.0)
         .def("generateEntropySeed", &BioMining::Crypto::BioEntropyGenerator::generateEntropySeed,
              "Generate entropy seed from biological response",
-             py::arg("meaResponse"), py::arg("features"))
+             nb::arg("meaResponse"), nb::arg("features"))
         .def("generateStartingPoints", &BioMining::Crypto::BioEntropyGenerator::generateStartingPoints,
              "Generate smart starting points from entropy seed",
-             py::arg("seed"), py::arg("pointCount") = 1000, py::arg("windowSize") = 4194304)
+             nb::arg("seed"), nb::arg("pointCount") = 1000, nb::arg("windowSize") = 4194304)
         .def("reinforceSuccessfulPattern", &BioMining::Crypto::BioEntropyGenerator::reinforceSuccessfulPattern,
              "Reinforce pattern that led to successful nonce",
-             py::arg("features"), py::arg("response"), py::arg("nonce"))
+             nb::arg("features"), nb::arg("response"), nb::arg("nonce"))
         .def("getEntropyStats", &BioMining::Crypto::BioEntropyGenerator::getEntropyStats,
              "Get entropy generation statistics");
+}
+
+NB_MODULE(biomining_cpp, m) {
+    m.doc() = "BioMining C++ Python bindings";
+
+    // Register QObject for inheritance (Python-owned instances, no holder type)
+    nb::class_<QObject>(m, "QObject");
+
     
+    m.def("install_qt_logger", []() {
+    qInstallMessageHandler(cloudrunQtLogger);
+    }, "Installe un handler Qt qui redirige tous les logs Qt vers stderr");
+
+    // crypto et bio sont créés à la demande (PEP 562): un import qui n'utilise que
+    // install_qt_logger (sonde de start_server_safe) ou un seul sous-module
+    // n'enregistre pas toutes les classes
+    PyObject* mod = m.ptr();
+    m.def("__getattr__", [mod](const std::string& name) -> nb::object {
+        nb::module_ pkg = nb::borrow<nb::module_>(mod);
+        if (name == "crypto") {
+            nb::module_ m_crypto = pkg.def_submodule("crypto", "Cryptographic mining module");
+            registerCrypto(m_crypto);
+            return m_crypto;
+        }
+        if (name == "bio") {
+            nb::module_ m_bio = pkg.def_submodule("bio", "Biological interface module");
+            registerBio(m_bio);
+            return m_bio;
+        }
+        throw nb::attribute_error(("module 'biomining_cpp' has no attribute '" + name + "'").c_str());
+    });
+    m.def("__dir__", [mod]() {
+        nb::dict attrs = nb::borrow<nb::dict>(PyModule_GetDict(mod));
+        nb::list names = attrs.keys();
+        for (const char* sub : {"crypto", "bio"}) {
+            if (!attrs.contains(sub)) names.append(sub);
+        }
+        return names;
+    });
 }
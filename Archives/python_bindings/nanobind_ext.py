@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Setuptools helpers for building nanobind extensions without CMake
+
+Drop-in replacement for pybind11.setup_helpers in the setup scripts:
+NanobindExtension takes the same arguments as Pybind11Extension
+(cxx_std included) and compiles nanobind's runtime (nb_combined.cpp)
+into the module, like nanobind_add_module(... NB_STATIC) does.
+"""
+
+import os
+
+import nanobind
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+
+__all__ = ["NanobindExtension", "build_ext"]
+
+
+def NanobindExtension(name, sources, *, include_dirs=(), cxx_std=17, extra_compile_args=(), **kwargs):
+    """Extension compiled against nanobind (headers + statically built runtime)"""
+    nb_src = nanobind.source_dir()
+    robin_map = os.path.join(os.path.dirname(nb_src), "ext", "robin_map", "include")
+    return Extension(
+        name,
+        [*sources, os.path.join(nb_src, "nb_combined.cpp")],
+        include_dirs=[*include_dirs, nanobind.include_dir(), robin_map],
+        extra_compile_args=[f"-std=c++{cxx_std}", "-fvisibility=hidden", "-fno-strict-aliasing",
+                            *extra_compile_args],
+        **kwargs,
+    )
@@ -8,7 +8,7 @@ import sys
 import subprocess
 from pathlib import Path
 
-from pybind11.setup_helpers import Pybind11Extension, build_ext
+from nanobind_ext import NanobindExtension, build_ext
 from setuptools import setup, Extension
 
 # Check if Qt6 is available
@@ -88,7 +88,7 @@ else:
 
 # Define the extension module
 ext_modules = [
-    Pybind11Extension(
+    NanobindExtension(
         "biomining_cpp",
         [
             "biomining_python.cpp",
@@ -125,7 +125,6 @@ class CustomBuildExt(build_ext):
                 '-DQT_NETWORK_LIB',
                 '-DQT_SERIALPORT_LIB',
                 '-std=c++17',
-                '-DPYBIND11_DETAILED_ERROR_MESSAGES',  # Ajout ici
          ])
             
             if sys.platform == 'darwin':  # macOS
@@ -146,6 +145,6 @@ setup(
     zip_safe=False,
     python_requires=">=3.8",
     install_requires=[
-        "pybind11>=2.6",
+        "nanobind>=2.0",
     ],
 )
@@ -4,15 +4,97 @@ Demo de l'Interface MEA Réelle - BioMining Platform
 Serveur de démonstration pour montrer les fonctionnalités de l'interface MEA réelle
 """
 
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response, request
+import argparse
+import functools
+import gzip
+import importlib.util
+import json
+import os
+import sys
+import threading
 import time
-import random
 from datetime import datetime
 
+import numpy as np
+
 app = Flask(__name__)
 
-# Template HTML pour la démo
-HTML_TEMPLATE = """
+# Générateur unique des données simulées (PCG64, tirages vectorisés)
+rng = np.random.default_rng()
+
+# Horodatage ISO mis en cache (résolution 100 ms)
+_TS_CACHE = [0.0, ""]
+
+
+def _now_iso():
+    """Horodatage ISO courant, recalculé au plus toutes les 100 ms"""
+    t = time.time()
+    if t - _TS_CACHE[0] > 0.1:
+        _TS_CACHE[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _TS_CACHE[1]
+
+# Sérialisation JSON: orjson (Rust, tableaux NumPy natifs) si disponible
+try:
+    import orjson
+
+    def _json_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_default(obj):
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        raise TypeError(f"{type(obj).__name__} non sérialisable en JSON")
+
+    def _json_bytes(obj):
+        return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def _json(obj):
+    """Réponse JSON sans passer par jsonify"""
+    return Response(_json_bytes(obj), mimetype="application/json")
+
+# Cache des endpoints sondés: données "live" tolérant 1-2 s de retard
+try:
+    from flask_caching import Cache
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 2})
+    cached = cache.cached
+except ImportError:
+    def cached(timeout=2):
+        """Repli sans Flask-Caching: mémorise la réponse pendant timeout secondes"""
+        def decorator(view):
+            lock = threading.Lock()
+            entry = [0.0, None]
+
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                with lock:
+                    now = time.monotonic()
+                    if entry[1] is None or now - entry[0] >= timeout:
+                        entry[1] = view(*args, **kwargs)
+                        entry[0] = now
+                    return entry[1]
+            return wrapper
+        return decorator
+
+
+def stale_on_error(view):
+    """Sert la dernière réponse valide si la génération échoue"""
+    last = [None]
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            last[0] = view(*args, **kwargs)
+        except Exception:
+            if last[0] is None:
+                raise
+            app.logger.exception("Erreur %s: réponse précédente servie", view.__name__)
+        return last[0]
+    return wrapper
+
+# Template HTML pour la démo (__ELECTRODES__: grille rendue côté serveur)
+TEMPLATE_SHELL = """
 <!DOCTYPE html>
 <html lang="fr">
 <head>
@@ -207,9 +289,7 @@ HTML_TEMPLATE = """
 
         <div class="status-card">
             <h3>Matrice des Électrodes (60x)</h3>
-            <div class="electrode-grid" id="electrode-grid">
-                <!-- Électrodes générées en JavaScript -->
-            </div>
+            <div class="electrode-grid" id="electrode-grid">__ELECTRODES__</div>
         </div>
 
         <div class="controls">
@@ -222,7 +302,7 @@ HTML_TEMPLATE = """
 
         <div class="status-card">
             <h3>Journal d'Événements</h3>
-            <div class="log" id="event-log"></div>
+            <pre class="log" id="event-log"></pre>
         </div>
     </div>
 
@@ -230,19 +310,8 @@ HTML_TEMPLATE = """
         let spikeCount = 0;
         let isAcquiring = true;
         let stimulatingElectrode = -1;
-
-        // Initialiser la grille d'électrodes
-        function initElectrodes() {
-            const grid = document.getElementById('electrode-grid');
-            for (let i = 0; i < 60; i++) {
-                const electrode = document.createElement('div');
-                electrode.className = 'electrode active';
-                electrode.id = `electrode-${i}`;
-                electrode.textContent = i + 1;
-                electrode.title = `Électrode ${i + 1}`;
-                grid.appendChild(electrode);
-            }
-        }
+        // Références DOM, indexées par électrode (grille rendue côté serveur)
+        const electrodeNodes = Array.from(document.querySelectorAll('#electrode-grid .electrode'));
 
         // Simuler l'activité des spikes
         function simulateSpikes() {
@@ -250,7 +319,7 @@ HTML_TEMPLATE = """
 
             if (Math.random() < 0.15) { // 15% de chance de spike
                 const electrodeId = Math.floor(Math.random() * 60);
-                const electrode = document.getElementById(`electrode-${electrodeId}`);
+                const electrode = electrodeNodes[electrodeId];
                 
                 electrode.classList.add('spike-detected');
                 setTimeout(() => {
@@ -264,6 +333,29 @@ HTML_TEMPLATE = """
             }
         }
 
+        // Charger l'état des électrodes (binaire SoA, voir /api/electrodes.bin)
+        async function updateElectrodes() {
+            try {
+                const buffer = await (await fetch('/api/electrodes.bin')).arrayBuffer();
+                const impedance = new Float32Array(buffer, 240, 60);
+                const active = new Uint8Array(buffer, 720, 60);
+                
+                let activeCount = 0;
+                let impedanceSum = 0;
+                for (let i = 0; i < 60; i++) {
+                    const electrode = electrodeNodes[i];
+                    electrode.classList.toggle('active', active[i] === 1);
+                    electrode.classList.toggle('inactive', active[i] === 0);
+                    activeCount += active[i];
+                    impedanceSum += impedance[i];
+                }
+                document.getElementById('active-electrodes').textContent = `${activeCount}/60`;
+                document.getElementById('impedance').textContent = (impedanceSum / 60).toFixed(1) + ' MΩ';
+            } catch (error) {
+                console.error('Erreur électrodes:', error);
+            }
+        }
+
         // Mettre à jour l'horodatage
         function updateTimestamp() {
             const now = new Date();
@@ -275,11 +367,27 @@ HTML_TEMPLATE = """
         }
 
         // Ajouter un événement au journal
+        // Journal borné: un nœud texte par ligne, les plus anciennes retirées
+        const LOG_MAX_LINES = 200;
+        const logEl = document.getElementById('event-log');
+        let logCount = 0;
+        let logScrollPending = false;
+
         function logEvent(message) {
-            const log = document.getElementById('event-log');
             const timestamp = new Date().toLocaleTimeString();
-            log.innerHTML += `[${timestamp}] ${message}\\n`;
-            log.scrollTop = log.scrollHeight;
+            logEl.appendChild(document.createTextNode(`[${timestamp}] ${message}\\n`));
+            if (++logCount > LOG_MAX_LINES) {
+                logEl.removeChild(logEl.firstChild);
+                logCount--;
+            }
+            // Un seul défilement par frame, même pour plusieurs lignes
+            if (!logScrollPending) {
+                logScrollPending = true;
+                requestAnimationFrame(() => {
+                    logEl.scrollTop = logEl.scrollHeight;
+                    logScrollPending = false;
+                });
+            }
         }
 
         // Fonctions de contrôle
@@ -302,7 +410,7 @@ HTML_TEMPLATE = """
             const electrodes = [5, 15, 25, 35, 45];
             electrodes.forEach((id, index) => {
                 setTimeout(() => {
-                    const electrode = document.getElementById(`electrode-${id}`);
+                    const electrode = electrodeNodes[id];
                     electrode.style.background = '#FFA500';
                     setTimeout(() => {
                         electrode.style.background = '#4CAF50';
@@ -323,7 +431,7 @@ HTML_TEMPLATE = """
             }
             
             stimulatingElectrode = Math.floor(Math.random() * 60);
-            const electrode = document.getElementById(`electrode-${stimulatingElectrode}`);
+            const electrode = electrodeNodes[stimulatingElectrode];
             
             electrode.classList.add('stimulating');
             logEvent(`Stimulation électrode ${stimulatingElectrode + 1} (2.5V, 100μA, 5ms)`);
@@ -339,77 +447,169 @@ HTML_TEMPLATE = """
         function resetSystem() {
             spikeCount = 0;
             document.getElementById('spike-count').textContent = '0';
-            document.getElementById('event-log').innerHTML = '';
+            logEl.textContent = '';
+            logCount = 0;
             logEvent('Système réinitialisé');
             logEvent('Interface MEA Réelle - Prête');
         }
 
+        // Boucle de rafraîchissement unique
+        let lastSpike = 0, lastTimestamp = 0, lastElectrodes = 0;
+        function tick(t) {
+            if (t - lastSpike >= 800) {
+                simulateSpikes();
+                lastSpike = t;
+            }
+            if (t - lastTimestamp >= 1000) {
+                updateTimestamp();
+                lastTimestamp = t;
+            }
+            if (t - lastElectrodes >= 2000) {
+                updateElectrodes();
+                lastElectrodes = t;
+            }
+            requestAnimationFrame(tick);
+        }
+
         // Initialisation
         window.onload = function() {
-            initElectrodes();
             logEvent('Interface MEA Réelle initialisée');
             logEvent('Dispositif: Multi Channel Systems MEA2100');
             logEvent('60 électrodes détectées et configurées');
             logEvent('Calibration automatique effectuée');
             logEvent('Système prêt pour acquisition');
             
-            // Démarrer les mises à jour
-            setInterval(simulateSpikes, 800);
-            setInterval(updateTimestamp, 1000);
+            // Démarrer les mises à jour: une seule boucle rAF cadencée par
+            // performance.now() (suspendue quand l'onglet est masqué)
+            requestAnimationFrame(tick);
         };
     </script>
 </body>
 </html>
 """
 
+# Grille statique: les 60 électrodes sont insérées une fois à l'import
+ELECTRODES_HTML = "".join(
+    f'<div class="electrode active" id="electrode-{i}" title="Électrode {i + 1}">{i + 1}</div>'
+    for i in range(60)
+)
+HTML_TEMPLATE = TEMPLATE_SHELL.replace("__ELECTRODES__", ELECTRODES_HTML)
+
+# Le template n'a aucune substitution Jinja: page encodée (et compressée) une seule fois
+_HTML_BYTES = HTML_TEMPLATE.encode("utf-8")
+_HTML_GZ = gzip.compress(_HTML_BYTES, 6)
+
 @app.route('/')
 def index():
     """Page principale de démonstration"""
-    return render_template_string(HTML_TEMPLATE)
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = Response(_HTML_GZ, mimetype="text/html")
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(_HTML_BYTES, mimetype="text/html")
+    response.headers['Cache-Control'] = "public, max-age=3600"
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/api/status')
+@stale_on_error
+@cached(timeout=2)
 def api_status():
     """API pour récupérer le statut du système MEA"""
-    return jsonify({
+    return _json({
         'status': 'connected',
         'device': 'Multi Channel Systems MEA2100',
         'active_electrodes': 60,
         'sampling_rate': 25000,
-        'signal_quality': round(95 + random.random() * 4, 1),
-        'spike_count': random.randint(0, 150),
-        'impedance_avg': round(1.0 + random.random() * 0.5, 2),
-        'timestamp': datetime.now().isoformat(),
+        'signal_quality': round(95 + float(rng.random()) * 4, 1),
+        'spike_count': int(rng.integers(0, 151)),
+        'impedance_avg': round(1.0 + float(rng.random()) * 0.5, 2),
+        'timestamp': _now_iso(),
         'acquisition_active': True
     })
 
 @app.route('/api/electrodes')
+@stale_on_error
+@cached(timeout=2)
 def api_electrodes():
     """API pour récupérer les données des électrodes"""
-    electrodes = []
-    for i in range(60):
-        electrodes.append({
-            'id': i,
-            'voltage': round(random.uniform(-100, 100), 2),  # μV
-            'impedance': round(random.uniform(0.5, 2.0), 2),  # MΩ
-            'active': random.random() > 0.05,  # 95% actives
-            'quality': round(random.uniform(0.8, 1.0), 2)
-        })
-    return jsonify({'electrodes': electrodes})
+    voltage = rng.uniform(-100, 100, 60).round(2).tolist()  # μV
+    impedance = rng.uniform(0.5, 2.0, 60).round(2).tolist()  # MΩ
+    active = (rng.random(60) > 0.05).tolist()  # 95% actives
+    quality = rng.uniform(0.8, 1.0, 60).round(2).tolist()
+    electrodes = [
+        {'id': i, 'voltage': v, 'impedance': z, 'active': a, 'quality': q}
+        for i, (v, z, a, q) in enumerate(zip(voltage, impedance, active, quality))
+    ]
+    return _json({'electrodes': electrodes})
+
+@app.route('/api/electrodes.bin')
+@stale_on_error
+@cached(timeout=2)
+def api_electrodes_bin():
+    """Données des électrodes en binaire SoA (little-endian, 780 octets)
+
+    Offset   0: 60 x float32 voltage (μV)
+    Offset 240: 60 x float32 impédance (MΩ)
+    Offset 480: 60 x float32 qualité
+    Offset 720: 60 x uint8   active (0/1)
+    """
+    values = np.empty((3, 60), dtype='<f4')
+    values[0] = rng.uniform(-100, 100, 60)
+    values[1] = rng.uniform(0.5, 2.0, 60)
+    values[2] = rng.uniform(0.8, 1.0, 60)
+    active = (rng.random(60) > 0.05).astype(np.uint8)
+    return Response(values.tobytes() + active.tobytes(), mimetype="application/octet-stream")
+
+# Disposition d'une ligne de spike: [électrode, amplitude μV, âge s, waveform x20]
+# Bornes par colonne calculées une fois: un seul tirage uniforme par requête
+_SPIKE_LOW = np.array([0.0, -200.0, 0.0] + [-100.0] * 20)
+_SPIKE_SPAN = np.array([60.0, 150.0, 10.0] + [200.0] * 20)
 
 @app.route('/api/spikes')
+@stale_on_error
+@cached(timeout=1)
 def api_spikes():
     """API pour récupérer les événements de spikes récents"""
-    spikes = []
-    for _ in range(random.randint(0, 5)):
-        spikes.append({
-            'electrode_id': random.randint(0, 59),
-            'amplitude': round(random.uniform(-200, -50), 1),  # μV
-            'timestamp': time.time() - random.uniform(0, 10),
-            'waveform': [round(random.uniform(-100, 100), 1) for _ in range(20)]
-        })
-    return jsonify({'spikes': spikes})
+    n = int(rng.integers(0, 6))
+    rows = _SPIKE_LOW + rng.random((n, _SPIKE_LOW.size)) * _SPIKE_SPAN
+    electrode_ids = rows[:, 0].astype(np.int64).tolist()
+    amplitudes = rows[:, 1].round(1).tolist()
+    timestamps = (time.time() - rows[:, 2]).tolist()
+    # Lignes ndarray sérialisées directement par orjson (pas de listes Python)
+    waveforms = rows[:, 3:].round(1)
+    spikes = [
+        {'electrode_id': e, 'amplitude': a, 'timestamp': t, 'waveform': w}
+        for e, a, t, w in zip(electrode_ids, amplitudes, timestamps, waveforms)
+    ]
+    return _json({'spikes': spikes})
+
+def run_server(host, port):
+    """gunicorn multi-workers (gthread, keep-alive) si disponible, sinon Werkzeug
+
+    DEV=1 force le serveur de développement Flask. Les endpoints sont sans
+    état partagé: chaque worker garde simplement son propre cache TTL.
+    """
+    if not os.environ.get('DEV') and importlib.util.find_spec('gunicorn') is not None:
+        workers = os.environ.get('WEB_WORKERS', str(2 * (os.cpu_count() or 1) + 1))
+        os.execv(sys.executable, [
+            sys.executable, '-m', 'gunicorn',
+            '--chdir', os.path.dirname(os.path.abspath(__file__)),
+            '-b', f'{host}:{port}',
+            '-k', 'gthread',
+            '--threads', '8',
+            '--workers', workers,
+            '--keep-alive', '15',
+            'real_mea_demo:app'
+        ])
+    app.run(host=host, port=port, debug=False)
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Démo interface MEA réelle")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+
     print("🧬 Lancement du serveur de démonstration MEA Réelle...")
-    print("Interface: http://localhost:5000")
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+    print(f"Interface: http://localhost:{args.port}")
+    run_server(args.host, args.port)
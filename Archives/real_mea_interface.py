@@ -23,6 +23,7 @@ Version: 3.0.0 - Biological Bitcoin Integration
 """
 
 import asyncio
+import functools
 import numpy as np
 import time
 import json
@@ -31,16 +32,232 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Callable, Tuple, Any
 from enum import Enum
 import threading
-from queue import Queue, Empty
+import warnings
+from collections import deque
+from itertools import cycle
 import struct
 import socket
 import serial
 from abc import ABC, abstractmethod
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Noyau natif de parsing des paquets MEA2100, optionnel: python3 mea_parse_build.py
+try:
+    from _mea_parse import ffi as _mea_parse_ffi, lib as _mea_parse_lib
+except ImportError:
+    _mea_parse_ffi = _mea_parse_lib = None
+
 # Configuration logging
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] 🔬 MEA: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Formats du protocole MEA2100, compilés une seule fois
+_INIT_STRUCT = struct.Struct('<4sHHHH')      # INIT: électrodes, fréquence, gain, flags
+_CONF_STRUCT = struct.Struct('<4sHHfff')     # CONF: électrodes, fréquence, seuil, filtres
+_STIM_STRUCT = struct.Struct('<4sHBfffH')    # STIM: électrode, waveform, amp, durée, fréq, pulses
+_HEADER_STRUCT = struct.Struct('<fH')        # Paquet de données: timestamp, échantillons/électrode
+
+# Identifiants de waveform du protocole STIM (3 = custom pour tout autre type)
+_WAVEFORM_IDS = {"biphasic": 1, "monophasic": 2}
+_WAVEFORM_NAMES = {1: "biphasic", 2: "monophasic", 3: "custom"}
+
+@functools.lru_cache(maxsize=4096)
+def _pack_stimulation(electrode_id: int, waveform_id: int, amplitude: float,
+                      duration: float, frequency: float, pulse_count: int) -> bytes:
+    """Commande STIM packée, mémorisée: l'entraînement rejoue sans cesse les mêmes patterns"""
+    return _STIM_STRUCT.pack(
+        b'STIM',         # Header
+        electrode_id,    # ID électrode
+        waveform_id,     # Type de waveform
+        amplitude,       # Amplitude (μV)
+        duration,        # Durée (ms)
+        frequency,       # Fréquence (Hz)
+        pulse_count      # Nombre de pulses
+    )
+
+# Échantillon MEA2100 sur le fil: ID électrode (uint16) + tension ADC (int16, 0.1 μV/pas), packé
+SAMPLE_DTYPE = np.dtype([('eid', '<u2'), ('v', '<i2')])
+VOLTAGE_SCALE = np.float32(0.1)  # μV par pas ADC
+
+# Échantillon retourné par record_electrode (r['voltage'] comme avec les anciens dicts)
+RECORDING_DTYPE = np.dtype([('timestamp', '<f8'), ('voltage', '<f4'), ('is_spike', '?'),
+                            ('noise_level', '<f4'), ('electrode_id', '<u2')])
+
+# Lot de spikes remis aux spike_callbacks (un tableau par enregistrement)
+SPIKE_DTYPE = np.dtype([('electrode_id', '<u2'), ('timestamp', '<f8'), ('amplitude', '<f4')])
+
+# Descripteurs par échantillon (spike, bruit, horodatage) calculés en une passe
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _sample_features(voltages, t0, dt, timestamps, is_spike, noise_level):
+        for i in range(voltages.size):
+            av = abs(voltages[i])
+            is_spike[i] = av > 50.0
+            noise_level[i] = av if av < 30.0 else 5.0
+            timestamps[i] = t0 + i * dt
+else:
+    def _sample_features(voltages, t0, dt, timestamps, is_spike, noise_level):
+        abs_voltages = np.abs(voltages)
+        np.greater(abs_voltages, 50.0, out=is_spike)
+        noise_level[:] = np.where(abs_voltages < 30.0, abs_voltages, np.float32(5.0))
+        timestamps[:] = t0 + np.arange(voltages.size) * dt
+
+# Détecteur de spikes à double seuil sur la trace d'une électrode: seuil bas
+# (thr_low σ) pour les candidats avec période réfractaire, σ du bruit
+# réestimé hors candidats, puis un spike au pic de chaque candidat qui
+# dépasse thr_high σ_bruit
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def detect_spikes(voltages, thr_low, thr_high, refractory):
+        n = voltages.size
+        is_spike = np.zeros(n, dtype=np.bool_)
+        if n == 0:
+            return is_spike
+        
+        # σ global en une passe (Welford)
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            delta = voltages[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (voltages[i] - mean)
+        
+        # Candidats: fenêtre réfractaire ouverte à chaque franchissement du seuil bas
+        candidate = np.zeros(n, dtype=np.bool_)
+        low = thr_low * np.sqrt(m2 / n)
+        i = 0
+        while i < n:
+            if abs(voltages[i] - mean) > low:
+                end = min(i + refractory, n)
+                candidate[i:end] = True
+                i = end
+            else:
+                i += 1
+        
+        # σ du bruit sur les échantillons hors candidats
+        count = 0
+        noise_mean = 0.0
+        noise_m2 = 0.0
+        for i in range(n):
+            if not candidate[i]:
+                count += 1
+                delta = voltages[i] - noise_mean
+                noise_mean += delta / count
+                noise_m2 += delta * (voltages[i] - noise_mean)
+        if count == 0:
+            return is_spike
+        high = thr_high * np.sqrt(noise_m2 / count)
+        
+        # Un spike au pic de chaque zone candidate, si elle franchit le seuil haut
+        i = 0
+        while i < n:
+            if candidate[i]:
+                peak = i
+                while i < n and candidate[i]:
+                    if abs(voltages[i] - noise_mean) > abs(voltages[peak] - noise_mean):
+                        peak = i
+                    i += 1
+                if abs(voltages[peak] - noise_mean) > high:
+                    is_spike[peak] = True
+            else:
+                i += 1
+        return is_spike
+else:
+    def detect_spikes(voltages, thr_low, thr_high, refractory):
+        voltages = np.asarray(voltages, dtype=np.float64)
+        n = voltages.size
+        is_spike = np.zeros(n, dtype=bool)
+        if n == 0:
+            return is_spike
+        
+        # Candidats: seule la boucle sur les franchissements reste en Python
+        deviation = np.abs(voltages - voltages.mean())
+        candidate = np.zeros(n, dtype=bool)
+        window_end = 0
+        for i in np.flatnonzero(deviation > thr_low * voltages.std()).tolist():
+            if i >= window_end:
+                window_end = min(i + refractory, n)
+                candidate[i:window_end] = True
+        
+        noise = voltages[~candidate]
+        if noise.size == 0:
+            return is_spike
+        deviation = np.abs(voltages - noise.mean())
+        high = thr_high * noise.std()
+        
+        # Zones candidates contiguës: pic de chacune
+        edges = np.diff(candidate.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            peak = start + int(np.argmax(deviation[start:end]))
+            if deviation[peak] > high:
+                is_spike[peak] = True
+        return is_spike
+
+def _make_packet_parser(num_electrodes: int, sampling_rate: float) -> Callable[[bytes], 'ElectrodeDataBatch']:
+    """
+    📊 Parser de paquets MEA2100 spécialisé pour une configuration figée
+    
+    Le pas temporel, la taille du header et le noyau de descripteurs (natif
+    _mea_parse s'il est compilé, sinon _sample_features) sont résolus une
+    fois ici; le parser retourné ne lit plus que le paquet. Le paquet entier
+    est lu d'un coup (np.frombuffer sur le dtype structuré) et les tensions
+    int16 sont converties en μV float32 dans le lot; un paquet tronqué est
+    toléré et une erreur donne un lot vide.
+    """
+    header_size = _HEADER_STRUCT.size
+    itemsize = SAMPLE_DTYPE.itemsize
+    unpack_header = _HEADER_STRUCT.unpack_from
+    dt = 1.0 / sampling_rate
+    
+    if _mea_parse_lib is not None:
+        # Noyau C: une boucle directement sur les octets reçus
+        from_buffer = _mea_parse_ffi.from_buffer
+        mea_features = _mea_parse_lib.mea_features
+        
+        def features(raw_data, samples, batch, timestamp, count):
+            mea_features(from_buffer("uint8_t[]", raw_data) + header_size, count, timestamp, dt,
+                         from_buffer("float[]", batch.voltage, require_writable=True),
+                         from_buffer("double[]", batch.timestamp, require_writable=True),
+                         from_buffer("uint8_t[]", batch.is_spike, require_writable=True),
+                         from_buffer("float[]", batch.noise_level, require_writable=True))
+    else:
+        def features(raw_data, samples, batch, timestamp, count):
+            np.multiply(samples['v'], VOLTAGE_SCALE, out=batch.voltage)
+            _sample_features(batch.voltage, timestamp, dt,
+                             batch.timestamp, batch.is_spike, batch.noise_level)
+    
+    def parse_raw_data(raw_data: bytes) -> 'ElectrodeDataBatch':
+        try:
+            # Dépacker l'header du packet
+            timestamp, num_samples = unpack_header(raw_data)
+            
+            # Échantillons complets présents dans le paquet (paquet tronqué toléré)
+            count = min(num_samples * num_electrodes, (len(raw_data) - header_size) // itemsize)
+            samples = np.frombuffer(raw_data, dtype=SAMPLE_DTYPE, count=count, offset=header_size)
+            batch = ElectrodeDataBatch(
+                electrode_id=samples['eid'],
+                timestamp=np.empty(count, dtype=np.float64),
+                voltage=np.empty(count, dtype=np.float32),
+                noise_level=np.empty(count, dtype=np.float32),
+                is_spike=np.empty(count, dtype=bool)
+            )
+            
+            # Tension en μV + détection de spike (seuil simple) + niveau de bruit (approximation)
+            features(raw_data, samples, batch, timestamp, count)
+            return batch
+            
+        except Exception as e:
+            logger.error(f"❌ Data parsing error: {e}")
+            return ElectrodeDataBatch.empty()
+    
+    return parse_raw_data
+
 class MEAConnectionType(Enum):
     """Types de connexion MEA supportés"""
     TCP_SOCKET = "tcp_socket"        # Connexion réseau TCP
@@ -56,9 +273,9 @@ class ElectrodeState(Enum):
     RECORDING = "recording"          # En cours d'enregistrement
     ERROR = "error"                  # Erreur détectée
 
-@dataclass
+@dataclass(slots=True)
 class ElectrodeData:
-    """Données d'une électrode à un instant donné"""
+    """Données d'une électrode à un instant donné (sans __dict__: créé par échantillon)"""
     electrode_id: int
     timestamp: float  # Timestamp en secondes
     voltage: float    # Tension en microvolts (μV)
@@ -67,7 +284,61 @@ class ElectrodeData:
     is_spike: bool = False   # Détection automatique de spike
     state: ElectrodeState = ElectrodeState.ACTIVE
 
-@dataclass 
+@dataclass
+class ElectrodeDataBatch:
+    """
+    Lot d'échantillons MEA en colonnes (un tableau NumPy par champ)
+    
+    Produit par le parsing d'un paquet et retourné par get_latest_data;
+    l'indexation entière (ou as_records) redonne des ElectrodeData pour le
+    code qui travaille échantillon par échantillon.
+    """
+    electrode_id: np.ndarray  # uint16
+    timestamp: np.ndarray     # float64, secondes
+    voltage: np.ndarray       # float32, μV
+    noise_level: np.ndarray   # float32, RMS approx.
+    is_spike: np.ndarray      # bool
+    
+    @classmethod
+    def empty(cls) -> 'ElectrodeDataBatch':
+        return cls(np.empty(0, np.uint16), np.empty(0, np.float64), np.empty(0, np.float32),
+                   np.empty(0, np.float32), np.empty(0, bool))
+    
+    def __len__(self) -> int:
+        return len(self.voltage)
+    
+    def select(self, mask: np.ndarray) -> 'ElectrodeDataBatch':
+        """Sous-lot des échantillons où mask est vrai"""
+        return ElectrodeDataBatch(self.electrode_id[mask], self.timestamp[mask], self.voltage[mask],
+                                  self.noise_level[mask], self.is_spike[mask])
+    
+    def as_records(self):
+        """Itère paresseusement les échantillons sous forme d'ElectrodeData"""
+        for i in range(len(self)):
+            yield self[i]
+    
+    def to_structured(self) -> np.ndarray:
+        """Copie du lot en tableau structuré RECORDING_DTYPE (un enregistrement par échantillon)"""
+        out = np.empty(len(self), dtype=RECORDING_DTYPE)
+        for name in RECORDING_DTYPE.names:
+            out[name] = getattr(self, name)
+        return out
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ElectrodeDataBatch(self.electrode_id[index], self.timestamp[index], self.voltage[index],
+                                      self.noise_level[index], self.is_spike[index])
+        return ElectrodeData(
+            electrode_id=int(self.electrode_id[index]),
+            timestamp=float(self.timestamp[index]),
+            voltage=float(self.voltage[index]),
+            impedance=1.0,  # Valeur par défaut
+            noise_level=float(self.noise_level[index]),
+            is_spike=bool(self.is_spike[index]),
+            state=ElectrodeState.RECORDING
+        )
+
+@dataclass(slots=True)
 class StimulusPattern:
     """Pattern de stimulation pour une électrode"""
     electrode_id: int
@@ -79,18 +350,84 @@ class StimulusPattern:
     inter_pulse_interval: float = 1.0 # Intervalle entre pulses (ms)
     custom_waveform: Optional[np.ndarray] = None  # Waveform personnalisée
 
+@dataclass
+class ProtocolSoA:
+    """
+    Séquence de stimulations en colonnes (une ligne par étape)
+    
+    Construite une fois par protocole et soumise telle quelle au dispositif
+    (stimulate_batch); l'indexation entière redonne un StimulusPattern.
+    """
+    electrode_ids: np.ndarray  # uint16
+    waveform_ids: np.ndarray   # uint8, identifiants STIM (_WAVEFORM_IDS, 3 = custom)
+    amplitudes: np.ndarray     # float32, μV
+    durations: np.ndarray      # float32, ms
+    frequencies: np.ndarray    # float32, Hz
+    pulse_counts: np.ndarray   # uint16
+    intervals: np.ndarray      # float64, ms de récupération après l'étape
+    
+    @classmethod
+    def from_patterns(cls, patterns: List[StimulusPattern]) -> 'ProtocolSoA':
+        return cls(
+            electrode_ids=np.array([p.electrode_id for p in patterns], dtype=np.uint16),
+            waveform_ids=np.array([_WAVEFORM_IDS.get(p.waveform_type, 3) for p in patterns], dtype=np.uint8),
+            amplitudes=np.array([p.amplitude for p in patterns], dtype=np.float32),
+            durations=np.array([p.duration for p in patterns], dtype=np.float32),
+            frequencies=np.array([p.frequency for p in patterns], dtype=np.float32),
+            pulse_counts=np.array([p.pulse_count for p in patterns], dtype=np.uint16),
+            intervals=np.array([p.inter_pulse_interval for p in patterns], dtype=np.float64)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.electrode_ids)
+    
+    def __getitem__(self, index: int) -> StimulusPattern:
+        return StimulusPattern(
+            electrode_id=int(self.electrode_ids[index]),
+            waveform_type=_WAVEFORM_NAMES[int(self.waveform_ids[index])],
+            amplitude=float(self.amplitudes[index]),
+            duration=float(self.durations[index]),
+            frequency=float(self.frequencies[index]),
+            pulse_count=int(self.pulse_counts[index]),
+            inter_pulse_interval=float(self.intervals[index])
+        )
+
 @dataclass
 class BitcoinStimulationProtocol:
-    """Protocol de stimulation spécifique pour l'apprentissage Bitcoin"""
+    """
+    Protocol de stimulation spécifique pour l'apprentissage Bitcoin
+    
+    La séquence est donnée soit en colonnes (soa), soit en StimulusPattern
+    (stimulation_sequence, convertie en colonnes au premier as_soa()).
+    """
     block_pattern: bytes             # Pattern dérivé du block header
     target_electrodes: List[int]     # Électrodes ciblées
     stimulation_sequence: List[StimulusPattern] = field(default_factory=list)
     expected_response_pattern: Optional[np.ndarray] = None
     learning_phase: str = "pattern_recognition"
     reward_signal_amplitude: float = 50.0  # Amplitude de récompense
+    soa: Optional[ProtocolSoA] = None
+    
+    def as_soa(self) -> ProtocolSoA:
+        if self.soa is None:
+            self.soa = ProtocolSoA.from_patterns(self.stimulation_sequence)
+        return self.soa
+    
+    @functools.cached_property
+    def banner(self) -> str:
+        """Résumé pour les logs, formaté une seule fois (séquence figée comme as_soa)"""
+        return (f"{self.learning_phase} ({len(self.as_soa())} stimulations, "
+                f"{len(self.target_electrodes)} electrodes)")
 
 class MEADevice(ABC):
-    """Interface abstraite pour différents types de dispositifs MEA"""
+    """
+    Interface abstraite pour différents types de dispositifs MEA
+    
+    Les méthodes async ne doivent pas bloquer la boucle asyncio: un
+    dispositif dont l'API constructeur est bloquante confie ces appels à un
+    thread dédié alimenté par une file (cf. le thread de stimulation du
+    MEA2100) plutôt que de les attendre depuis une coroutine.
+    """
     
     @abstractmethod
     async def connect(self) -> bool:
@@ -118,9 +455,233 @@ class MEADevice(ABC):
         pass
     
     @abstractmethod
-    async def get_latest_data(self, num_samples: int = 1000) -> List[ElectrodeData]:
+    async def get_latest_data(self, num_samples: int = 1000) -> ElectrodeDataBatch:
         """Récupérer les dernières données d'acquisition"""
         pass
+    
+    @abstractmethod
+    async def get_latest_data_for(self, electrode_id: int, num_samples: int = 1000) -> ElectrodeDataBatch:
+        """Récupérer les derniers échantillons d'une seule électrode"""
+        pass
+    
+    async def stimulate_batch(self, sequence: ProtocolSoA) -> np.ndarray:
+        """
+        Appliquer une séquence de stimulations, intervals (ms) respectés
+        après chaque étape. Retourne le masque de réussite par étape.
+        
+        Implémentation par défaut: une étape à la fois; les dispositifs
+        capables de cadencer eux-mêmes la séquence la surchargent.
+        """
+        success = np.zeros(len(sequence), dtype=bool)
+        for i in range(len(sequence)):
+            success[i] = await self.stimulate_electrode(sequence[i])
+            await asyncio.sleep(sequence.intervals[i] / 1000.0)
+        return success
+
+class _PaddedCounter:
+    """
+    Compteur seul sur sa ligne de cache (64 octets)
+    
+    Le slot v est entouré de 7 slots inutilisés de chaque côté: deux
+    compteurs alloués séparément ne partagent jamais la ligne qui porte
+    leur v, et l'écriture du producteur n'invalide pas la ligne lue par le
+    consommateur pendant qu'il tourne hors GIL (NumPy, recv, noyau natif).
+    """
+    __slots__ = tuple(f'_pad{i}' for i in range(7)) + ('v',) + tuple(f'_pad{i}' for i in range(7, 14))
+    
+    def __init__(self, v: int = 0):
+        self.v = v
+
+class _BatchRing:
+    """
+    Ring SPSC de slabs NumPy préalloués (un producteur, un consommateur)
+    
+    Le thread d'acquisition copie chaque lot dans le slab head & mask puis
+    publie en incrémentant head; le consommateur (latest) lit les slabs les
+    plus récents et avance tail jusqu'à head. Aucun verrou: chaque compteur
+    n'a qu'un seul écrivain et l'affectation d'un int est atomique sous le
+    GIL. Quand le ring est plein le producteur écrase le slab le plus
+    ancien; le consommateur revalide head après sa copie (un slab peut-être
+    en cours de réécriture est ignoré, donc un ring plein rend au plus
+    capacity - 1 lots). head et tail sont des _PaddedCounter; capacity est
+    une puissance de deux (index & mask).
+    L'Event ne sert qu'au réveil d'un consommateur sur ring vide.
+    
+    Empreinte: capacity × slab_samples × 19 octets, soit ~15 Mo avec les
+    valeurs par défaut du MEA2100 (128 slabs de 60 × 100 échantillons).
+    Les pages sont écrites dès la construction pour que le noyau les
+    engage au démarrage et non au premier passage du thread d'acquisition.
+    """
+    
+    _FIELDS = (('electrode_id', np.uint16), ('timestamp', np.float64), ('voltage', np.float32),
+               ('noise_level', np.float32), ('is_spike', bool))
+    
+    def __init__(self, capacity: int, slab_samples: int):
+        if capacity & (capacity - 1):
+            raise ValueError(f"Ring capacity must be a power of two, got {capacity}")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.slab_samples = slab_samples
+        self.slabs = {name: np.empty((capacity, slab_samples), dtype=dtype) for name, dtype in self._FIELDS}
+        for slab in self.slabs.values():
+            slab.fill(0)  # pré-touche: défauts de page payés ici, pas dans push()
+        self.lengths = np.zeros(capacity, dtype=np.int64)
+        self._head = _PaddedCounter()  # écrit uniquement par le producteur
+        self._tail = _PaddedCounter()  # écrit uniquement par le consommateur
+        self._not_empty = threading.Event()
+    
+    def __len__(self) -> int:
+        return min(self._head.v - self._tail.v, self.capacity)
+    
+    def push(self, batch: ElectrodeDataBatch):
+        """Copie le lot dans le prochain slab (écrase le plus ancien si plein)"""
+        slot = self._head.v & self.mask
+        n = min(len(batch), self.slab_samples)
+        for name, _ in self._FIELDS:
+            self.slabs[name][slot, :n] = getattr(batch, name)[:n]
+        self.lengths[slot] = n
+        self._head.v += 1
+        self._not_empty.set()
+    
+    def latest(self, max_samples: int, timeout: float = 0.0) -> ElectrodeDataBatch:
+        """
+        Consomme le ring et rend exactement ses max_samples plus récents
+        
+        Seuls les slabs les plus récents couvrant max_samples sont copiés
+        (une indexation par champ, premier slab tronqué au plus juste); les
+        plus anciens sont abandonnés. Lot vide si rien n'arrive avant
+        timeout.
+        """
+        head = self._head.v
+        tail = max(self._tail.v, head - self.capacity)
+        if tail == head and timeout > 0:
+            self._not_empty.clear()
+            if self._head.v == head:
+                self._not_empty.wait(timeout)
+            head = self._head.v
+            tail = max(self._tail.v, head - self.capacity)
+        self._tail.v = head
+        if tail == head or max_samples <= 0:
+            return ElectrodeDataBatch.empty()
+        
+        # Nombre de slabs (plus récents d'abord) pour atteindre max_samples
+        lengths = self.lengths[np.arange(head - 1, tail - 1, -1) & self.mask]
+        totals = np.cumsum(lengths)
+        count = min(int(np.searchsorted(totals, max_samples)) + 1, head - tail)
+        start = head - count
+        lengths = lengths[count - 1::-1]
+        slots = np.arange(start, head) & self.mask
+        valid = np.arange(self.slab_samples) < lengths[:, None]
+        # Premier slab (le plus ancien retenu): seulement sa fin
+        valid[0, :max(0, int(totals[count - 1]) - max_samples)] = False
+        batch = ElectrodeDataBatch(*(self.slabs[name][slots][valid] for name, _ in self._FIELDS))
+        
+        # Slabs réécrits pendant la copie: le producteur a atteint index + capacity
+        overwritten = min(max(0, self._head.v - self.capacity + 1 - start), count)
+        if overwritten:
+            return batch[int(valid[:overwritten].sum()):]
+        return batch
+
+class _ElectrodeRings:
+    """
+    Un ring d'échantillons par électrode (une ligne par électrode et par champ)
+    
+    Le thread d'acquisition démultiplexe chaque lot une seule fois (tri
+    stable par électrode, une affectation indexée par champ); latest() rend
+    alors les n derniers échantillons d'une électrode sans parcourir les
+    autres. Même discipline sans verrou que _BatchRing: le producteur
+    réserve les positions (claimed) avant d'écrire puis publie written; le
+    lecteur copie puis écarte ce que claimed a recouvert pendant sa copie.
+    Ne consomme rien: plusieurs lecteurs peuvent lire la même électrode.
+    
+    Empreinte: num_electrodes × capacity × 17 octets (~8 Mo pour 60
+    électrodes × 8192 échantillons, ~330 ms à 25 kHz).
+    """
+    
+    _FIELDS = tuple(field for field in _BatchRing._FIELDS if field[0] != 'electrode_id')
+    
+    def __init__(self, num_electrodes: int, capacity: int):
+        if capacity & (capacity - 1):
+            raise ValueError(f"Ring capacity must be a power of two, got {capacity}")
+        self.num_electrodes = num_electrodes
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.rows = {name: np.empty((num_electrodes, capacity), dtype=dtype) for name, dtype in self._FIELDS}
+        for row in self.rows.values():
+            row.fill(0)  # pré-touche, comme _BatchRing
+        self.claimed = np.zeros(num_electrodes, dtype=np.int64)  # réservé par le producteur
+        self.written = np.zeros(num_electrodes, dtype=np.int64)  # publié par le producteur
+    
+    def push(self, batch: ElectrodeDataBatch):
+        """Répartit le lot dans les rings de ses électrodes"""
+        eid = batch.electrode_id
+        if len(eid) == 0:
+            return
+        if int(eid.max()) >= self.num_electrodes:
+            batch = batch.select(eid < self.num_electrodes)
+            eid = batch.electrode_id
+        
+        counts = np.bincount(eid, minlength=self.num_electrodes)
+        per_electrode = len(eid) // self.num_electrodes
+        if (per_electrode <= self.capacity and (counts == per_electrode).all()
+                and (self.written == self.written[0]).all()
+                and (eid[::per_electrode] == np.arange(self.num_electrodes)).all()
+                and (np.diff(eid) >= 0).all()):
+            # Cas du MEA2100: paquet électrode par électrode, même nombre
+            # d'échantillons chacune -> copie par blocs (E, n) sans tri
+            self._push_blocks(batch, per_electrode)
+            return
+        
+        order = np.argsort(eid, kind='stable')
+        rows = eid[order]
+        # Rang de chaque échantillon dans son électrode; au plus capacity
+        # derniers par électrode si le lot déborde d'un ring
+        rank = np.arange(len(rows)) - (np.cumsum(counts) - counts)[rows]
+        keep = rank >= (counts - self.capacity)[rows]
+        if not keep.all():
+            order, rows, rank = order[keep], rows[keep], rank[keep]
+        cols = (self.written[rows] + rank) & self.mask
+        
+        self.claimed = self.written + counts
+        for name, _ in self._FIELDS:
+            self.rows[name][rows, cols] = getattr(batch, name)[order]
+        self.written = self.claimed
+    
+    def _push_blocks(self, batch: ElectrodeDataBatch, n: int):
+        start = int(self.written[0])
+        first = start & self.mask
+        split = min(n, self.capacity - first)  # colonnes avant le bouclage
+        self.claimed = self.written + n
+        for name, _ in self._FIELDS:
+            block = getattr(batch, name).reshape(self.num_electrodes, n)
+            self.rows[name][:, first:first + split] = block[:, :split]
+            if split < n:
+                self.rows[name][:, :n - split] = block[:, split:]
+        self.written = self.claimed
+    
+    def latest(self, electrode_id: int, max_samples: int) -> ElectrodeDataBatch:
+        """Copie des max_samples derniers échantillons de l'électrode (moins si pas encore reçus)"""
+        if not 0 <= electrode_id < self.num_electrodes:
+            return ElectrodeDataBatch.empty()
+        end = int(self.written[electrode_id])
+        n = min(max_samples, end, self.capacity)
+        if n <= 0:
+            return ElectrodeDataBatch.empty()
+        
+        start = end - n
+        first = start & self.mask
+        if first + n <= self.capacity:
+            columns = [self.rows[name][electrode_id, first:first + n].copy() for name, _ in self._FIELDS]
+        else:
+            cols = np.arange(start, end) & self.mask
+            columns = [self.rows[name][electrode_id, cols] for name, _ in self._FIELDS]
+        batch = ElectrodeDataBatch(np.full(n, electrode_id, dtype=np.uint16), *columns)
+        
+        # Positions recouvertes pendant la copie (réservées au-delà de start + capacity)
+        overwritten = min(int(self.claimed[electrode_id]) - self.capacity - start, n)
+        if overwritten > 0:
+            return batch[overwritten:]
+        return batch
 
 class MultiChannelSystemsMEA2100(MEADevice):
     """
@@ -128,8 +689,19 @@ class MultiChannelSystemsMEA2100(MEADevice):
     
     Dispositif MEA haut de gamme avec 60 électrodes, stimulation
     et enregistrement simultanés, idéal pour l'apprentissage Bitcoin.
+    
+    Le socket est non bloquant: les commandes passent par les primitives
+    asyncio (sock_sendall/sock_recv) sans aller-retour dans un pool de
+    threads; le thread de stimulation écrit sur un dup() du socket en mode
+    timeout.
     """
     
+    IO_TIMEOUT = 10.0    # Timeout des opérations réseau (secondes)
+    STIM_BATCH_MAX = 64      # Commandes de stimulation max. par envoi
+    STIM_QUEUE_MAX = 1000    # Stimulations en attente max.
+    SOCKET_RCVBUF = 4 * 1024 * 1024  # Buffer noyau de réception (~0.45 s à 9 Mo/s)
+    SOCKET_SNDBUF = 1 * 1024 * 1024  # Buffer noyau d'envoi
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.host = config.get('host', 'localhost')
@@ -137,17 +709,47 @@ class MultiChannelSystemsMEA2100(MEADevice):
         self.num_electrodes = config.get('num_electrodes', 60)
         self.sampling_rate = config.get('sampling_rate', 25000)  # 25 kHz
         
+        # Simulation: générateur dédié et paquet préalloué réutilisé à chaque appel
+        # (_sim_buf est une vue structurée sur la zone échantillons du paquet).
+        # SFC64: ~20% plus rapide que PCG64 sur les tirages en bloc; 'seed' rend
+        # la simulation reproductible
+        self._rng = np.random.Generator(np.random.SFC64(config.get('seed')))
+        self._sim_samples_per_electrode = 100
+        sim_count = self.num_electrodes * self._sim_samples_per_electrode
+        self._sim_packet = bytearray(_HEADER_STRUCT.size + sim_count * SAMPLE_DTYPE.itemsize)
+        self._sim_buf = np.frombuffer(self._sim_packet, dtype=SAMPLE_DTYPE, offset=_HEADER_STRUCT.size)
+        self._sim_buf['eid'] = np.repeat(np.arange(self.num_electrodes, dtype=np.uint16),
+                                         self._sim_samples_per_electrode)
+        self._sim_voltages = np.empty(sim_count, dtype=np.float32)  # μV avant quantification
+        
+        # Parser spécialisé pour (électrodes, fréquence), figés à la construction
+        self._parse_raw_data = _make_packet_parser(self.num_electrodes, self.sampling_rate)
+        
         self.socket: Optional[socket.socket] = None
+        self._stim_socket: Optional[socket.socket] = None
+        # Buffer de réception préalloué (recv_into, aucune allocation par réponse)
+        self._rx_buf = bytearray(65536)
+        self._rx_view = memoryview(self._rx_buf)
         self.is_connected = False
         self.is_recording = False
-        
-        # Buffers de données
-        self.data_buffer = Queue(maxsize=100000)  # Buffer circulaire
-        self.stimulation_queue = Queue(maxsize=1000)
+        self._recording_event = threading.Event()  # Miroir de is_recording (réveil du thread d'acquisition)
+        
+        # Buffers de données: ring de lots SoA préalloués (capacité puissance de 2)
+        self.data_buffer = _BatchRing(config.get('buffer_slabs', 128),
+                                      self.num_electrodes * self._sim_samples_per_electrode)
+        # ... et démultiplexées par électrode pour record_electrode
+        self.electrode_buffers = _ElectrodeRings(self.num_electrodes,
+                                                 config.get('electrode_buffer_samples', 8192))
+        # Stimulations en attente: deque de (commande, instant d'envoi monotone)
+        # (append/popleft atomiques côté C) + un Event pour réveiller le thread
+        # de stimulation
+        self.stimulation_queue = deque()
+        self._stimulation_ready = threading.Event()
         
         # Thread d'acquisition
         self.acquisition_thread: Optional[threading.Thread] = None
         self.stimulation_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # Arrêt des threads de gestion
         
         logger.info(f"🔬 MEA2100 initialized: {self.num_electrodes} electrodes @ {self.sampling_rate} Hz")
 
@@ -156,12 +758,21 @@ class MultiChannelSystemsMEA2100(MEADevice):
         try:
             logger.info(f"🔗 Connecting to MEA2100 at {self.host}:{self.port}")
             
-            # Créer la connexion TCP
+            # Créer la connexion TCP (non bloquante, pilotée par la boucle asyncio)
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(10.0)  # Timeout de 10 secondes
+            self.socket.setblocking(False)
+            # Pas de Nagle: une stimulation isolée part immédiatement
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffers noyau agrandis avant connect (fenêtre TCP négociée au SYN):
+            # absorbent les rafales d'acquisition quand le thread est en retard
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_RCVBUF)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_SNDBUF)
+            if hasattr(socket, 'TCP_QUICKACK'):  # Linux: ACK immédiats des réponses
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
             
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.connect, (self.host, self.port)
+            await asyncio.wait_for(
+                asyncio.get_running_loop().sock_connect(self.socket, (self.host, self.port)),
+                self.IO_TIMEOUT
             )
             
             # Envoyer la commande d'initialisation
@@ -170,7 +781,7 @@ class MultiChannelSystemsMEA2100(MEADevice):
             
             # Vérifier la réponse
             response = await self._receive_response()
-            if response and b"MEA2100_READY" in response:
+            if self._response_contains(response, b"MEA2100_READY"):
                 self.is_connected = True
                 logger.info("✅ MEA2100 connection successful")
                 
@@ -179,7 +790,7 @@ class MultiChannelSystemsMEA2100(MEADevice):
                 
                 return True
             else:
-                logger.error(f"❌ MEA2100 initialization failed: {response}")
+                logger.error(f"❌ MEA2100 initialization failed: {self._response_bytes(response)}")
                 return False
                 
         except Exception as e:
@@ -201,6 +812,9 @@ class MultiChannelSystemsMEA2100(MEADevice):
             # Fermer la connexion socket
             if self.socket:
                 await self._send_command(b"DISCONNECT")
+                if self._stim_socket:
+                    self._stim_socket.close()
+                    self._stim_socket = None
                 self.socket.close()
                 self.socket = None
             
@@ -231,18 +845,26 @@ class MultiChannelSystemsMEA2100(MEADevice):
             
             # Vérifier que l'acquisition a démarré
             response = await self._receive_response()
-            if response and b"RECORDING_STARTED" in response:
-                self.is_recording = True
+            if self._response_contains(response, b"RECORDING_STARTED"):
+                self._set_recording(True)
                 logger.info("✅ MEA2100 recording started successfully")
                 return True
             else:
-                logger.error(f"❌ Failed to start MEA2100 recording: {response}")
+                logger.error(f"❌ Failed to start MEA2100 recording: {self._response_bytes(response)}")
                 return False
                 
         except Exception as e:
             logger.error(f"❌ MEA2100 recording start error: {e}")
             return False
 
+    def _set_recording(self, recording: bool):
+        """Met à jour is_recording et l'Event sur lequel attend l'acquisition"""
+        self.is_recording = recording
+        if recording:
+            self._recording_event.set()
+        else:
+            self._recording_event.clear()
+
     async def stop_recording(self) -> bool:
         """Arrêter l'acquisition"""
         try:
@@ -255,18 +877,18 @@ class MultiChannelSystemsMEA2100(MEADevice):
             await self._send_command(b"STOP_RECORDING")
             
             response = await self._receive_response()
-            if response and b"RECORDING_STOPPED" in response:
-                self.is_recording = False
+            if self._response_contains(response, b"RECORDING_STOPPED"):
+                self._set_recording(False)
                 logger.info("✅ MEA2100 recording stopped")
                 return True
             else:
-                logger.warning(f"⚠️ Unexpected stop response: {response}")
-                self.is_recording = False  # Force stop
+                logger.warning(f"⚠️ Unexpected stop response: {self._response_bytes(response)}")
+                self._set_recording(False)  # Force stop
                 return True
                 
         except Exception as e:
             logger.error(f"❌ MEA2100 recording stop error: {e}")
-            self.is_recording = False
+            self._set_recording(False)
             return False
 
     async def stimulate_electrode(self, pattern: StimulusPattern) -> bool:
@@ -285,56 +907,99 @@ class MultiChannelSystemsMEA2100(MEADevice):
             stim_command = self._build_stimulation_command(pattern)
             
             # Ajouter à la queue de stimulation pour traitement en arrière-plan
-            self.stimulation_queue.put(stim_command, timeout=1.0)
+            # (refus immédiat si pleine: pas d'attente bloquante dans la boucle asyncio)
+            if len(self.stimulation_queue) >= self.STIM_QUEUE_MAX:
+                logger.error(f"❌ MEA2100 stimulation queue full ({self.STIM_QUEUE_MAX} pending)")
+                return False
+            self.stimulation_queue.append((stim_command, 0.0))
+            self._stimulation_ready.set()
             
-            logger.debug(f"⚡ Queued stimulation for electrode {pattern.electrode_id}")
+            logger.debug("⚡ Queued stimulation for electrode %d", pattern.electrode_id)
             return True
             
         except Exception as e:
             logger.error(f"❌ MEA2100 stimulation error: {e}")
             return False
 
-    async def get_latest_data(self, num_samples: int = 1000) -> List[ElectrodeData]:
+    async def stimulate_batch(self, sequence: ProtocolSoA) -> np.ndarray:
+        """
+        ⚡ Appliquer une séquence de stimulations cadencée par le thread de stimulation
+        
+        Toute la séquence est mise en queue d'un coup avec l'instant d'envoi
+        de chaque étape (somme des intervalles précédents); la coroutine
+        n'attend qu'une fois, la durée totale du cadencement. Séquence
+        refusée en bloc si la queue ne peut pas la contenir.
+        """
+        count = len(sequence)
+        if not self.is_connected:
+            logger.error("❌ Cannot stimulate: MEA2100 not connected")
+            return np.zeros(count, dtype=bool)
+        
+        try:
+            # Colonnes -> commandes STIM (mémorisées par _pack_stimulation)
+            commands = list(map(_pack_stimulation,
+                                sequence.electrode_ids.tolist(), sequence.waveform_ids.tolist(),
+                                sequence.amplitudes.tolist(), sequence.durations.tolist(),
+                                sequence.frequencies.tolist(), sequence.pulse_counts.tolist()))
+            intervals = sequence.intervals / 1000.0
+            if len(self.stimulation_queue) + count > self.STIM_QUEUE_MAX:
+                logger.error(f"❌ MEA2100 stimulation queue full ({self.STIM_QUEUE_MAX} pending)")
+                return np.zeros(count, dtype=bool)
+            
+            # Étape i envoyée à start + somme des intervalles des étapes précédentes
+            release = time.monotonic() + np.cumsum(intervals) - intervals
+            self.stimulation_queue.extend(zip(commands, release.tolist()))
+            self._stimulation_ready.set()
+            logger.debug("⚡ Queued %d scheduled stimulations", count)
+            
+            await asyncio.sleep(float(intervals.sum()))
+            return np.ones(count, dtype=bool)
+            
+        except Exception as e:
+            logger.error(f"❌ MEA2100 stimulation error: {e}")
+            return np.zeros(count, dtype=bool)
+
+    async def get_latest_data(self, num_samples: int = 1000) -> ElectrodeDataBatch:
         """
         📊 Récupérer les dernières données d'acquisition
         
         Retourne les données les plus récentes de toutes les électrodes
         pour analyse de l'activité neuronale en réponse aux stimulations Bitcoin.
+        Le buffer contient des lots déjà parsés par le thread d'acquisition.
         """
         if not self.is_recording:
-            return []
+            return ElectrodeDataBatch.empty()
         
         try:
-            # Récupérer les données du buffer
-            data_samples = []
-            samples_retrieved = 0
+            # Les num_samples plus récents, copiés au plus juste depuis la fin
+            # du ring (attente courte s'il est vide)
+            return self.data_buffer.latest(num_samples, timeout=0.01)
             
-            while samples_retrieved < num_samples:
-                try:
-                    # Récupérer du buffer avec timeout court
-                    raw_data = self.data_buffer.get(timeout=0.01)
-                    
-                    # Parser les données brutes en ElectrodeData
-                    parsed_data = self._parse_raw_data(raw_data)
-                    data_samples.extend(parsed_data)
-                    
-                    samples_retrieved += len(parsed_data)
-                    
-                except Empty:
-                    # Plus de données disponibles dans le buffer
-                    break
-            
-            # Retourner les derniers échantillons demandés
-            return data_samples[-num_samples:] if len(data_samples) > num_samples else data_samples
+        except Exception as e:
+            logger.error(f"❌ MEA2100 data retrieval error: {e}")
+            return ElectrodeDataBatch.empty()
+
+    async def get_latest_data_for(self, electrode_id: int, num_samples: int = 1000) -> ElectrodeDataBatch:
+        """
+        📊 Récupérer les derniers échantillons d'une électrode
+        
+        Lu dans le ring propre à l'électrode: seuls ses num_samples
+        échantillons sont copiés, sans consommer le buffer global.
+        """
+        if not self.is_recording:
+            return ElectrodeDataBatch.empty()
+        
+        try:
+            return self.electrode_buffers.latest(electrode_id, num_samples)
             
         except Exception as e:
             logger.error(f"❌ MEA2100 data retrieval error: {e}")
-            return []
+            return ElectrodeDataBatch.empty()
 
     def _build_init_command(self) -> bytes:
         """Construit la commande d'initialisation MEA2100"""
         # Protocole MEA2100 simplifié (en réalité plus complexe)
-        config = struct.pack('<4sHHHH', 
+        config = _INIT_STRUCT.pack(
                            b'INIT',                    # Header
                            self.num_electrodes,        # Nombre d'électrodes
                            int(self.sampling_rate),    # Fréquence d'échantillonnage
@@ -346,7 +1011,7 @@ class MultiChannelSystemsMEA2100(MEADevice):
     def _build_recording_config(self) -> bytes:
         """Configuration pour l'enregistrement"""
         # Configuration d'acquisition MEA2100
-        config = struct.pack('<4sHHfff',
+        config = _CONF_STRUCT.pack(
                            b'CONF',                    # Header de config
                            self.num_electrodes,        # Électrodes actives
                            int(self.sampling_rate),    # Fréquence
@@ -358,24 +1023,16 @@ class MultiChannelSystemsMEA2100(MEADevice):
 
     def _build_stimulation_command(self, pattern: StimulusPattern) -> bytes:
         """Construit une commande de stimulation"""
-        # Protocole de stimulation MEA2100
-        if pattern.waveform_type == "biphasic":
-            waveform_id = 1
-        elif pattern.waveform_type == "monophasic":
-            waveform_id = 2
-        else:
-            waveform_id = 3  # Custom
-        
-        command = struct.pack('<4sHBfffH',
-                            b'STIM',                   # Header
-                            pattern.electrode_id,      # ID électrode
-                            waveform_id,               # Type de waveform
-                            pattern.amplitude,         # Amplitude (μV)
-                            pattern.duration,          # Durée (ms)
-                            pattern.frequency,         # Fréquence (Hz)
-                            pattern.pulse_count        # Nombre de pulses
+        # Protocole de stimulation MEA2100 (custom_waveform n'est pas transmis
+        # dans la commande: le cache reste valable pour les patterns custom)
+        return _pack_stimulation(
+            pattern.electrode_id,
+            _WAVEFORM_IDS.get(pattern.waveform_type, 3),
+            pattern.amplitude,
+            pattern.duration,
+            pattern.frequency,
+            pattern.pulse_count
         )
-        return command
 
     async def _send_command(self, command: bytes) -> bool:
         """Envoie une commande au MEA2100"""
@@ -383,30 +1040,49 @@ class MultiChannelSystemsMEA2100(MEADevice):
             return False
         
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.send, command
+            await asyncio.wait_for(
+                asyncio.get_running_loop().sock_sendall(self.socket, command), self.IO_TIMEOUT
             )
             return True
         except Exception as e:
             logger.error(f"❌ Command send error: {e}")
             return False
 
-    async def _receive_response(self) -> Optional[bytes]:
-        """Reçoit une réponse du MEA2100"""
+    async def _receive_response(self) -> Optional[memoryview]:
+        """
+        Reçoit une réponse du MEA2100 dans le buffer préalloué
+        
+        La vue retournée n'est valide que jusqu'à la réception suivante.
+        """
         if not self.socket:
             return None
         
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.recv, 1024
+            received = await asyncio.wait_for(
+                asyncio.get_running_loop().sock_recv_into(self.socket, self._rx_buf), self.IO_TIMEOUT
             )
-            return response
+            return self._rx_view[:received]
         except Exception as e:
             logger.error(f"❌ Response receive error: {e}")
             return None
 
+    def _response_contains(self, response: Optional[memoryview], token: bytes) -> bool:
+        """Recherche token dans la réponse, directement dans le buffer de réception"""
+        return bool(response) and self._rx_buf.find(token, 0, len(response)) != -1
+
+    @staticmethod
+    def _response_bytes(response: Optional[memoryview]) -> Optional[bytes]:
+        """Copie de la réponse pour les messages de log"""
+        return None if response is None else response.tobytes()
+
     async def _start_background_threads(self):
         """Démarre les threads de gestion en arrière-plan"""
+        # Le thread de stimulation a son propre descripteur, en mode timeout
+        # (envois bloquants côté thread, socket principal laissé à asyncio)
+        self._stim_socket = self.socket.dup()
+        self._stim_socket.settimeout(1.0)
+        self._stop_event.clear()
+        
         # Thread d'acquisition de données
         self.acquisition_thread = threading.Thread(
             target=self._acquisition_loop,
@@ -427,19 +1103,20 @@ class MultiChannelSystemsMEA2100(MEADevice):
 
     async def _stop_background_threads(self):
         """Arrête les threads de gestion"""
-        # Les threads daemon s'arrêtent automatiquement
-        # mais on peut signaler l'arrêt explicitement
-        if self.acquisition_thread and self.acquisition_thread.is_alive():
-            # Signaler l'arrêt via une variable de contrôle si nécessaire
-            pass
-        
-        if self.stimulation_thread and self.stimulation_thread.is_alive():
-            # Vider la queue de stimulation
-            while not self.stimulation_queue.empty():
-                try:
-                    self.stimulation_queue.get_nowait()
-                except Empty:
-                    break
+        # Signaler l'arrêt: les boucles attendent sur _stop_event et sortent
+        # immédiatement (les threads daemon ne s'arrêtent pas seuls tant que
+        # le processus vit)
+        self._stop_event.set()
+        self._stimulation_ready.set()
+        self._recording_event.set()
+        for thread in (self.acquisition_thread, self.stimulation_thread):
+            if thread and thread.is_alive():
+                await asyncio.to_thread(thread.join, 1.0)
+        # _recording_event a servi de réveil: le réaligner sur is_recording
+        self._set_recording(self.is_recording)
+        
+        # Vider la queue de stimulation
+        self.stimulation_queue.clear()
         
         logger.info("🛑 MEA2100 background threads stopped")
 
@@ -452,34 +1129,46 @@ class MultiChannelSystemsMEA2100(MEADevice):
         """
         logger.info("🔄 Starting MEA2100 acquisition loop")
         
-        while self.is_connected:
+        # Charger/compiler le noyau de parsing (Numba) avant le premier
+        # enregistrement, avec les types exacts d'un vrai paquet
+        self._parse_raw_data(self._simulate_mea_data())
+        
+        # Cadence par échéances monotones: la durée de traitement d'un paquet
+        # est absorbée au lieu de s'ajouter à chaque période
+        period = self._sim_samples_per_electrode / self.sampling_rate
+        next_deadline = time.monotonic()
+        
+        while self.is_connected and not self._stop_event.is_set():
             try:
                 if not self.is_recording:
-                    time.sleep(0.1)  # Pause si pas d'enregistrement
+                    # Thread parqué jusqu'à start_recording (ou l'arrêt)
+                    self._recording_event.wait(1.0)
+                    next_deadline = time.monotonic()
                     continue
                 
                 # Simuler la réception de données du MEA2100
                 # En réalité, ceci recevrait les données via socket/série
                 raw_data = self._simulate_mea_data()
                 
-                # Ajouter au buffer (non-bloquant)
-                if not self.data_buffer.full():
-                    self.data_buffer.put(raw_data, timeout=0.001)
-                else:
-                    # Buffer plein, supprimer les anciens échantillons
-                    try:
-                        self.data_buffer.get_nowait()
-                        self.data_buffer.put(raw_data, timeout=0.001)
-                    except Empty:
-                        pass
+                # Parser une seule fois, ici: le buffer contient des lots SoA
+                batch = self._parse_raw_data(raw_data)
+                
+                # Ajouter au buffer (non-bloquant, écrase le plus ancien si plein)
+                self.data_buffer.push(batch)
+                self.electrode_buffers.push(batch)
                 
-                # Fréquence d'acquisition basée sur le sampling rate
-                sleep_time = 1.0 / (self.sampling_rate / 100)  # 100 échantillons par batch
-                time.sleep(sleep_time)
+                # Fréquence d'acquisition basée sur le sampling rate (100 échantillons par batch)
+                next_deadline += period
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                elif delay < -1.0:
+                    # Plus d'une seconde de retard: repartir de maintenant sans rattrapage
+                    next_deadline = time.monotonic()
                 
             except Exception as e:
                 logger.error(f"❌ Acquisition loop error: {e}")
-                time.sleep(1.0)  # Pause en cas d'erreur
+                self._stop_event.wait(1.0)  # Pause en cas d'erreur
 
     def _stimulation_loop(self):
         """
@@ -490,33 +1179,44 @@ class MultiChannelSystemsMEA2100(MEADevice):
         """
         logger.info("⚡ Starting MEA2100 stimulation loop")
         
-        while self.is_connected:
+        while self.is_connected and not self._stop_event.is_set():
             try:
-                # Récupérer la prochaine stimulation à traiter
-                try:
-                    stim_command = self.stimulation_queue.get(timeout=0.5)
-                except Empty:
-                    continue  # Pas de stimulation en attente
+                # Attendre la prochaine stimulation à traiter
+                if not self.stimulation_queue:
+                    self._stimulation_ready.wait(0.5)
+                    self._stimulation_ready.clear()
+                    continue  # Revérifier l'arrêt puis la queue
+                
+                # Tête de queue programmée plus tard: attendre son instant d'envoi
+                now = time.monotonic()
+                delay = self.stimulation_queue[0][1] - now
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                    continue
                 
-                # Envoyer la commande de stimulation au dispositif
-                if self.socket:
+                # Les stimulations arrivent en rafales (une par électrode ciblée):
+                # embarquer celles déjà dues dans le même envoi
+                batch = []
+                while (self.stimulation_queue and len(batch) < self.STIM_BATCH_MAX
+                       and self.stimulation_queue[0][1] <= now):
+                    batch.append(self.stimulation_queue.popleft()[0])
+                
+                # Envoyer les commandes de stimulation au dispositif (un seul syscall)
+                if self._stim_socket:
                     try:
-                        self.socket.send(stim_command)
+                        self._stim_socket.sendall(b''.join(batch))
                         
                         # Attendre une courte confirmation (optionnel)
-                        # response = self.socket.recv(64)
+                        # response = self._stim_socket.recv(64)
                         
-                        logger.debug("⚡ Stimulation command sent")
+                        logger.debug("⚡ %d stimulation command(s) sent", len(batch))
                         
                     except Exception as e:
                         logger.error(f"❌ Stimulation send error: {e}")
                 
-                # Marquer la tâche comme terminée
-                self.stimulation_queue.task_done()
-                
             except Exception as e:
                 logger.error(f"❌ Stimulation loop error: {e}")
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
 
     def _simulate_mea_data(self) -> bytes:
         """
@@ -526,79 +1226,28 @@ class MultiChannelSystemsMEA2100(MEADevice):
         des données réelles du dispositif MEA2100.
         """
         # Générer 100 échantillons pour toutes les électrodes
-        num_samples = 100
+        num_samples = self._sim_samples_per_electrode
         timestamp = time.time()
         
-        # Créer des données simulées avec du bruit et quelques spikes
-        data_packet = struct.pack('<fH', timestamp, num_samples)
-        
-        for electrode_id in range(self.num_electrodes):
-            for sample in range(num_samples):
-                # Bruit de fond gaussien (-20 à +20 μV)
-                baseline_noise = np.random.normal(0, 5.0)
-                
-                # Ajouter occasionnellement des spikes (-100 à -200 μV)
-                if np.random.random() < 0.001:  # 0.1% de chance de spike
-                    spike_amplitude = np.random.uniform(-200, -100)
-                    voltage = baseline_noise + spike_amplitude
-                else:
-                    voltage = baseline_noise
-                
-                # Emballer dans le format MEA2100
-                sample_data = struct.pack('<Hf', electrode_id, voltage)
-                data_packet += sample_data
-        
-        return data_packet
-
-    def _parse_raw_data(self, raw_data: bytes) -> List[ElectrodeData]:
-        """
-        📊 Parse les données brutes du MEA2100 en structures ElectrodeData
-        
-        Convertit les bytes reçus du dispositif en objets Python
-        utilisables pour l'analyse et l'apprentissage Bitcoin.
-        """
-        try:
-            # Dépacker l'header du packet
-            header_size = struct.calcsize('<fH')
-            timestamp, num_samples = struct.unpack('<fH', raw_data[:header_size])
-            
-            # Dépacker les échantillons
-            electrode_data = []
-            data_offset = header_size
-            sample_size = struct.calcsize('<Hf')
-            
-            for i in range(num_samples * self.num_electrodes):
-                if data_offset + sample_size <= len(raw_data):
-                    electrode_id, voltage = struct.unpack('<Hf', 
-                                                        raw_data[data_offset:data_offset + sample_size])
-                    
-                    # Détection automatique de spike (seuil simple)
-                    is_spike = abs(voltage) > 50.0
-                    
-                    # Calculer le niveau de bruit (approximation)
-                    noise_level = abs(voltage) if abs(voltage) < 30 else 5.0
-                    
-                    # Créer l'objet ElectrodeData
-                    electrode_sample = ElectrodeData(
-                        electrode_id=electrode_id,
-                        timestamp=timestamp + (i * (1.0 / self.sampling_rate)),
-                        voltage=voltage,
-                        impedance=1.0,  # Valeur par défaut
-                        noise_level=noise_level,
-                        is_spike=is_spike,
-                        state=ElectrodeState.RECORDING
-                    )
-                    
-                    electrode_data.append(electrode_sample)
-                    data_offset += sample_size
-                else:
-                    break  # Pas assez de données pour ce sample
-            
-            return electrode_data
-            
-        except Exception as e:
-            logger.error(f"❌ Data parsing error: {e}")
-            return []
+        # Bruit de fond gaussien (σ = 5 μV) tiré en un seul bloc;
+        # la colonne 'eid' (électrode par électrode) est précalculée
+        voltages = self._sim_voltages
+        voltages[:] = self._rng.standard_normal(voltages.size) * 5.0
+        
+        # Ajouter occasionnellement des spikes (-100 à -200 μV), 0.1% de chance
+        spikes = self._rng.random(voltages.size) < 0.001
+        voltages[spikes] += self._rng.uniform(-200, -100, np.count_nonzero(spikes))
+        
+        # Quantification ADC 16 bits (pas de 0.1 μV), écrite dans le paquet
+        np.divide(voltages, VOLTAGE_SCALE, out=voltages)
+        np.rint(voltages, out=voltages)
+        np.clip(voltages, -32768, 32767, out=voltages)
+        self._sim_buf['v'] = voltages
+        
+        # Emballer dans le format MEA2100: header écrit en place devant les
+        # échantillons, une seule copie vers le bytes retourné
+        _HEADER_STRUCT.pack_into(self._sim_packet, 0, timestamp, num_samples)
+        return bytes(self._sim_packet)
 
 class RealMEAInterface:
     """
@@ -616,10 +1265,26 @@ class RealMEAInterface:
     - Protocoles d'apprentissage synaptique automatisés
     """
     
+    LEARNING_PHASES_MAX = 1024  # Détails de protocole conservés par session (les plus récents)
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.device_type = config.get('device_type', 'MultiChannelSystems_MEA2100')
         self.electrodes = list(range(config.get('num_electrodes', 60)))
+        self._sampling_rate = int(config.get('sampling_rate', 25000))
+        
+        # Détection de spikes de record_electrode: 'threshold' (seuil fixe du
+        # parsing) ou 'double_threshold' (detect_spikes sur la trace)
+        self.spike_detection = config.get('spike_detection', 'threshold')
+        self.spike_thresholds = (config.get('spike_threshold_low', 3.0),
+                                 config.get('spike_threshold_high', 5.0))
+        self.spike_refractory = max(1, round(config.get('spike_refractory_ms', 2.0)
+                                             * self._sampling_rate / 1000.0))
+        
+        # Fenêtre d'observation post-protocole: se termine au premier spike
+        # (après min_observation_ms) ou au plus tard après observation_timeout_ms
+        self.min_observation = config.get('min_observation_ms', 0.0) / 1000.0
+        self.observation_timeout = config.get('observation_timeout_ms', 5000.0) / 1000.0
         
         # Initialiser le dispositif approprié
         self.device: Optional[MEADevice] = None
@@ -636,12 +1301,30 @@ class RealMEAInterface:
         # Callbacks pour l'apprentissage
         self.spike_callbacks: List[Callable] = []
         self.pattern_callbacks: List[Callable] = []
+        self._spike_event = asyncio.Event()  # Levé par record_electrode à chaque salve détectée
         
         # Statistiques temps réel
         self.total_spikes_detected = 0
         self.total_stimulations_sent = 0
         self.connection_start_time: Optional[float] = None
         
+        # Payload de get_connection_statistics, réutilisé d'un appel à l'autre:
+        # les compteurs sont mis à jour à la source, seuls la durée et les taux
+        # sont recalculés à la lecture
+        self._stats_cache: Dict[str, Any] = {
+            'device_type': self.device_type,
+            'num_electrodes': len(self.electrodes),
+            'is_connected': False,
+            'is_recording': False,
+            'session_duration': 0.0,
+            'total_stimulations_sent': 0,
+            'total_spikes_detected': 0,
+            'stimulation_rate': 0.0,
+            'spike_detection_rate': 0.0,
+            'available_protocols': 0,
+            'current_protocol': None
+        }
+        
         logger.info(f"🧬 MEA Interface initialized for {self.device_type}")
         logger.info(f"💡 {len(self.electrodes)} electrodes available for Bitcoin learning")
 
@@ -808,7 +1491,8 @@ class RealMEAInterface:
             
             if success:
                 self.total_stimulations_sent += 1
-                logger.debug(f"⚡ Electrode {electrode_id} stimulated ({amplitude}μV, {duration}ms)")
+                self._stats_cache['total_stimulations_sent'] = self.total_stimulations_sent
+                logger.debug("⚡ Electrode %d stimulated (%sμV, %sms)", electrode_id, amplitude, duration)
                 return True
             else:
                 logger.error(f"❌ Failed to stimulate electrode {electrode_id}")
@@ -818,49 +1502,58 @@ class RealMEAInterface:
             logger.error(f"❌ Electrode stimulation error: {e}")
             return False
 
-    async def record_electrode(self, electrode_id: int, duration: float = 100.0) -> Optional[List[Dict]]:
+    async def record_electrode(self, electrode_id: int, duration: float = 100.0) -> Optional[np.ndarray]:
         """
         📊 Enregistrer l'activité d'une électrode spécifique
         
         Utilisé par biological_bitcoin_learning.py pour capturer les
-        réponses neuronales aux stimulations Bitcoin.
+        réponses neuronales aux stimulations Bitcoin. Retourne un tableau
+        structuré RECORDING_DTYPE (champs timestamp, voltage, is_spike,
+        noise_level, electrode_id), .tolist() pour des tuples Python.
         """
         if not self.is_recording:
             logger.warning("⚠️ Cannot record: recording not active")
             return None
         
         try:
-            # Calculer le nombre d'échantillons nécessaires
-            sampling_rate = self.config.get('sampling_rate', 25000)
-            num_samples = int((duration / 1000.0) * sampling_rate)  # duration en ms
-            
-            # Récupérer les données récentes
-            all_data = await self.device.get_latest_data(num_samples * len(self.electrodes))
+            # Calculer le nombre d'échantillons nécessaires (duration en ms)
+            num_samples = int(duration * self._sampling_rate / 1000.0)
             
-            # Filtrer pour l'électrode spécifique
-            electrode_data = [
-                {
-                    'timestamp': data.timestamp,
-                    'voltage': data.voltage,
-                    'is_spike': data.is_spike,
-                    'noise_level': data.noise_level
-                }
-                for data in all_data
-                if data.electrode_id == electrode_id
-            ]
+            # Récupérer les données récentes de cette électrode (ring dédié)
+            selected = await self.device.get_latest_data_for(electrode_id, num_samples)
+            if self.spike_detection == 'double_threshold':
+                selected.is_spike = detect_spikes(selected.voltage, *self.spike_thresholds,
+                                                  self.spike_refractory)
             
             # Compter les spikes détectés
-            spikes_in_recording = sum(1 for d in electrode_data if d['is_spike'])
+            spikes_in_recording = int(np.count_nonzero(selected.is_spike))
             if spikes_in_recording > 0:
                 self.total_spikes_detected += spikes_in_recording
-                logger.debug(f"📈 Electrode {electrode_id}: {spikes_in_recording} spikes in {duration}ms")
+                self._stats_cache['total_spikes_detected'] = self.total_spikes_detected
+                self._spike_event.set()
+                if self.spike_callbacks:
+                    self._dispatch_spikes(selected)
+                logger.debug("📈 Electrode %d: %d spikes in %sms", electrode_id, spikes_in_recording, duration)
             
-            return electrode_data[-num_samples:] if electrode_data else []
+            return selected.to_structured()
             
         except Exception as e:
             logger.error(f"❌ Electrode recording error: {e}")
             return None
 
+    def _dispatch_spikes(self, recording: ElectrodeDataBatch):
+        """Remet les spikes de l'enregistrement à chaque callback, en un seul tableau"""
+        index = np.flatnonzero(recording.is_spike)
+        spikes = np.empty(len(index), dtype=SPIKE_DTYPE)
+        spikes['electrode_id'] = recording.electrode_id[index]
+        spikes['timestamp'] = recording.timestamp[index]
+        spikes['amplitude'] = recording.voltage[index]
+        for callback in self.spike_callbacks:
+            try:
+                callback(spikes)
+            except Exception as e:
+                logger.error(f"❌ Spike callback error: {e}")
+
     async def apply_bitcoin_stimulation_protocol(self, protocol: BitcoinStimulationProtocol) -> bool:
         """
         🧬₿ Appliquer un protocole de stimulation Bitcoin complet
@@ -873,28 +1566,21 @@ class RealMEAInterface:
             return False
         
         try:
-            logger.info(f"🧬₿ Applying Bitcoin stimulation protocol ({len(protocol.stimulation_sequence)} steps)")
+            sequence = protocol.as_soa()
+            logger.info(f"🧬₿ Applying Bitcoin stimulation protocol ({len(sequence)} steps)")
             
             self.current_protocol = protocol
-            success_count = 0
             
-            # Exécuter chaque étape du protocole
-            for i, stim_pattern in enumerate(protocol.stimulation_sequence):
-                logger.debug(f"⚡ Protocol step {i+1}/{len(protocol.stimulation_sequence)}")
-                
-                # Appliquer la stimulation
-                success = await self.device.stimulate_electrode(stim_pattern)
-                
-                if success:
-                    success_count += 1
-                    self.total_stimulations_sent += 1
-                else:
-                    logger.warning(f"⚠️ Protocol step {i+1} failed")
-                
-                # Pause entre les stimulations pour permettre la récupération neuronale
-                await asyncio.sleep(stim_pattern.inter_pulse_interval / 1000.0)
+            # Séquence entière soumise au dispositif, qui respecte les pauses de
+            # récupération neuronale (inter_pulse_interval) entre les étapes
+            success = await self.device.stimulate_batch(sequence)
+            success_count = int(np.count_nonzero(success))
+            self.total_stimulations_sent += success_count
+            self._stats_cache['total_stimulations_sent'] = self.total_stimulations_sent
+            for i in np.flatnonzero(~success):
+                logger.warning(f"⚠️ Protocol step {i+1} failed")
             
-            protocol_success_rate = success_count / len(protocol.stimulation_sequence)
+            protocol_success_rate = success_count / len(sequence)
             
             if protocol_success_rate > 0.8:  # 80% de réussite minimum
                 logger.info(f"✅ Bitcoin protocol completed successfully ({protocol_success_rate:.1%} success rate)")
@@ -916,93 +1602,83 @@ class RealMEAInterface:
         """
         logger.info("🚀 Initializing Bitcoin learning protocols...")
         
+        # Une colonne par paramètre, calculée sur l'index d'étape i (20 étapes)
+        i = np.arange(20)
+        
         # Protocole 1: Reconnaissance de patterns de base
-        basic_pattern_protocol = BitcoinStimulationProtocol(
+        self.bitcoin_protocols.append(BitcoinStimulationProtocol(
             block_pattern=b"basic_bitcoin_pattern_00000000",
             target_electrodes=list(range(0, 20)),  # Première zone du MEA
-            learning_phase="pattern_recognition"
-        )
-        
-        # Créer les stimulations pour ce protocole
-        for i, electrode_id in enumerate(basic_pattern_protocol.target_electrodes):
-            amplitude = 15.0 + (i % 3) * 5.0  # Amplitudes variées
-            duration = 0.1 + (i % 2) * 0.05   # Durées variées
-            
-            stim = StimulusPattern(
-                electrode_id=electrode_id,
-                waveform_type="biphasic",
-                amplitude=amplitude,
-                duration=duration,
-                frequency=50.0 + (i % 4) * 25.0,  # Fréquences 50-150 Hz
-                pulse_count=1,
-                inter_pulse_interval=2.0  # 2ms entre stimulations
+            learning_phase="pattern_recognition",
+            soa=ProtocolSoA(
+                electrode_ids=(i + 0).astype(np.uint16),
+                waveform_ids=np.full(20, _WAVEFORM_IDS["biphasic"], dtype=np.uint8),
+                amplitudes=(15.0 + (i % 3) * 5.0).astype(np.float32),    # Amplitudes variées
+                durations=(0.1 + (i % 2) * 0.05).astype(np.float32),     # Durées variées
+                frequencies=(50.0 + (i % 4) * 25.0).astype(np.float32),  # Fréquences 50-150 Hz
+                pulse_counts=np.ones(20, dtype=np.uint16),
+                intervals=np.full(20, 2.0)                               # 2ms entre stimulations
             )
-            basic_pattern_protocol.stimulation_sequence.append(stim)
+        ))
         
-        self.bitcoin_protocols.append(basic_pattern_protocol)
-        
-        # Protocole 2: Apprentissage de nonce
-        nonce_learning_protocol = BitcoinStimulationProtocol(
+        # Protocole 2: Apprentissage de nonce (trains plus complexes)
+        self.bitcoin_protocols.append(BitcoinStimulationProtocol(
             block_pattern=b"nonce_prediction_training_pattern",
             target_electrodes=list(range(20, 40)),  # Deuxième zone du MEA
             learning_phase="nonce_prediction",
-            reward_signal_amplitude=75.0  # Amplitude plus élevée pour récompense
-        )
-        
-        # Stimulations pour apprentissage de nonce (plus complexes)
-        for i, electrode_id in enumerate(nonce_learning_protocol.target_electrodes):
-            # Pattern de stimulation complexe pour nonce
-            stim = StimulusPattern(
-                electrode_id=electrode_id,
-                waveform_type="biphasic",
-                amplitude=20.0 + (i % 5) * 7.0,   # Amplitudes 20-48 μV
-                duration=0.15 + (i % 3) * 0.05,   # Durées 0.15-0.25 ms
-                frequency=100.0 + (i % 6) * 20.0, # Fréquences 100-200 Hz
-                pulse_count=2 + (i % 3),          # 2-4 pulses par train
-                inter_pulse_interval=1.5          # 1.5ms entre stimulations
+            reward_signal_amplitude=75.0,  # Amplitude plus élevée pour récompense
+            soa=ProtocolSoA(
+                electrode_ids=(i + 20).astype(np.uint16),
+                waveform_ids=np.full(20, _WAVEFORM_IDS["biphasic"], dtype=np.uint8),
+                amplitudes=(20.0 + (i % 5) * 7.0).astype(np.float32),     # Amplitudes 20-48 μV
+                durations=(0.15 + (i % 3) * 0.05).astype(np.float32),    # Durées 0.15-0.25 ms
+                frequencies=(100.0 + (i % 6) * 20.0).astype(np.float32), # Fréquences 100-200 Hz
+                pulse_counts=(2 + (i % 3)).astype(np.uint16),             # 2-4 pulses par train
+                intervals=np.full(20, 1.5)                               # 1.5ms entre stimulations
             )
-            nonce_learning_protocol.stimulation_sequence.append(stim)
+        ))
         
-        self.bitcoin_protocols.append(nonce_learning_protocol)
-        
-        # Protocole 3: Optimisation avancée
-        optimization_protocol = BitcoinStimulationProtocol(
+        # Protocole 3: Optimisation avancée (waveforms personnalisées)
+        self.bitcoin_protocols.append(BitcoinStimulationProtocol(
             block_pattern=b"advanced_mining_optimization_protocol",
             target_electrodes=list(range(40, 60)),  # Troisième zone du MEA
             learning_phase="optimization",
-            reward_signal_amplitude=100.0  # Récompense maximale
-        )
-        
-        # Stimulations d'optimisation (patterns très spécifiques)
-        for i, electrode_id in enumerate(optimization_protocol.target_electrodes):
-            stim = StimulusPattern(
-                electrode_id=electrode_id,
-                waveform_type="custom",  # Waveforms personnalisées
-                amplitude=30.0 + (i % 4) * 10.0,  # Amplitudes 30-60 μV
-                duration=0.2 + (i % 4) * 0.1,     # Durées 0.2-0.5 ms
-                frequency=150.0 + (i % 5) * 30.0, # Fréquences 150-270 Hz
-                pulse_count=3 + (i % 2),          # 3-4 pulses
-                inter_pulse_interval=1.0          # 1ms entre stimulations
+            reward_signal_amplitude=100.0,  # Récompense maximale
+            soa=ProtocolSoA(
+                electrode_ids=(i + 40).astype(np.uint16),
+                waveform_ids=np.full(20, 3, dtype=np.uint8),              # custom
+                amplitudes=(30.0 + (i % 4) * 10.0).astype(np.float32),    # Amplitudes 30-60 μV
+                durations=(0.2 + (i % 4) * 0.1).astype(np.float32),      # Durées 0.2-0.5 ms
+                frequencies=(150.0 + (i % 5) * 30.0).astype(np.float32), # Fréquences 150-270 Hz
+                pulse_counts=(3 + (i % 2)).astype(np.uint16),             # 3-4 pulses
+                intervals=np.full(20, 1.0)                               # 1ms entre stimulations
             )
-            optimization_protocol.stimulation_sequence.append(stim)
-        
-        self.bitcoin_protocols.append(optimization_protocol)
+        ))
         
         logger.info(f"✅ Initialized {len(self.bitcoin_protocols)} Bitcoin learning protocols")
         for i, protocol in enumerate(self.bitcoin_protocols):
-            logger.info(f"   Protocol {i+1}: {protocol.learning_phase} "
-                       f"({len(protocol.stimulation_sequence)} stimulations, "
-                       f"{len(protocol.target_electrodes)} electrodes)")
+            logger.info("   Protocol %d: %s", i + 1, protocol.banner)
 
-    def add_spike_callback(self, callback: Callable[[int, float, float], None]):
+    def add_spike_callback(self, callback: Callable, batched: bool = False):
         """
         📞 Ajouter un callback pour la détection de spikes
         
-        Le callback sera appelé à chaque détection de spike avec:
-        - electrode_id: ID de l'électrode  
-        - timestamp: Moment du spike
-        - amplitude: Amplitude du spike
+        batched=True: le callback reçoit une fois par enregistrement un
+        tableau SPIKE_DTYPE (electrode_id, timestamp, amplitude) de tous les
+        spikes détectés.
+        
+        batched=False (déprécié): ancien contrat, un appel par spike avec
+        (electrode_id, timestamp, amplitude).
         """
+        if not batched:
+            warnings.warn("per-spike callbacks are deprecated, use add_spike_callback(callback, batched=True)",
+                          DeprecationWarning, stacklevel=2)
+            per_spike = callback
+            
+            def callback(spikes: np.ndarray):
+                for electrode_id, timestamp, amplitude in spikes.tolist():
+                    per_spike(electrode_id, timestamp, amplitude)
+        
         self.spike_callbacks.append(callback)
         logger.info(f"📞 Spike callback added (total: {len(self.spike_callbacks)})")
 
@@ -1018,25 +1694,77 @@ class RealMEAInterface:
         logger.info(f"📞 Pattern callback added (total: {len(self.pattern_callbacks)})")
 
     def get_connection_statistics(self) -> Dict[str, Any]:
-        """📊 Obtenir les statistiques de connexion et d'activité"""
+        """
+        📊 Obtenir les statistiques de connexion et d'activité
+        
+        Le dictionnaire retourné est partagé et mis à jour en place à chaque
+        appel: le copier pour conserver un instantané.
+        """
         if not self.connection_start_time:
             return {}
         
+        stats = self._stats_cache
         session_duration = time.time() - self.connection_start_time
-        
-        return {
-            'device_type': self.device_type,
-            'num_electrodes': len(self.electrodes),
-            'is_connected': self.is_connected,
-            'is_recording': self.is_recording,
-            'session_duration': session_duration,
-            'total_stimulations_sent': self.total_stimulations_sent,
-            'total_spikes_detected': self.total_spikes_detected,
-            'stimulation_rate': self.total_stimulations_sent / max(1, session_duration),
-            'spike_detection_rate': self.total_spikes_detected / max(1, session_duration),
-            'available_protocols': len(self.bitcoin_protocols),
-            'current_protocol': self.current_protocol.learning_phase if self.current_protocol else None
-        }
+        rate_base = max(1, session_duration)
+        
+        stats['is_connected'] = self.is_connected
+        stats['is_recording'] = self.is_recording
+        stats['session_duration'] = session_duration
+        stats['stimulation_rate'] = stats['total_stimulations_sent'] / rate_base
+        stats['spike_detection_rate'] = stats['total_spikes_detected'] / rate_base
+        stats['available_protocols'] = len(self.bitcoin_protocols)
+        stats['current_protocol'] = self.current_protocol.learning_phase if self.current_protocol else None
+        return stats
+
+    async def _observe_responses(self):
+        """Attend un spike (après min_observation) ou observation_timeout, au premier des deux"""
+        if self.min_observation > 0:
+            await asyncio.sleep(self.min_observation)
+        remaining = self.observation_timeout - self.min_observation
+        if remaining <= 0 or self._spike_event.is_set():
+            return
+        try:
+            await asyncio.wait_for(self._spike_event.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _protocol_cycle(self, session_stats: Dict[str, Any]):
+        """Applique les protocoles Bitcoin en boucle (jusqu'à annulation par l'appelant)"""
+        # Une seule boucle (vide sans protocole); l'échéance est portée par le
+        # wait_for de l'appelant
+        for protocol in cycle(self.bitcoin_protocols):
+            logger.info(f"🎓 Applying {protocol.learning_phase} protocol...")
+            
+            # Enregistrer les stats pré-protocol
+            pre_spikes = self.total_spikes_detected
+            pre_stimulations = self.total_stimulations_sent
+            
+            # Appliquer le protocole
+            self._spike_event.clear()
+            success = await self.apply_bitcoin_stimulation_protocol(protocol)
+            
+            # Observation des réponses: jusqu'au premier spike induit
+            await self._observe_responses()
+            
+            # Calculer les statistiques du protocole
+            post_spikes = self.total_spikes_detected
+            post_stimulations = self.total_stimulations_sent
+            
+            protocol_stats = {
+                'phase': protocol.learning_phase,
+                'success': success,
+                'stimulations_sent': post_stimulations - pre_stimulations,
+                'spikes_induced': post_spikes - pre_spikes,
+                'electrode_count': len(protocol.target_electrodes)
+            }
+            
+            session_stats['protocols_applied'] += 1
+            session_stats['learning_phases'].append(protocol_stats)
+            session_stats['successes'] += int(success)
+            
+            logger.info(f"📊 Protocol results: "
+                      f"{protocol_stats['stimulations_sent']} stims, "
+                      f"{protocol_stats['spikes_induced']} spikes")
 
     async def run_bitcoin_learning_session(self, session_duration: float = 300.0) -> Dict[str, Any]:
         """
@@ -1057,14 +1785,15 @@ class RealMEAInterface:
         
         logger.info(f"🧬₿ Starting Bitcoin learning session ({session_duration}s)")
         
+        session_start_ns = time.monotonic_ns()
         session_stats = {
             'start_time': time.time(),
             'duration': session_duration,
             'protocols_applied': 0,
             'total_stimulations': 0,
             'spikes_detected': 0,
-            'learning_phases': [],
-            'success_rates': []
+            'learning_phases': deque(maxlen=self.LEARNING_PHASES_MAX),
+            'successes': 0  # le détail par protocole reste dans learning_phases
         }
         
         try:
@@ -1074,49 +1803,12 @@ class RealMEAInterface:
                 await self.start_recording()
                 recording_started_here = True
             
-            start_time = time.time()
-            
-            # Cycle à travers tous les protocoles disponibles
-            while (time.time() - start_time) < session_duration:
-                for protocol in self.bitcoin_protocols:
-                    # Vérifier le temps restant
-                    if (time.time() - start_time) >= session_duration:
-                        break
-                    
-                    logger.info(f"🎓 Applying {protocol.learning_phase} protocol...")
-                    
-                    # Enregistrer les stats pré-protocol
-                    pre_spikes = self.total_spikes_detected
-                    pre_stimulations = self.total_stimulations_sent
-                    
-                    # Appliquer le protocole
-                    success = await self.apply_bitcoin_stimulation_protocol(protocol)
-                    
-                    # Pause post-protocole pour observation des réponses
-                    await asyncio.sleep(5.0)
-                    
-                    # Calculer les statistiques du protocole
-                    post_spikes = self.total_spikes_detected
-                    post_stimulations = self.total_stimulations_sent
-                    
-                    protocol_stats = {
-                        'phase': protocol.learning_phase,
-                        'success': success,
-                        'stimulations_sent': post_stimulations - pre_stimulations,
-                        'spikes_induced': post_spikes - pre_spikes,
-                        'electrode_count': len(protocol.target_electrodes)
-                    }
-                    
-                    session_stats['protocols_applied'] += 1
-                    session_stats['learning_phases'].append(protocol_stats)
-                    session_stats['success_rates'].append(1.0 if success else 0.0)
-                    
-                    logger.info(f"📊 Protocol results: "
-                              f"{protocol_stats['stimulations_sent']} stims, "
-                              f"{protocol_stats['spikes_induced']} spikes")
-                    
-                    # Pause inter-protocole
-                    await asyncio.sleep(2.0)
+            # Cycle à travers tous les protocoles disponibles, annulé à l'échéance
+            # par la boucle asyncio (un seul timer au lieu d'un test par protocole)
+            try:
+                await asyncio.wait_for(self._protocol_cycle(session_stats), timeout=session_duration)
+            except asyncio.TimeoutError:
+                pass
             
             # Arrêter l'enregistrement si on l'a démarré
             if recording_started_here:
@@ -1124,10 +1816,12 @@ class RealMEAInterface:
             
             # Finaliser les statistiques
             session_stats['end_time'] = time.time()
-            session_stats['actual_duration'] = session_stats['end_time'] - session_stats['start_time']
+            session_stats['learning_phases'] = list(session_stats['learning_phases'])
+            session_stats['actual_duration'] = (time.monotonic_ns() - session_start_ns) / 1e9
             session_stats['total_stimulations'] = self.total_stimulations_sent
             session_stats['spikes_detected'] = self.total_spikes_detected
-            session_stats['average_success_rate'] = np.mean(session_stats['success_rates']) if session_stats['success_rates'] else 0.0
+            session_stats['average_success_rate'] = (session_stats['successes']
+                                                     / max(1, session_stats['protocols_applied']))
             
             logger.info("🎉 Bitcoin learning session completed!")
             logger.info(f"📊 Session summary:")
@@ -1141,6 +1835,7 @@ class RealMEAInterface:
             
         except Exception as e:
             logger.error(f"❌ Bitcoin learning session error: {e}")
+            session_stats['learning_phases'] = list(session_stats['learning_phases'])
             session_stats['error'] = str(e)
             return session_stats
 
@@ -1170,6 +1865,9 @@ def create_mea_interface(device_type: str = "MultiChannelSystems_MEA2100") -> Re
         'filter_low_cut': 300.0,     # Filtre passe-haut 300 Hz
         'filter_high_cut': 8000.0,   # Filtre passe-bas 8 kHz
         'threshold_detection': True,
+        'spike_detection': 'threshold',  # ou 'double_threshold' (detect_spikes)
+        'min_observation_ms': 0.0,       # 7000 pour les pauses fixes historiques (5 s + 2 s)
+        'observation_timeout_ms': 5000.0,
         'buffer_size': 10000         # Buffer large pour analyse temps réel
     }
     
@@ -1212,19 +1910,28 @@ async def test_mea_bitcoin_integration():
         # Tester la stimulation Bitcoin
         logger.info("⚡ Testing Bitcoin stimulation protocols...")
         
-        # Exécuter une session d'apprentissage courte
-        session_results = await mea.run_bitcoin_learning_session(session_duration=30.0)
+        # Tester l'enregistrement d'électrode individuelle pendant la session,
+        # quand les réponses aux stimulations sont attendues
+        async def record_during_session():
+            await asyncio.sleep(1.0)
+            logger.info("📊 Testing individual electrode recording...")
+            return await mea.record_electrode(electrode_id=0, duration=100.0)
+        
+        # Session courte et enregistrement en parallèle; connect/start/stop/
+        # disconnect restent en série (socket de contrôle et buffer de réponse
+        # partagés)
+        async with asyncio.TaskGroup() as tg:
+            session_task = tg.create_task(mea.run_bitcoin_learning_session(session_duration=30.0))
+            electrode_task = tg.create_task(record_during_session())
+        session_results = session_task.result()
+        electrode_data = electrode_task.result()
         
         if session_results and session_results.get('protocols_applied', 0) > 0:
             logger.info("✅ Bitcoin learning protocols working")
         else:
             logger.warning("⚠️ Bitcoin learning protocols may have issues")
         
-        # Tester l'enregistrement d'électrode individuelle
-        logger.info("📊 Testing individual electrode recording...")
-        electrode_data = await mea.record_electrode(electrode_id=0, duration=100.0)
-        
-        if electrode_data and len(electrode_data) > 0:
+        if electrode_data is not None and len(electrode_data) > 0:
             logger.info(f"✅ Electrode recording working ({len(electrode_data)} samples)")
         else:
             logger.warning("⚠️ Electrode recording may have issues")
@@ -1261,5 +1968,11 @@ if __name__ == "__main__":
     print("biological Bitcoin neural network training!")
     print("")
     
-    # Lancer le test d'intégration
-    asyncio.run(test_mea_bitcoin_integration())
\ No newline at end of file
+    # Lancer le test d'intégration (boucle uvloop si installée)
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(test_mea_bitcoin_integration())
\ No newline at end of file
@@ -680,7 +680,7 @@ double HybridBitcoinMiner::getBiologicalAccuracy() const
     return m_metrics.biologicalAccuracy.load();
 }
 
-HybridMiningMetrics HybridBitcoinMiner::getMetrics() const
+const HybridMiningMetrics& HybridBitcoinMiner::getMetrics() const
 {
     return m_metrics;
 }
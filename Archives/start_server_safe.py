@@ -4,7 +4,9 @@ Safe server startup wrapper for BioMining Platform
 Handles C++ binding errors gracefully
 """
 
+import importlib.util
 import os
+import subprocess
 import sys
 
 # Set environment for fallback mode if C++ fails
@@ -17,14 +19,42 @@ os.environ.setdefault('PYTHONUNBUFFERED', '1')
 print("🚀 BioMining Platform - Safe Startup Wrapper")
 print("=" * 60)
 
-# Test 1: Try importing the server module
+# Test 1: Probe the C++ bindings in isolation before importing the server
+print("\n🔍 Probing C++ bindings...")
+sys.path.insert(0, '/app')
+spec = importlib.util.find_spec('biomining_cpp')
+if spec is None:
+    print("⚠️  C++ bindings not installed - server will use Python fallback")
+else:
+    # Same steps as server.py, in a child interpreter: a pybind11 failure
+    # (exception or crash) cannot take this process down with it
+    probe = subprocess.run(
+        [sys.executable, '-c',
+         "import sys; sys.path.insert(0, '/app'); "
+         "import biomining_cpp; biomining_cpp.install_qt_logger()"],
+        capture_output=True, text=True
+    )
+    if probe.returncode == 0:
+        print(f"✅ C++ bindings load cleanly ({spec.origin})")
+    else:
+        error = (probe.stderr.strip().splitlines() or [f"exit code {probe.returncode}"])[-1]
+        print(f"❌ C++ bindings failed to load: {error}")
+        if 'pybind11' in error or 'get_value_and_holder' in error:
+            print("\n🔧 Detected pybind11 binding error")
+        print("   → Forcing Python fallback mode")
+        
+        # Force disable C++ bindings: None in sys.modules makes
+        # `import biomining_cpp` raise ImportError (server.py's fallback path)
+        os.environ['CPP_BINDINGS_DISABLED'] = '1'
+        sys.modules['biomining_cpp'] = None
+
+# Test 2: Import the server module (once)
 print("\n📦 Testing server module import...")
 try:
-    sys.path.insert(0, '/app')
     from web.api import server
     print("✅ Server module imported successfully")
     
-    # Test 2: Check if C++ bindings are available
+    # Test 3: Check if C++ bindings are available
     if hasattr(server, 'CPP_BINDINGS_AVAILABLE'):
         if server.CPP_BINDINGS_AVAILABLE:
             print("✅ C++ bindings detected as available")
@@ -35,42 +65,10 @@ try:
 except Exception as e:
     print(f"❌ Error during server module import: {e}")
     print(f"   Error type: {type(e).__name__}")
-    print(f"   Error details: {str(e)}")
-    
-    # Check if it's a pybind11 error
-    if 'pybind11' in str(e) or 'get_value_and_holder' in str(e):
-        print("\n🔧 Detected pybind11 binding error")
-        print("   → Forcing Python fallback mode")
-        
-        # Force disable C++ bindings
-        os.environ['CPP_BINDINGS_DISABLED'] = '1'
-        
-        # Try to patch the module before import
-        print("\n🔄 Attempting to reload with Python fallback...")
-        
-        # Remove the failed import from cache
-        if 'web.api.server' in sys.modules:
-            del sys.modules['web.api.server']
-        if 'biomining_cpp' in sys.modules:
-            del sys.modules['biomining_cpp']
-        
-        # Create a dummy biomining_cpp module that fails import
-        import types
-        dummy_module = types.ModuleType('biomining_cpp')
-        sys.modules['biomining_cpp'] = dummy_module
-        
-        # Try importing again
-        try:
-            from web.api import server
-            print("✅ Server module loaded in Python fallback mode")
-        except Exception as e2:
-            print(f"❌ Failed to load server even in fallback mode: {e2}")
-            sys.exit(1)
-    else:
-        print("❌ Unrecoverable error - cannot start server")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    print("❌ Unrecoverable error - cannot start server")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
 
 # Start the server
 print("\n" + "=" * 60)
@@ -79,10 +77,15 @@ print("=" * 60 + "\n")
 
 import uvicorn
 
+# Explicit event loop choice (uvloop when installed), logged for diagnostics
+loop = "uvloop" if importlib.util.find_spec('uvloop') is not None else "asyncio"
+print(f"🔁 Event loop: {loop}")
+
 uvicorn.run(
     "web.api.server:app",
     host="0.0.0.0",
     port=8080,
+    loop=loop,
     log_level="info",
     access_log=True
 )
@@ -2,13 +2,39 @@
 """
 Test script to verify frontend-backend alignment
 """
-import requests
+import asyncio
+import httpx
 import json
+import mmap
+import os
+import re
 import websocket
 import time
 import threading
 from urllib.parse import urlparse
 
+# Expected forms from HTML
+HTML_FORMS = [
+    "tripleConfigForm",
+    "weightsForm", 
+    "biologicalNetworkForm",
+    "meaConfigForm",
+    "trainingConfigForm",
+    "miningConfigForm"
+]
+GENERIC_FORM_HANDLER = 'form[id$="Form"]'
+FORM_PRESERVATION = "setupFormPreservation"
+
+# Toutes les chaînes recherchées dans app.js, trouvées en un seul passage
+_JS_MARKERS = re.compile("|".join(re.escape(marker) for marker in
+                                  (*HTML_FORMS, GENERIC_FORM_HANDLER, FORM_PRESERVATION)).encode())
+
+async def _fetch_endpoints(base_url, endpoints):
+    """GET concurrents sur un seul client (connexions keep-alive réutilisées)"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=5.0) as client:
+        return await asyncio.gather(*(client.get(endpoint) for endpoint in endpoints),
+                                    return_exceptions=True)
+
 def test_http_endpoints():
     """Test HTTP API endpoints"""
     base_url = "http://localhost:8000"
@@ -23,13 +49,15 @@ def test_http_endpoints():
     
     print("🔍 Testing HTTP endpoints...")
     
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
+    responses = asyncio.run(_fetch_endpoints(base_url, endpoints))
+    for endpoint, response in zip(endpoints, responses):
+        if isinstance(response, httpx.HTTPError):
+            print(f"  ❌ {endpoint} - Connection error: {response}")
+        elif isinstance(response, BaseException):
+            raise response
+        else:
             status = "✅" if response.status_code == 200 else "❌"
             print(f"  {status} {endpoint} - {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"  ❌ {endpoint} - Connection error: {e}")
 
 def test_websocket_connection():
     """Test WebSocket connection"""
@@ -71,30 +99,24 @@ def check_form_alignment():
     """Check form IDs alignment between HTML and JS"""
     print("\n📋 Checking form alignment...")
     
-    # Expected forms from HTML
-    html_forms = [
-        "tripleConfigForm",
-        "weightsForm", 
-        "biologicalNetworkForm",
-        "meaConfigForm",
-        "trainingConfigForm",
-        "miningConfigForm"
-    ]
-    
     # Check if JavaScript handles these forms
     try:
-        with open('/home/user/webapp/web/js/app.js', 'r') as f:
-            js_content = f.read()
+        with open('/home/user/webapp/web/js/app.js', 'rb') as f:
+            found = set()
+            if os.fstat(f.fileno()).st_size:
+                # Fichier mappé (pas de copie en str), un seul scan regex
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    found = {m.group().decode() for m in _JS_MARKERS.finditer(mm)}
         
         print("  📝 HTML Forms vs JavaScript handlers:")
-        for form_id in html_forms:
-            if form_id in js_content or 'form[id$="Form"]' in js_content:
+        for form_id in HTML_FORMS:
+            if form_id in found or GENERIC_FORM_HANDLER in found:
                 print(f"    ✅ {form_id}")
             else:
                 print(f"    ❌ {form_id} - Missing handler")
                 
         # Check for form preservation
-        if "setupFormPreservation" in js_content:
+        if FORM_PRESERVATION in found:
             print("    ✅ Form preservation implemented")
         else:
             print("    ❌ Form preservation missing")
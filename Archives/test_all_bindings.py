@@ -2,246 +2,253 @@
 """
 Comprehensive test script to verify all Python bindings
 - HybridBitcoinMiner
-- RealMEAInterface  
+- RealMEAInterface
 - BiologicalNetwork
 """
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from time import perf_counter_ns
+from timeit import default_timer
+
+import numpy as np
+
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def test_all_bindings():
-    """Test all BioMining Python bindings"""
-    
+
+def _with(obj, **fields):
+    """Affecte les champs par setattr (structs sans constructeur par mots-clés) et renvoie obj"""
+    for name, value in fields.items():
+        setattr(obj, name, value)
+    return obj
+
+
+def _network_config_from_record(NetworkConfig):
+    """Même NetworkConfig depuis un enregistrement NumPy: champs remplis sans FFI, un seul appel C++"""
+    record = np.zeros(1, dtype=NetworkConfig.dtype)
+    record["neuronCount"] = 60
+    record["learningRate"] = 0.01
+    record["maxEpochs"] = 10000
+    config = NetworkConfig(record)
+    if (config.neuronCount, config.maxEpochs) != (60, 10000):
+        raise AssertionError(f"record mal relu: {config.neuronCount}, {config.maxEpochs}")
+    # Même constructeur par mot-clé: ne doit pas tomber sur l'__init__ (**kwargs)
+    by_keyword = NetworkConfig(record=record)
+    if (by_keyword.neuronCount, by_keyword.maxEpochs) != (60, 10000):
+        raise AssertionError(f"record= mal relu: {by_keyword.neuronCount}, {by_keyword.maxEpochs}")
+    return config
+
+
+def _initialize_concurrently(r):
+    """Les trois initialize() en parallèle: ils relâchent le GIL, les appels C++ se recouvrent
+
+    network.initialize() part sur un thread du pool; miner.initialize() et
+    mea.initialize() restent sur le thread appelant car ils créent des QObject
+    (réseau interne, QSerialPort/QTcpSocket) qui doivent appartenir au thread de
+    leurs parents.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        network_ready = pool.submit(r["network"].initialize)
+        miner_ok = r["miner"].initialize()
+        mea_ok = r["mea"].initialize(r["RealMEAConfig"])
+        return miner_ok, mea_ok, network_ready.result()
+
+
+def _binding_cases(biomining_cpp):
+    """Vérifications (nom, fonction) dans l'ordre d'exécution
+
+    Chaque fonction reçoit le dict des résultats déjà obtenus (clé = nom du cas)
+    pour réutiliser les objets construits plus haut (miner, configs, mea, network).
+    Les sous-modules sont résolus une fois ici (AttributeError s'ils manquent),
+    pas à chaque cas.
+    """
+    crypto = biomining_cpp.crypto
+    bio = biomining_cpp.bio
+    NetworkConfig = bio.NetworkConfig
+
+    return [
+        # HybridBitcoinMiner
+        ("miner", lambda r: crypto.HybridBitcoinMiner()),
+        ("MiningConfig", lambda r: crypto.MiningConfig(difficulty=4, threads=2, useGPU=False)),
+        ("BiologicalLearningParams", lambda r: crypto.BiologicalLearningParams(
+            initialLearningRate=0.01,
+            retroLearningRate=0.005,
+            decayRate=0.995,
+            retroIterations=5000,
+        )),
+        ("HybridMiningMetrics", lambda r: crypto.HybridMiningMetrics()),
+        ("HybridMiningMetrics fields", lambda r: attrgetter(
+            "totalHashes", "biologicalPredictions", "traditionalHashes", "energyEfficiency", "adaptationScore",
+        )(r["HybridMiningMetrics"])),
+        ("HybridLearningState", lambda r: crypto.HybridLearningState.InitialLearning),
+        ("MiningMethod", lambda r: crypto.MiningMethod.HybridFusion),
+
+        # RealMEAInterface
+        ("mea", lambda r: bio.RealMEAInterface()),
+        ("RealMEAConfig", lambda r: bio.RealMEAConfig(
+            deviceType=bio.MEADeviceType.Custom_Serial,
+            protocol=bio.CommunicationProtocol.SerialPort,
+            devicePath="/dev/ttyUSB0",
+            networkHost="localhost",
+            networkPort=8080,
+            baudRate=115200,
+            electrodeCount=60,
+            samplingRate=25000.0,
+            spikeWindowMs=2,
+            calibrationFile="calibration.dat",
+        )),
+        ("ElectrodeData", lambda r: _with(bio.ElectrodeData(),
+                                          electrodeId=1, voltage=12.5, isActive=True)),
+        ("SpikeEvent", lambda r: _with(bio.SpikeEvent(), electrodeId=1, amplitude=75.0)),
+        ("BitcoinLearningPattern", lambda r: _with(bio.BitcoinLearningPattern(),
+                                                   targetNonce=12345, difficulty=4)),
+        ("BitcoinLearningConfig", lambda r: bio.BitcoinLearningConfig(
+            learningRate=0.001,
+            maxTrainingEpochs=1000,
+            enableRealtimeLearning=True,
+        )),
+
+        # BiologicalNetwork
+        ("network", lambda r: bio.BiologicalNetwork()),
+        ("NetworkConfig", lambda r: NetworkConfig(
+            neuronCount=60,
+            learningRate=0.01,
+            stimulationThreshold=0.5,
+            adaptationRate=0.1,
+            memoryDepth=1000,
+            useReinforcementLearning=True,
+            inputSize=60,
+            outputSize=32,
+            enablePlasticity=True,
+            enableAdaptation=True,
+            momentum=0.9,
+            decayRate=0.995,
+            adaptiveThreshold=0.1,
+            maxEpochs=10000,
+        )),
+        ("NetworkConfig from NumPy record", lambda r: _network_config_from_record(NetworkConfig)),
+        ("LearningState", lambda r: bio.LearningState.InitialLearning),
+        ("NoncePredicition", lambda r: _with(bio.NoncePredicition(),
+                                             suggestedNonce=98765,
+                                             confidence=0.87,
+                                             expectedEfficiency=1.25,
+                                             reasoning="High pattern confidence")),
+        ("LearningData", lambda r: bio.LearningData(
+            targetNonce=54321,
+            blockHeader="test_header",
+            difficulty=4,
+            wasSuccessful=True,
+            attempts=500,
+            computeTime=1.5,
+        )),
+
+        # Initialisation (concurrente) puis méthodes des trois objets
+        ("initialize() x3", _initialize_concurrently),
+        ("miner.configureBiologicalNetwork()", lambda r: r["miner"].configureBiologicalNetwork(r["BiologicalLearningParams"])),
+        ("miner.setMiningParameters()", lambda r: r["miner"].setMiningParameters(r["MiningConfig"])),
+        ("miner.isMining()", lambda r: r["miner"].isMining()),
+        ("miner.getMetrics()", lambda r: r["miner"].getMetrics().totalHashes),
+        ("mea.getStatus()", lambda r: r["mea"].getStatus()),
+        ("network.setNetworkConfig()", lambda r: r["network"].setNetworkConfig(r["NetworkConfig"])),
+        ("network.getLearningState()", lambda r: r["network"].getLearningState()),
+        ("network.isLearningComplete()", lambda r: r["network"].isLearningComplete()),
+        ("network.getNetworkEfficiency()", lambda r: r["network"].getNetworkEfficiency()),
+        ("network.getNetworkComplexity()", lambda r: r["network"].getNetworkComplexity()),
+    ]
+
+
+def _run_checks(biomining_cpp):
+    """Exécute tous les cas; renvoie (résultats par nom, échecs [(nom, exception)])
+
+    Affiche les échecs et une ligne de résumé chronométrée (pas un print par appel:
+    le temps mesuré reste celui des bindings).
+    """
+    try:
+        cases = _binding_cases(biomining_cpp)
+    except AttributeError as e:
+        print(f"❌ Module/class lookup: FAILED - {e}")
+        return {}, [("modules", e)]
+
+    results = {}
+    failed = []
+    start = default_timer()
+    for name, case in cases:
+        try:
+            results[name] = case(results)
+        except Exception as e:
+            failed.append((name, e))
+    elapsed = default_timer() - start
+
+    for name, error in failed:
+        print(f"❌ {name}: FAILED - {error!r}")
+    passed = len(results)
+    print(f"{'✅' if not failed else '❌'} {passed}/{passed + len(failed)} binding checks passed "
+          f"in {elapsed * 1000:.2f} ms")
+    return results, failed
+
+
+# Getters nullaires appelés en boucle par le code Python (objet des cas, méthode)
+BENCH_GETTERS = [
+    ("network", "getNetworkEfficiency"),
+    ("network", "getLearningState"),
+    ("miner", "isMining"),
+    ("mea", "getStatus"),
+]
+BENCH_CALLS = 100_000
+
+
+def benchmark_nullary_calls(results, calls=BENCH_CALLS):
+    """Coût par appel (ns) des getters de BENCH_GETTERS, pour repérer les régressions
+
+    Chaque boucle est chronométrée pour calls/10, calls/2 et calls appels; la pente
+    de la régression temps = a + b·n donne le coût par appel b (boucle Python
+    comprise), l'ordonnée à l'origine a le coût fixe de la mesure. Un appel Python
+    vide sert de référence pour lire le surcoût propre au binding.
+    """
+    sizes = np.array([calls // 10, calls // 2, calls])
+    targets = [("python no-op", lambda: None)]
+    targets += [(f"{key}.{method}()", getattr(results[key], method)) for key, method in BENCH_GETTERS]
+
+    per_call = {}
+    for label, call in targets:
+        times = []
+        for n in sizes:
+            start = perf_counter_ns()
+            for _ in range(n):
+                call()
+            times.append(perf_counter_ns() - start)
+        slope, intercept = np.polyfit(sizes, times, 1)
+        per_call[label] = slope
+        print(f"⏱️  {label}: {slope:.1f} ns/call (fixed {intercept / 1000:.1f} µs)")
+    return per_call
+
+
+def check_all_bindings():
+    """Importe biomining_cpp et exécute les cas; renvoie (succès, résultats par nom)"""
+
     print("🧪 Testing ALL BioMining Python Bindings")
-    print("=" * 60)
-    
+
     try:
         # Try to import the bindings
         import biomining_cpp
-        print("✅ C++ bindings import: SUCCESS")
-        
-        # Test crypto module access
-        try:
-            crypto_module = biomining_cpp.crypto
-            print("✅ Crypto module access: SUCCESS")
-        except Exception as e:
-            print(f"❌ Crypto module access: FAILED - {e}")
-            return False
-        
-        # Test bio module access  
-        try:
-            bio_module = biomining_cpp.bio
-            print("✅ Bio module access: SUCCESS")
-        except Exception as e:
-            print(f"❌ Bio module access: FAILED - {e}")
-            return False
-        
-        print("\n" + "="*60)
-        print("🔥 TESTING HYBRID BITCOIN MINER")
-        print("="*60)
-        
-        # Test HybridBitcoinMiner
-        try:
-            miner = biomining_cpp.crypto.HybridBitcoinMiner()
-            print("✅ HybridBitcoinMiner class: SUCCESS")
-            
-            # Test MiningConfig
-            config = biomining_cpp.crypto.MiningConfig()
-            config.difficulty = 4
-            config.threads = 2
-            config.useGPU = False
-            print("✅ MiningConfig structure: SUCCESS")
-            
-            # Test BiologicalLearningParams  
-            learning_params = biomining_cpp.crypto.BiologicalLearningParams()
-            learning_params.initialLearningRate = 0.01
-            learning_params.retroLearningRate = 0.005
-            learning_params.decayRate = 0.995
-            learning_params.retroIterations = 5000
-            print("✅ BiologicalLearningParams structure: SUCCESS")
-            
-            # Test HybridMiningMetrics
-            metrics = biomining_cpp.crypto.HybridMiningMetrics()
-            print(f"✅ HybridMiningMetrics structure: SUCCESS")
-            print(f"   - Total hashes: {metrics.totalHashes}")
-            print(f"   - Biological predictions: {metrics.biologicalPredictions}")
-            print(f"   - Traditional hashes: {metrics.traditionalHashes}")
-            print(f"   - Energy efficiency: {metrics.energyEfficiency}")
-            print(f"   - Adaptation score: {metrics.adaptationScore}")
-            
-            # Test enums
-            state = biomining_cpp.crypto.HybridLearningState.InitialLearning
-            method = biomining_cpp.crypto.MiningMethod.HybridFusion
-            print("✅ HybridLearningState and MiningMethod enums: SUCCESS")
-            
-            # Test essential methods
-            success = miner.initialize()
-            print(f"✅ initialize() method: SUCCESS - returned {success}")
-            
-            config_success = miner.configureBiologicalNetwork(learning_params)
-            print(f"✅ configureBiologicalNetwork() method: SUCCESS - returned {config_success}")
-            
-            miner.setMiningParameters(config)
-            print("✅ setMiningParameters() method: SUCCESS")
-            
-            is_mining = miner.isMining()
-            print(f"✅ isMining() method: SUCCESS - returned {is_mining}")
-            
-        except Exception as e:
-            print(f"❌ HybridBitcoinMiner testing: FAILED - {e}")
-            return False
-            
-        print("\n" + "="*60)
-        print("🔬 TESTING REAL MEA INTERFACE") 
-        print("="*60)
-        
-        # Test RealMEAInterface
-        try:
-            mea = biomining_cpp.bio.RealMEAInterface()
-            print("✅ RealMEAInterface class: SUCCESS")
-            
-            # Test RealMEAConfig with new properties
-            mea_config = biomining_cpp.bio.RealMEAConfig()
-            mea_config.deviceType = biomining_cpp.bio.MEADeviceType.Custom_Serial
-            mea_config.protocol = biomining_cpp.bio.CommunicationProtocol.SerialPort
-            mea_config.devicePath = "/dev/ttyUSB0"
-            mea_config.networkHost = "localhost"
-            mea_config.networkPort = 8080
-            mea_config.baudRate = 115200
-            mea_config.electrodeCount = 60
-            mea_config.samplingRate = 25000.0
-            mea_config.spikeWindowMs = 2
-            mea_config.calibrationFile = "calibration.dat"
-            print("✅ RealMEAConfig structure with all properties: SUCCESS")
-            
-            # Test data structures
-            electrode_data = biomining_cpp.bio.ElectrodeData()
-            electrode_data.electrodeId = 1
-            electrode_data.voltage = 12.5
-            electrode_data.isActive = True
-            print("✅ ElectrodeData structure: SUCCESS")
-            
-            spike_event = biomining_cpp.bio.SpikeEvent()
-            spike_event.electrodeId = 1
-            spike_event.amplitude = 75.0
-            print("✅ SpikeEvent structure: SUCCESS")
-            
-            # Test Bitcoin learning structures
-            bitcoin_pattern = biomining_cpp.bio.BitcoinLearningPattern()
-            bitcoin_pattern.targetNonce = 12345
-            bitcoin_pattern.difficulty = 4
-            print("✅ BitcoinLearningPattern structure: SUCCESS")
-            
-            bitcoin_config = biomining_cpp.bio.BitcoinLearningConfig()
-            bitcoin_config.learningRate = 0.001
-            bitcoin_config.maxTrainingEpochs = 1000
-            bitcoin_config.enableRealtimeLearning = True
-            print("✅ BitcoinLearningConfig structure: SUCCESS")
-            
-            # Test essential methods
-            success = mea.initialize(mea_config)
-            print(f"✅ initialize() method: SUCCESS - returned {success}")
-            
-            status = mea.getStatus()
-            print(f"✅ getStatus() method: SUCCESS - returned {status}")
-            
-        except Exception as e:
-            print(f"❌ RealMEAInterface testing: FAILED - {e}")
-            return False
-        
-        print("\n" + "="*60)
-        print("🧠 TESTING BIOLOGICAL NETWORK")
-        print("="*60)
-        
-        # Test BiologicalNetwork
-        try:
-            network = biomining_cpp.bio.BiologicalNetwork()
-            print("✅ BiologicalNetwork class: SUCCESS")
-            
-            # Test NetworkConfig with all properties
-            net_config = biomining_cpp.bio.NetworkConfig()
-            net_config.neuronCount = 60
-            net_config.learningRate = 0.01
-            net_config.stimulationThreshold = 0.5
-            net_config.adaptationRate = 0.1
-            net_config.memoryDepth = 1000
-            net_config.useReinforcementLearning = True
-            net_config.inputSize = 60
-            net_config.outputSize = 32
-            net_config.enablePlasticity = True
-            net_config.enableAdaptation = True
-            net_config.momentum = 0.9
-            net_config.decayRate = 0.995
-            net_config.adaptiveThreshold = 0.1
-            net_config.maxEpochs = 10000
-            print("✅ NetworkConfig structure with all properties: SUCCESS")
-            
-            # Test LearningState enum
-            state = biomining_cpp.bio.LearningState.InitialLearning
-            print(f"✅ LearningState enum: SUCCESS - {state}")
-            
-            # Test NoncePredicition structure
-            prediction = biomining_cpp.bio.NoncePredicition()
-            prediction.suggestedNonce = 98765
-            prediction.confidence = 0.87
-            prediction.expectedEfficiency = 1.25
-            prediction.reasoning = "High pattern confidence"
-            print("✅ NoncePredicition structure: SUCCESS")
-            
-            # Test LearningData structure
-            learning_data = biomining_cpp.bio.LearningData()
-            learning_data.targetNonce = 54321
-            learning_data.blockHeader = "test_header"
-            learning_data.difficulty = 4
-            learning_data.wasSuccessful = True
-            learning_data.attempts = 500
-            learning_data.computeTime = 1.5
-            print("✅ LearningData structure: SUCCESS")
-            
-            # Test essential methods
-            success = network.initialize()
-            print(f"✅ initialize() method: SUCCESS - returned {success}")
-            
-            config_success = network.setNetworkConfig(net_config)
-            print(f"✅ setNetworkConfig() method: SUCCESS - returned {config_success}")
-            
-            learning_state = network.getLearningState()
-            print(f"✅ getLearningState() method: SUCCESS - returned {learning_state}")
-            
-            is_complete = network.isLearningComplete()
-            print(f"✅ isLearningComplete() method: SUCCESS - returned {is_complete}")
-            
-            efficiency = network.getNetworkEfficiency()
-            print(f"✅ getNetworkEfficiency() method: SUCCESS - returned {efficiency}")
-            
-            complexity = network.getNetworkComplexity()
-            print(f"✅ getNetworkComplexity() method: SUCCESS - returned {complexity}")
-            
-        except Exception as e:
-            print(f"❌ BiologicalNetwork testing: FAILED - {e}")
-            return False
-            
-        print("\n" + "🎉"*20)
-        print("🚀 ALL BINDING TESTS PASSED! 🚀")
-        print("🎉"*20)
-        print("\n📋 SUMMARY:")
-        print("✅ HybridBitcoinMiner - Complete integration")
-        print("✅ RealMEAInterface - Complete with all config properties") 
-        print("✅ BiologicalNetwork - Complete with all methods and structures")
-        print("✅ All enums and data structures working")
-        print("✅ All essential methods accessible")
-        print("\n🔥 BioMining C++ Python bindings are fully functional!")
-        return True
-        
     except ImportError as e:
         print(f"❌ C++ bindings import: FAILED - {e}")
         print("💡 This is expected if C++ bindings are not compiled yet")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        return False
+        return False, {}
+
+    results, failed = _run_checks(biomining_cpp)
+    return not failed, results
+
+
+def test_all_bindings():
+    """Test all BioMining Python bindings"""
+    return check_all_bindings()[0]
 
 if __name__ == "__main__":
-    success = test_all_bindings()
-    exit(0 if success else 1)
\ No newline at end of file
+    # --no-bench: vérifications seules, sans la mesure des getters
+    success, results = check_all_bindings()
+    if success and "--no-bench" not in sys.argv:
+        benchmark_nullary_calls(results)
+    exit(0 if success else 1)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Vérification du noyau natif _mea_parse contre le décodage NumPy
+
+Les mêmes paquets MEA2100 (trames int16 aléatoires, paquets tronqués au
+milieu d'un échantillon) passent par le parser construit avec le noyau C et
+par celui construit sans (_sample_features), puis par un décodage NumPy de
+référence. Électrodes, tensions, spikes et bruit doivent être identiques;
+les horodatages t0 + i * dt peuvent différer au dernier bit (~1e-14).
+
+Usage:
+    python3 mea_parse_build.py   # sinon le test est ignoré
+    python3 test_mea_parse.py
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import real_mea_interface as mea
+
+NUM_ELECTRODES = 60
+SAMPLING_RATE = 25000.0
+
+
+@contextmanager
+def _without_native_parser():
+    """_make_packet_parser résout le noyau à la construction: le masquer le temps de l'appel"""
+    saved = mea._mea_parse_lib
+    mea._mea_parse_lib = None
+    try:
+        yield
+    finally:
+        mea._mea_parse_lib = saved
+
+
+def _random_packets(rng, count):
+    """Paquets (header + échantillons), dont certains tronqués en cours de trame"""
+    for _ in range(count):
+        num_samples = int(rng.integers(1, 20))
+        samples = np.empty(num_samples * NUM_ELECTRODES, dtype=mea.SAMPLE_DTYPE)
+        samples['eid'] = rng.integers(0, NUM_ELECTRODES, samples.size)
+        samples['v'] = rng.integers(-32768, 32768, samples.size)
+        # Valeurs autour des seuils spike (50 μV) et bruit (30 μV)
+        samples['v'][:8] = [500, -500, 501, -501, 300, -300, 299, -299]
+        payload = samples.tobytes()
+        # Coupe arbitraire: trame incomplète et échantillon partiel (1-3 octets)
+        cut = int(rng.integers(len(payload) // 2, len(payload) + 1))
+        header = mea._HEADER_STRUCT.pack(float(rng.uniform(0, 1000)), num_samples)
+        yield header + payload[:cut]
+
+
+def _reference_decode(raw_data):
+    """Décodage NumPy direct du paquet (échantillons complets seulement)"""
+    timestamp, num_samples = mea._HEADER_STRUCT.unpack_from(raw_data)
+    header_size = mea._HEADER_STRUCT.size
+    count = min(num_samples * NUM_ELECTRODES, (len(raw_data) - header_size) // mea.SAMPLE_DTYPE.itemsize)
+    samples = np.frombuffer(raw_data, dtype=mea.SAMPLE_DTYPE, count=count, offset=header_size)
+    voltage = samples['v'] * mea.VOLTAGE_SCALE
+    abs_voltage = np.abs(voltage)
+    return {
+        "electrode_id": samples['eid'],
+        "timestamp": timestamp + np.arange(count) / SAMPLING_RATE,
+        "voltage": voltage,
+        "is_spike": abs_voltage > 50.0,
+        "noise_level": np.where(abs_voltage < 30.0, abs_voltage, np.float32(5.0)),
+    }
+
+
+def _assert_batch_equal(batch, expected):
+    for field in ("electrode_id", "voltage", "is_spike", "noise_level"):
+        np.testing.assert_array_equal(getattr(batch, field), expected[field], err_msg=field)
+    np.testing.assert_allclose(batch.timestamp, expected["timestamp"], rtol=1e-12, atol=0)
+
+
+def test_native_parser_matches_numpy():
+    if mea._mea_parse_lib is None:
+        pytest.skip("noyau _mea_parse non compilé (python3 mea_parse_build.py)")
+
+    native_parse = mea._make_packet_parser(NUM_ELECTRODES, SAMPLING_RATE)
+    with _without_native_parser():
+        numpy_parse = mea._make_packet_parser(NUM_ELECTRODES, SAMPLING_RATE)
+
+    rng = np.random.default_rng(2017)
+    partial = 0
+    for raw_data in _random_packets(rng, 200):
+        expected = _reference_decode(raw_data)
+        partial += (len(raw_data) - mea._HEADER_STRUCT.size) % mea.SAMPLE_DTYPE.itemsize != 0
+        native, fallback = native_parse(raw_data), numpy_parse(raw_data)
+        assert len(native) == len(fallback) == expected["voltage"].size
+        _assert_batch_equal(native, expected)
+        _assert_batch_equal(fallback, expected)
+    # Les paquets générés couvrent bien les échantillons partiels en fin de paquet
+    assert partial > 0
+    print("✅ _mea_parse: identique au décodage NumPy")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))